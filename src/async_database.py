@@ -0,0 +1,62 @@
+"""
+Async access to jobs.db for code running on the scraper event loop.
+
+Built on SQLAlchemy's asyncio extension with aiosqlite. The queries themselves
+are the sync helpers from database.py, run through AsyncSession.run_sync, so
+both paths share one implementation (and one schema / migration path).
+"""
+import os
+import asyncio
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from . import database
+from .database import Job, apply_sqlite_pragmas, db_path_from_env, init_db
+
+_async_engines = {}
+_async_session_factories = {}
+
+def get_async_engine(db_path: Optional[str] = None):
+    """Process-wide async engine per database file, with the same pragmas as the sync one."""
+    db_path = os.path.abspath(db_path or db_path_from_env())
+    engine = _async_engines.get(db_path)
+    if engine is None:
+        engine = create_async_engine(f'sqlite+aiosqlite:///{db_path}')
+        event.listen(engine.sync_engine, 'connect', apply_sqlite_pragmas)
+        _async_engines[db_path] = engine
+    return engine
+
+async def init_async_db(db_path: Optional[str] = None) -> async_sessionmaker:
+    """Async counterpart of init_db(). Schema creation/migration runs once, off the event loop."""
+    engine = get_async_engine(db_path)
+    factory = _async_session_factories.get(engine.url)
+    if factory is None:
+        await asyncio.to_thread(init_db, db_path)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        _async_session_factories[engine.url] = factory
+    return factory
+
+async def dispose_async_engines():
+    for engine in _async_engines.values():
+        await engine.dispose()
+    _async_engines.clear()
+    _async_session_factories.clear()
+
+async def existing_job_ids(session: AsyncSession, job_ids: Iterable[str]) -> Set[str]:
+    return await session.run_sync(database.existing_job_ids, list(job_ids))
+
+async def insert_jobs(session: AsyncSession, rows: List[dict]) -> Set[str]:
+    return await session.run_sync(database.insert_jobs, rows)
+
+async def enqueue_notifications(session: AsyncSession, rows: List[dict], now: Optional[datetime] = None) -> int:
+    return await session.run_sync(database.enqueue_notifications, rows, now)
+
+async def jobs_with_tag_since(session: AsyncSession, tag: str, since: Optional[datetime] = None,
+                              limit: Optional[int] = None) -> List[Job]:
+    return await session.run_sync(database.jobs_with_tag_since, tag, since, limit)
+
+async def tag_counts(session: AsyncSession, since: Optional[datetime] = None) -> Dict[str, int]:
+    return await session.run_sync(database.tag_counts, since)
@@ -1,16 +1,30 @@
 import asyncio
+from contextlib import asynccontextmanager
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from fake_useragent import UserAgent
 import logging
 
+class PooledContext:
+    """A browser context + page pair that lives in the BrowserManager pool."""
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.uses = 0
+
 class BrowserManager:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, pool_size=4, max_uses=50):
         self.headless = headless
         self.playwright = None
         self.browser = None
         self.ua = UserAgent()
         self.logger = logging.getLogger("BrowserManager")
 
+        # Context pool: each slot is created lazily on first lease and reused
+        # until it has served `max_uses` leases or fails a health check.
+        self.pool_size = pool_size
+        self.max_uses = max_uses
+        self._pool = None
+
     async def init(self):
         """Initialize the Playwright browser instance."""
         if not self.playwright:
@@ -21,31 +35,136 @@ class BrowserManager:
             )
             self.logger.info("Browser initialized.")
 
+        if self._pool is None:
+            # Empty slots are represented by None and filled on demand.
+            # LIFO so warm contexts are handed out before empty slots get filled.
+            self._pool = asyncio.LifoQueue(maxsize=self.pool_size)
+            for _ in range(self.pool_size):
+                self._pool.put_nowait(None)
+
     async def get_new_context(self) -> BrowserContext:
         """Create a new browser context with a random user agent."""
-        if not self.browser:
-            await self.init()
-            
+        if not self.browser or not self.browser.is_connected():
+            await self._restart_browser()
+
         user_agent = self.ua.random
         context = await self.browser.new_context(
             user_agent=user_agent,
             viewport={'width': 1920, 'height': 1080},
             ignore_https_errors=True
         )
-        
+
         # Add init scripts to evade detection
         await context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
         """)
-        
+
         return context
 
+    async def lease_context(self) -> PooledContext:
+        """
+        Take a context/page pair from the pool, creating it if the slot is empty
+        or the previous occupant is no longer healthy.
+        Waits if all `pool_size` slots are currently leased.
+        """
+        if self._pool is None:
+            await self.init()
+
+        slot = await self._pool.get()
+        try:
+            if slot is not None and not self._is_healthy(slot):
+                self.logger.info("Discarding unhealthy pooled context.")
+                await self._close_slot(slot)
+                slot = None
+
+            if slot is None:
+                context = await self.get_new_context()
+                page = await context.new_page()
+                slot = PooledContext(context, page)
+        except Exception:
+            # Never leak the slot, otherwise the pool shrinks permanently
+            self._pool.put_nowait(None)
+            raise
+
+        slot.uses += 1
+        return slot
+
+    async def release_context(self, slot: PooledContext, discard: bool = False):
+        """Return a leased slot. It is recycled once it reaches `max_uses`."""
+        if self._pool is None:
+            # Manager was closed while this slot was out
+            await self._close_slot(slot)
+            return
+
+        if discard or slot.uses >= self.max_uses or not self._is_healthy(slot):
+            await self._close_slot(slot)
+            slot = None
+        else:
+            try:
+                # Drop whatever the last scraper left open so the next lease starts clean
+                await slot.page.goto("about:blank")
+            except Exception:
+                await self._close_slot(slot)
+                slot = None
+
+        self._pool.put_nowait(slot)
+
+    @asynccontextmanager
+    async def lease_page(self):
+        """Async context manager yielding a pooled page: `async with bm.lease_page() as page:`"""
+        slot = await self.lease_context()
+        failed = False
+        try:
+            yield slot.page
+        except Exception:
+            failed = True
+            raise
+        finally:
+            # A page that raised mid-navigation may be in a bad state, start fresh next time
+            await self.release_context(slot, discard=failed)
+
+    def _is_healthy(self, slot: PooledContext) -> bool:
+        if not self.browser or not self.browser.is_connected():
+            return False
+        return not slot.page.is_closed()
+
+    async def _close_slot(self, slot: PooledContext):
+        try:
+            await slot.context.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing pooled context: {e}")
+
+    async def _restart_browser(self):
+        """(Re)launch Chromium, e.g. after a crash left the browser disconnected."""
+        if self.browser:
+            self.logger.warning("Browser disconnected, relaunching.")
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+        if self.playwright:
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=['--disable-blink-features=AutomationControlled']
+            )
+        else:
+            await self.init()
+
     async def close(self):
-        """Close the browser and playwright."""
+        """Close pooled contexts, the browser and playwright."""
+        if self._pool is not None:
+            while not self._pool.empty():
+                slot = self._pool.get_nowait()
+                if slot is not None:
+                    await self._close_slot(slot)
+            self._pool = None
         if self.browser:
             await self.browser.close()
+            self.browser = None
         if self.playwright:
             await self.playwright.stop()
+            self.playwright = None
         self.logger.info("Browser closed.")
@@ -0,0 +1,100 @@
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional
+
+# Joins titles for a batch pass. Not whitespace and not a word char, so it is
+# a word boundary that multi-word terms can't match across.
+SEPARATOR = '\x1f'
+
+def term_pattern(term: str) -> str:
+    """
+    Regex for one taxonomy term, matched on word boundaries.
+    - "supply chain" also matches "supply-chain"
+    - plurals are implied: "vehicle" matches "vehicles"
+    - a trailing * makes a prefix: "defen*" matches "defense" and "defence"
+    """
+    prefix = term.endswith('*')
+    words = re.split(r'[\s-]+', term.rstrip('*').strip().lower())
+    body = r'[ \t-]+'.join(re.escape(word) for word in words)
+    return r'\b' + body + (r'\w*' if prefix else r'(?:e?s)?\b')
+
+class KeywordClassifier:
+    """
+    Multi-label keyword tagger compiled once into a single alternation regex.
+    Every term of every category is one capture group; a match tells us the term
+    and so its categories. A batch of titles is tagged in one regex pass.
+
+    exclusions: category -> terms that veto the category (e.g. automotive vs "device driver").
+    fallback: tag returned when nothing matched (None for no tag).
+    """
+    def __init__(self, categories: Dict[str, List[str]], exclusions: Optional[Dict[str, List[str]]] = None,
+                 fallback: Optional[str] = 'other'):
+        self.categories = list(categories)
+        self.fallback = fallback
+        exclusions = exclusions or {}
+
+        # term -> (categories it tags, categories it vetoes)
+        terms: Dict[str, tuple] = {}
+        for category, category_terms in categories.items():
+            for term in category_terms:
+                terms.setdefault(term.lower(), (set(), set()))[0].add(category)
+        for category, category_terms in exclusions.items():
+            for term in category_terms:
+                terms.setdefault(term.lower(), (set(), set()))[1].add(category)
+
+        # Longest first, so at a given position "data science" wins over "data"
+        ordered = sorted(terms, key=len, reverse=True)
+        patterns = [term_pattern(term) for term in ordered]
+
+        # A longer term hides shorter terms it contains (the regex only reports one match per
+        # position), so it inherits their categories; that keeps one pass exact for nested terms.
+        compiled = [re.compile(p) for p in patterns]
+        self._term_tags = []
+        self._term_vetoes = []
+        for term in ordered:
+            tags, vetoes = set(terms[term][0]), set(terms[term][1])
+            for other, regex in zip(ordered, compiled):
+                if other != term and regex.search(term.rstrip('*')):
+                    tags |= terms[other][0]
+                    vetoes |= terms[other][1]
+            self._term_tags.append(tags)
+            self._term_vetoes.append(vetoes)
+
+        self._regex = re.compile('|'.join(f'({p})' for p in patterns)) if patterns else None
+
+    def classify(self, title: str) -> List[str]:
+        """Tags for one title, in category definition order."""
+        return self.classify_many([title])[0]
+
+    def classify_many(self, titles: Iterable[str]) -> List[List[str]]:
+        """Tags for every title in the batch, found in a single regex scan."""
+        # Lowercase per title before measuring: lower() can change a string's length ('İ' -> 'i̇')
+        titles = [(title or '').lower().replace(SEPARATOR, ' ') for title in titles]
+        found = [set() for _ in titles]
+        vetoed = [set() for _ in titles]
+
+        if self._regex is not None and titles:
+            text = SEPARATOR.join(titles)
+            # Start offset of each title inside `text`
+            starts = []
+            offset = 0
+            for title in titles:
+                starts.append(offset)
+                offset += len(title) + 1
+
+            for match in self._regex.finditer(text):
+                index = bisect_right(starts, match.start()) - 1
+                term_index = match.lastindex - 1
+                found[index] |= self._term_tags[term_index]
+                vetoed[index] |= self._term_vetoes[term_index]
+
+        results = []
+        for tags, vetoes in zip(found, vetoed):
+            ordered = [category for category in self.categories if category in tags and category not in vetoes]
+            if not ordered and self.fallback:
+                ordered = [self.fallback]
+            results.append(ordered)
+        return results
+
+    def matches(self, title: str, category: str) -> bool:
+        return category in self.classify(title)
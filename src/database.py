@@ -1,7 +1,13 @@
 import os
+import pickle
+import logging
 from datetime import datetime
-from sqlalchemy import create_engine, Column, String, DateTime, PickleType
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, event, inspect, text, func, Column, String, DateTime, Float, Integer, JSON, ForeignKey, Index
+from sqlalchemy.orm import declarative_base, sessionmaker, relationship
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Dict, Iterable, List, Optional, Set
+from .search import ensure_search_index
 
 Base = declarative_base()
 
@@ -9,13 +15,24 @@ class Job(Base):
     __tablename__ = 'jobs'
     
     id = Column(String, primary_key=True)  # Hash of company + url
-    company = Column(String, nullable=False)
+    company = Column(String, nullable=False, index=True)
     title = Column(String, nullable=False)
     location = Column(String)
     url = Column(String, unique=True, nullable=False)
-    posted_at = Column(DateTime, default=datetime.utcnow)
-    found_at = Column(DateTime, default=datetime.utcnow)
-    tags = Column(PickleType, default=[]) # Serialized list of strings
+    posted_at = Column(DateTime, default=datetime.utcnow, index=True) # Parsed from the listing when it has a date
+    found_at = Column(DateTime, default=datetime.utcnow, index=True)
+    tag_rows = relationship('JobTag', cascade='all, delete-orphan', lazy='selectin')
+    # Plain list-of-strings view over job_tags, e.g. Job(tags=['software'])
+    tags = association_proxy('tag_rows', 'tag', creator=lambda tag: JobTag(tag=tag))
+
+class JobTag(Base):
+    __tablename__ = 'job_tags'
+
+    job_id = Column(String, ForeignKey('jobs.id', ondelete='CASCADE'), primary_key=True)
+    tag = Column(String, primary_key=True)
+
+    # The primary key covers job -> tags; this one covers tag -> jobs
+    __table_args__ = (Index('ix_job_tags_tag_job', 'tag', 'job_id'),)
 
 class Subscription(Base):
     __tablename__ = 'subscriptions'
@@ -24,7 +41,262 @@ class Subscription(Base):
     user_id = Column(String, nullable=False)
     interest = Column(String, nullable=False)
 
-def init_db(db_path='jobs.db'):
-    engine = create_engine(f'sqlite:///{db_path}')
-    Base.metadata.create_all(engine)
-    return sessionmaker(bind=engine)
+class CrawlWatermark(Base):
+    __tablename__ = 'crawl_watermarks'
+
+    key = Column(String, primary_key=True) # source or source:search term
+    job_ids = Column(JSON, default=list) # Newest job IDs seen, newest first
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class JobSignature(Base):
+    __tablename__ = 'job_signatures'
+
+    job_id = Column(String, primary_key=True) # Canonical job the MinHash belongs to
+    host = Column(String) # Source host, near-duplicates are only looked for across sources
+    signature = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class JobDuplicate(Base):
+    __tablename__ = 'job_duplicates'
+
+    id = Column(String, primary_key=True) # JobData.id of the duplicate copy
+    canonical_id = Column(String, nullable=False, index=True) # Job it was folded into
+    company = Column(String)
+    title = Column(String)
+    url = Column(String)
+    similarity = Column(Float)
+    found_at = Column(DateTime, default=datetime.utcnow)
+
+class ArchivedJob(Base):
+    """Jobs moved out of the hot table by retention.archive_old_jobs()."""
+    __tablename__ = 'jobs_archive'
+
+    id = Column(String, primary_key=True)
+    company = Column(String)
+    title = Column(String)
+    location = Column(String)
+    url = Column(String)
+    posted_at = Column(DateTime)
+    found_at = Column(DateTime)
+    tags = Column(JSON, default=list)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+class OutboxEntry(Base):
+    """
+    A Slack notification waiting to be sent, written in the same transaction
+    as its job (see insert_jobs / enqueue_notifications) and drained by
+    outbox.OutboxDispatcher. One row per job, so a job is never queued twice.
+    """
+    __tablename__ = 'notification_outbox'
+
+    job_id = Column(String, primary_key=True)
+    payload = Column(JSON, nullable=False) # title, company, location, url, tags: enough to post without the job row
+    created_at = Column(DateTime, default=datetime.utcnow)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, index=True)
+    last_error = Column(String)
+    sent_at = Column(DateTime, index=True)
+    failed_at = Column(DateTime) # Gave up after too many attempts
+
+class Meta(Base):
+    """Small counters shared between processes, e.g. the subscriptions version."""
+    __tablename__ = 'meta'
+
+    key = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+DEFAULT_DB_PATH = 'jobs.db'
+
+# Applied to every pooled connection. WAL lets the Slack server read while the
+# scraper writes; busy_timeout makes a second writer wait instead of failing.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL', # Safe with WAL, fsyncs at checkpoints instead of every commit
+    'busy_timeout': 10000, # ms
+    'mmap_size': 256 * 1024 * 1024,
+    'foreign_keys': 'ON',
+}
+
+_engines = {}
+_session_factories = {}
+
+def db_path_from_env() -> str:
+    return os.getenv("JOBS_DB_PATH", DEFAULT_DB_PATH)
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA page_count")
+        if cursor.fetchone()[0] == 0:
+            # Brand new file: auto_vacuum only sticks if set before anything is written.
+            # Older files are switched over by retention.incremental_vacuum().
+            cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+def get_engine(db_path: Optional[str] = None):
+    """
+    Process-wide engine per database file (default: JOBS_DB_PATH or jobs.db).
+    Created once, with the pragmas above on every connection and a small pool,
+    so each cycle and the Slack server reuse connections instead of reopening the file.
+    """
+    db_path = os.path.abspath(db_path or db_path_from_env())
+    engine = _engines.get(db_path)
+    if engine is None:
+        engine = create_engine(
+            f'sqlite:///{db_path}',
+            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            max_overflow=10,
+            pool_timeout=30,
+        )
+        event.listen(engine, 'connect', apply_sqlite_pragmas)
+        _engines[db_path] = engine
+    return engine
+
+def init_db(db_path: Optional[str] = None):
+    """Return the shared session factory for `db_path`, creating/migrating the schema on first use."""
+    engine = get_engine(db_path)
+    factory = _session_factories.get(engine.url)
+    if factory is None:
+        Base.metadata.create_all(engine)
+        migrate_pickled_tags(engine)
+        ensure_indexes(engine)
+        ensure_search_index(engine)
+        factory = sessionmaker(bind=engine)
+        _session_factories[engine.url] = factory
+    return factory
+
+def dispose_engines():
+    """Close every pooled connection (tests, or before the process forks)."""
+    for engine in _engines.values():
+        engine.dispose()
+    _engines.clear()
+    _session_factories.clear()
+
+def ensure_indexes(engine):
+    """create_all() skips tables that already exist, so add indexes declared since they were created."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+def migrate_pickled_tags(engine, batch_size: int = 1000) -> int:
+    """
+    Move tags out of the old pickled jobs.tags column into job_tags, then drop
+    the column. Rows are cleared as they are converted, so an interrupted run
+    (or a SQLite too old for DROP COLUMN) just resumes. Returns rows converted.
+    """
+    if 'tags' not in {column['name'] for column in inspect(engine).get_columns('jobs')}:
+        return 0
+    logger = logging.getLogger("database")
+    converted = 0
+    with engine.begin() as conn:
+        while True:
+            rows = conn.execute(text(
+                "SELECT id, tags FROM jobs WHERE tags IS NOT NULL LIMIT :limit"), {'limit': batch_size}).all()
+            if not rows:
+                break
+            tag_rows = []
+            for job_id, blob in rows:
+                try:
+                    tags = pickle.loads(blob) or []
+                except Exception as e:
+                    logger.warning(f"Unreadable tags for job {job_id}: {e}")
+                    tags = []
+                tag_rows.extend({'job_id': job_id, 'tag': tag} for tag in dict.fromkeys(tags))
+            if tag_rows:
+                conn.execute(sqlite_insert(JobTag).on_conflict_do_nothing(), tag_rows)
+            conn.execute(text("UPDATE jobs SET tags = NULL WHERE id = :id"), [{'id': row[0]} for row in rows])
+            converted += len(rows)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE jobs DROP COLUMN tags"))
+    except Exception as e:
+        logger.warning(f"Could not drop jobs.tags, leaving it empty: {e}")
+    if converted:
+        logger.info(f"Migrated tags of {converted} jobs to job_tags")
+    return converted
+
+# Comfortably under SQLite's bound-parameter limit (999 on older builds)
+IN_CHUNK_SIZE = 500
+
+def existing_job_ids(session, job_ids: Iterable[str], chunk_size: int = IN_CHUNK_SIZE) -> Set[str]:
+    """
+    IDs among `job_ids` that are already stored, as a job, an archived job or a folded duplicate.
+    One indexed IN lookup per chunk, so the cost follows the number of candidates,
+    not the size of the jobs table.
+    """
+    job_ids = list(dict.fromkeys(job_ids))
+    found = set()
+    for start in range(0, len(job_ids), chunk_size):
+        chunk = job_ids[start:start + chunk_size]
+        found.update(row[0] for row in session.query(Job.id).filter(Job.id.in_(chunk)))
+        found.update(row[0] for row in session.query(JobDuplicate.id).filter(JobDuplicate.id.in_(chunk)))
+        found.update(row[0] for row in session.query(ArchivedJob.id).filter(ArchivedJob.id.in_(chunk)))
+    return found
+
+def insert_jobs(session, rows: List[dict]) -> Set[str]:
+    """
+    Insert job rows (with an optional 'tags' list each) in one executemany,
+    skipping conflicts (same id, or a url already stored under another id).
+    Tags of the inserted jobs go to job_tags in a second executemany.
+    Returns the ids actually inserted.
+    """
+    if not rows:
+        return set()
+    tags_by_id = {row['id']: row.get('tags') or [] for row in rows}
+    job_rows = [{key: value for key, value in row.items() if key != 'tags'} for row in rows]
+    statement = sqlite_insert(Job).on_conflict_do_nothing().returning(Job.id)
+    inserted = {row[0] for row in session.execute(statement, job_rows)}
+
+    tag_rows = [{'job_id': job_id, 'tag': tag}
+                for job_id in inserted for tag in dict.fromkeys(tags_by_id[job_id])]
+    if tag_rows:
+        session.execute(sqlite_insert(JobTag).on_conflict_do_nothing(), tag_rows)
+    return inserted
+
+def enqueue_notifications(session, rows: List[dict], now: Optional[datetime] = None) -> int:
+    """
+    Queue Slack notifications for newly inserted jobs, in the caller's
+    transaction. Each row is a job dict as given to insert_jobs(). Jobs
+    already queued are skipped. Returns the number of rows given.
+    """
+    if not rows:
+        return 0
+    now = now or datetime.utcnow()
+    session.execute(sqlite_insert(OutboxEntry).on_conflict_do_nothing(), [dict(
+        job_id=row['id'],
+        payload={key: row.get(key) for key in ('title', 'company', 'location', 'url', 'tags')},
+        created_at=now,
+        next_attempt_at=now,
+        attempts=0,
+    ) for row in rows])
+    return len(rows)
+
+def bump_version(session, key: str) -> int:
+    """Increment the counter `key` as part of the session's transaction and return its new value."""
+    statement = (sqlite_insert(Meta).values(key=key, value=1)
+                 .on_conflict_do_update(index_elements=[Meta.key], set_={'value': Meta.value + 1})
+                 .returning(Meta.value))
+    return session.execute(statement).scalar()
+
+def read_version(session, key: str) -> int:
+    return session.query(Meta.value).filter(Meta.key == key).scalar() or 0
+
+def jobs_with_tag_since(session, tag: str, since: Optional[datetime] = None, limit: Optional[int] = None) -> List[Job]:
+    """Jobs tagged `tag` found on or after `since`, newest first (e.g. new software jobs this week)."""
+    query = session.query(Job).join(JobTag, JobTag.job_id == Job.id).filter(JobTag.tag == tag)
+    if since is not None:
+        query = query.filter(Job.found_at >= since)
+    query = query.order_by(Job.found_at.desc(), Job.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+def tag_counts(session, since: Optional[datetime] = None) -> Dict[str, int]:
+    """Number of jobs per tag, optionally only those found on or after `since`."""
+    query = session.query(JobTag.tag, func.count(JobTag.job_id))
+    if since is not None:
+        query = query.join(Job, Job.id == JobTag.job_id).filter(Job.found_at >= since)
+    return dict(query.group_by(JobTag.tag).all())
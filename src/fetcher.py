@@ -0,0 +1,155 @@
+import re
+import asyncio
+import logging
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from .rate_limiter import shared_rate_limiter
+
+# "#some-id" selectors can be checked with a regex instead of a full parse
+SIMPLE_ID_SELECTOR = re.compile(r'^#([\w-]+)$')
+
+def has_selector(html: str, selector: str) -> bool:
+    """Return True if the CSS selector matches something in the raw HTML."""
+    if not html:
+        return False
+    id_match = SIMPLE_ID_SELECTOR.match(selector)
+    if id_match:
+        # The attribute must be exactly "id", not data-testid / data-id
+        return re.search(r'(?<![\w-])id\s*=\s*["\']?%s["\'\s>]' % re.escape(id_match.group(1)), html) is not None
+    return BeautifulSoup(html, 'html.parser').select_one(selector) is not None
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After in seconds (the HTTP-date form is rare enough to ignore)."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+class PageFetcher:
+    """
+    Shared fetch layer for scrapers.
+    Tries a plain pooled aiohttp GET first and only escalates to a pooled Playwright
+    page when the server-rendered HTML doesn't contain the expected selector
+    (JS-rendered listings, bot walls, non-200 responses...).
+    """
+    def __init__(self, browser_manager, max_connections: int = 20, http_timeout: int = 20,
+                 use_http: bool = True, max_http_failures: int = 2, rate_limiter=None):
+        self.browser_manager = browser_manager
+        # Every request, HTTP or browser, waits for its host's rate limiter first
+        self.rate_limiter = rate_limiter or shared_rate_limiter()
+        self.max_connections = max_connections
+        self.http_timeout = http_timeout
+        self.use_http = use_http
+        # After this many consecutive failed HTTP attempts a host goes straight to the browser
+        self.max_http_failures = max_http_failures
+        self._http_failures = {}
+        self._session = None
+        self.logger = logging.getLogger("PageFetcher")
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared keep-alive session."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.http_timeout)
+            )
+        return self._session
+
+    async def fetch(self, url: str, wait_selector: str, page=None,
+                    nav_timeout: int = 60000, selector_timeout: int = 30000) -> Optional[str]:
+        """
+        Return the HTML for `url` once `wait_selector` is present, or None.
+        `page` can be passed by callers that already hold a leased page for the fallback.
+        """
+        host = urlparse(url).netloc
+        if self.use_http and self._http_failures.get(host, 0) < self.max_http_failures:
+            html = await self._fetch_http(url)
+            if has_selector(html, wait_selector):
+                self._http_failures[host] = 0
+                return html
+            self._http_failures[host] = self._http_failures.get(host, 0) + 1
+            self.logger.info(f"HTTP fetch of {url} missing {wait_selector}, falling back to browser.")
+
+        if page is not None:
+            return await self._fetch_browser(page, url, wait_selector, nav_timeout, selector_timeout)
+
+        async with self.browser_manager.lease_page() as leased_page:
+            return await self._fetch_browser(leased_page, url, wait_selector, nav_timeout, selector_timeout)
+
+    async def _fetch_http(self, url: str) -> Optional[str]:
+        session = await self.get_session()
+        headers = {
+            'User-Agent': self._user_agent(),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        }
+        await self.rate_limiter.acquire(url)
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    self.logger.info(f"HTTP {response.status} for {url}")
+                    self.rate_limiter.report(url, response.status,
+                                             retry_after=parse_retry_after(response.headers.get('Retry-After')))
+                    return None
+                html = await response.text()
+                self.rate_limiter.report(url, response.status, html)
+                return html
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.info(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+    async def fetch_json(self, url: str, params: Optional[dict] = None) -> Tuple[Optional[int], object]:
+        """
+        GET a JSON API endpoint over the shared keep-alive session.
+        Returns (status, decoded body), so callers can tell a missing resource
+        (404) from a throttled or failing one. The status is None when the
+        request never got a response; the body is None unless the status is
+        200 and the body is valid JSON.
+        """
+        session = await self.get_session()
+        await self.rate_limiter.acquire(url)
+        status = None
+        try:
+            async with session.get(url, params=params, headers={'Accept': 'application/json'}) as response:
+                status = response.status
+                self.rate_limiter.report(url, response.status,
+                                         retry_after=parse_retry_after(response.headers.get('Retry-After')))
+                if response.status != 200:
+                    self.logger.info(f"HTTP {response.status} for {url}")
+                    return status, None
+                return status, await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.info(f"JSON fetch failed for {url}: {e}")
+            return status, None
+
+    async def _fetch_browser(self, page, url: str, wait_selector: str,
+                             nav_timeout: int, selector_timeout: int) -> Optional[str]:
+        await self.rate_limiter.acquire(url)
+        response = await page.goto(url, timeout=nav_timeout)
+        status = response.status if response is not None else None
+        try:
+            await page.wait_for_selector(wait_selector, timeout=selector_timeout)
+        except Exception:
+            self.logger.info(f"Selector {wait_selector} never appeared on {url}")
+            # Probably a bot wall, let the limiter back off this host
+            self.rate_limiter.report(url, status, await page.content())
+            return None
+        html = await page.content()
+        self.rate_limiter.report(url, status, html)
+        return html
+
+    def _user_agent(self) -> str:
+        ua = getattr(self.browser_manager, 'ua', None)
+        if ua is not None:
+            return ua.random
+        return 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,144 @@
+"""
+Pluggable HTML parser backends for the scrapers' parse functions.
+
+Every backend exposes the same tiny node API (select, select_one, text, attr, tag)
+so a parse function written against it produces identical JobData whichever
+backend is used. Pick one with HTML_PARSER=selectolax|lxml|html.parser; by
+default the fastest installed backend is used.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+class Node(ABC):
+    """Backend-neutral element wrapper."""
+    tag: str
+
+    @abstractmethod
+    def select(self, css: str) -> List["Node"]:
+        pass
+
+    @abstractmethod
+    def select_one(self, css: str) -> Optional["Node"]:
+        pass
+
+    @abstractmethod
+    def text(self) -> str:
+        """Text of the element and its descendants, each piece stripped, concatenated."""
+
+    @abstractmethod
+    def attr(self, name: str) -> Optional[str]:
+        pass
+
+class SoupNode(Node):
+    """BeautifulSoup (html.parser or lxml tree builder) + soupsieve CSS."""
+    __slots__ = ('_el',)
+
+    def __init__(self, el):
+        self._el = el
+
+    @property
+    def tag(self):
+        return self._el.name
+
+    def select(self, css):
+        return [SoupNode(el) for el in self._el.select(css)]
+
+    def select_one(self, css):
+        el = self._el.select_one(css)
+        return SoupNode(el) if el is not None else None
+
+    def text(self):
+        return self._el.get_text(strip=True)
+
+    def attr(self, name):
+        return self._el.get(name)
+
+class SelectolaxNode(Node):
+    """selectolax (Lexbor/Modest) node."""
+    __slots__ = ('_el',)
+
+    def __init__(self, el):
+        self._el = el
+
+    @property
+    def tag(self):
+        return self._el.tag
+
+    def select(self, css):
+        return [SelectolaxNode(el) for el in self._el.css(css)]
+
+    def select_one(self, css):
+        el = self._el.css_first(css)
+        return SelectolaxNode(el) if el is not None else None
+
+    def text(self):
+        return self._el.text(deep=True, separator='', strip=True)
+
+    def attr(self, name):
+        return self._el.attributes.get(name)
+
+def _parse_html_parser(html: str) -> Node:
+    from bs4 import BeautifulSoup
+    return SoupNode(BeautifulSoup(html, 'html.parser'))
+
+def _parse_lxml(html: str) -> Node:
+    from bs4 import BeautifulSoup
+    return SoupNode(BeautifulSoup(html, 'lxml'))
+
+def _parse_selectolax(html: str) -> Node:
+    try:
+        from selectolax.lexbor import LexborHTMLParser as Parser
+    except ImportError:
+        from selectolax.parser import HTMLParser as Parser
+    tree = Parser(html)
+    # Selecting from the root keeps "ul#job-list li" style selectors working like bs4
+    return SelectolaxNode(tree.root if tree.root is not None else tree.body)
+
+BACKENDS = {
+    'selectolax': _parse_selectolax,
+    'lxml': _parse_lxml,
+    'html.parser': _parse_html_parser,
+}
+
+# Fastest first, used when HTML_PARSER isn't set
+PREFERENCE = ['selectolax', 'lxml', 'html.parser']
+
+def backend_available(name: str) -> bool:
+    if name == 'selectolax':
+        try:
+            import selectolax  # noqa: F401
+            return True
+        except ImportError:
+            return False
+    if name == 'lxml':
+        try:
+            import lxml  # noqa: F401
+            return True
+        except ImportError:
+            return False
+    return name == 'html.parser'
+
+def available_backends() -> List[str]:
+    return [name for name in PREFERENCE if backend_available(name)]
+
+_default_backend = None
+
+def default_backend() -> str:
+    """Backend from HTML_PARSER, falling back to the fastest one installed."""
+    global _default_backend
+    if _default_backend is None:
+        requested = os.getenv("HTML_PARSER")
+        if requested and backend_available(requested):
+            _default_backend = requested
+        else:
+            _default_backend = available_backends()[0]
+    return _default_backend
+
+def parse_html(html: str, backend: Optional[str] = None) -> Node:
+    """Parse a document with the given (or default) backend and return its root node."""
+    name = backend or default_backend()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+    return BACKENDS[name](html)
@@ -1,19 +1,22 @@
-import sys
+import os
 import asyncio
+import argparse
 import logging
 from datetime import datetime, timedelta
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy import select
 
-from .utils.date_utils import parse_job_date
-from .database import init_db, Job
-from .browser_manager import BrowserManager
-from .scrapers.boeing_scraper import BoeingScraper
-from .scrapers.simplyhired_scraper import SimplyHiredScraper
-
-
-from .slack_bot import SlackBot
-from .subscription_manager import SubscriptionManager
+# Heavy dependencies (Playwright, aiohttp, slack_sdk, APScheduler and the scrapers
+# themselves) are imported inside the functions that need them, keeping cold start cheap.
+from .utils.date_utils import parse_job_dates
+from .database import init_db
+from .async_database import init_async_db, existing_job_ids, insert_jobs, enqueue_notifications
+from .watermarks import WatermarkStore
+from .near_duplicates import NearDuplicateIndex
+from .seen_filter import load_seen_filter
+from .outbox import OutboxDispatcher
+from .parse_pool import shutdown_parse_pool
+from .retention import run_retention
+from .scrapers import create_scrapers, scraper_names
+from .subscription_manager import AsyncSubscriptionManager
 from dotenv import load_dotenv
 import pathlib
 
@@ -25,125 +28,217 @@ load_dotenv(dotenv_path=env_path)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("Main")
 
-async def run_scraper_cycle():
+# Jobs posted longer ago than this are skipped, and scrapers stop paginating past it
+MAX_JOB_AGE_DAYS = 7
+
+def create_browser_manager():
+    from .browser_manager import BrowserManager
+    # Switch to headless=False to bypass basic Cloudflare/CAPTCHA detection for debugging
+    return BrowserManager(
+        headless=False,
+        pool_size=int(os.getenv("BROWSER_POOL_SIZE", "4")),
+        max_uses=int(os.getenv("BROWSER_CONTEXT_MAX_USES", "50"))
+    )
+
+def create_dispatcher(AsyncSession) -> OutboxDispatcher:
+    from .slack_bot import SlackBot
+    sub_manager = AsyncSubscriptionManager(AsyncSession)
+    bot = SlackBot(subscription_manager=sub_manager) # Will use env vars or dry mode
+    return OutboxDispatcher(AsyncSession, bot)
+
+async def run_scraper_cycle(browser_manager=None, only=None, dispatcher=None):
+    """
+    Run one scrape -> dedupe -> store + queue notification cycle.
+    If a browser_manager is passed in (scheduler mode) it is reused and left open,
+    so Chromium and its pooled contexts survive between cycles.
+    `only` limits the cycle to the named registered scrapers.
+    With a running OutboxDispatcher (scheduler mode) it is woken after each
+    page and the cycle's posts share one Slack thread; without one, the outbox
+    is drained to Slack once scraping is done.
+    """
+    from .fetcher import PageFetcher
+    from .scraper_engine import interest_classifier
+
     logger.info("Running scraper cycle...")
     
-    # 1. Initialize DB (Sync for now, safe enough for low volume)
+    # 1. Initialize DB. The cycle's own reads/writes are async so they don't
+    # stall in-flight pages; once-per-cycle loads/commits run in a worker thread.
     Session = init_db()
-    session = Session()
+    AsyncSession = await init_async_db()
+    session = AsyncSession()
     
     # 2. Browser Manager
-    # Switch to headless=False to bypass basic Cloudflare/CAPTCHA detection for debugging
-    browser_manager = BrowserManager(headless=False)
-    await browser_manager.init()
+    owns_browser = browser_manager is None
+    if owns_browser:
+        browser_manager = create_browser_manager()
+    # Chromium is launched lazily, the first time a fetch has to fall back to the browser
+
+    # One HTTP connection pool shared by every scraper this cycle
+    fetcher = PageFetcher(browser_manager)
+    producer = None
+    if dispatcher is not None:
+        dispatcher.begin_cycle()
     
     try:
+        # Newest job IDs per source/search term from previous cycles, for early pagination stop
+        watermarks = WatermarkStore(Session)
+        await asyncio.to_thread(watermarks.load)
+        # Signatures of recent jobs, to fold the same posting seen on another source
+        near_duplicates = NearDuplicateIndex(Session)
+        await asyncio.to_thread(near_duplicates.load)
+        # Every known job id, so parsers drop known jobs before building them
+        seen = await asyncio.to_thread(load_seen_filter, Session)
+
         # 3. Initialize Scrapers & Bot
-        scrapers = [
-            BoeingScraper(browser_manager),
-            SimplyHiredScraper(browser_manager, search_terms=[
-                "software engineer intern",
-                "aerospace engineering intern",
-                "automotive engineering intern",
-                "finance intern",
-                "manufacturing intern", 
-                "supply chain intern",
-                "hardware engineering intern",
-                "embedded systems intern",
-                "semiconductor intern", 
-                "VLSI intern"
-            ]),
-
-            # Note: Greenhouse/Lever scrapers would be triggered 
-            # if we had a list of board URLs to feed them.
-        ]
-        
-        sub_manager = SubscriptionManager(Session)
-        bot = SlackBot(subscription_manager=sub_manager) # Will use env vars or dry mode
+        scrapers = create_scrapers(
+            browser_manager,
+            only=only,
+            fetcher=fetcher,
+            max_age_days=MAX_JOB_AGE_DAYS,
+            watermarks=watermarks,
+            seen=seen
+        )
+        if not scrapers:
+            logger.info("No scrapers selected.")
+            return
         
-        # 4. Run Scrapers concurrently
-        tasks = [scraper.scrape() for scraper in scrapers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        all_found_jobs = []
-        for res in results:
-            if isinstance(res, Exception):
-                logger.error(f"Scraper failed: {res}")
-            else:
-                all_found_jobs.extend(res)
+        # 4. Run Scrapers concurrently, streaming their pages into one queue
+        # so new jobs are handled while other pages are still loading
+        pages = asyncio.Queue(maxsize=len(scrapers) * 4)
+
+        async def produce(scraper):
+            try:
+                async for jobs in scraper.iter_pages():
+                    await pages.put(jobs)
+            except Exception as e:
+                logger.error(f"Scraper failed: {e}")
+
+        async def produce_all():
+            try:
+                await asyncio.gather(*[produce(scraper) for scraper in scrapers])
+            finally:
+                await pages.put(None)
+
+        producer = asyncio.create_task(produce_all())
         
         # 5. Process Results
         new_jobs_count = 0
-        parent_thread_ts = None
-        for job_data in all_found_jobs:
-            # Check if exists
-            existing = session.query(Job).filter_by(id=job_data.id).first()
-            if existing:
+        handled_ids = set() # Everything already looked at this cycle
+        while True:
+            page_jobs = await pages.get()
+            if page_jobs is None:
+                break
+            # One chunked IN lookup for the whole page instead of a query per job.
+            # Parsers already dropped what the seen filter knows; this is the exact check.
+            fresh = {}
+            for job in page_jobs:
+                if job.id not in handled_ids:
+                    fresh.setdefault(job.id, job)
+            handled_ids.update(fresh)
+            known_ids = await existing_job_ids(session, fresh)
+            page_jobs = [job for job_id, job in fresh.items() if job_id not in known_ids]
+            if not page_jobs:
                 continue
-            
-            # New Job Found
-            
-            # Date Filtering
-            job_date = parse_job_date(job_data.date_posted)
-            if job_date:
-                days_old = (datetime.utcnow() - job_date).days
-                if days_old > 7:
-                    logger.info(f"Skipping old job: {job_data.title} (Posted {days_old} days ago)")
+
+            # Tag the whole page in one classifier pass
+            page_tags = interest_classifier().classify_many(job.title for job in page_jobs)
+            now = datetime.utcnow()
+            page_dates = parse_job_dates((job.date_posted for job in page_jobs), now)
+            candidates = []
+            for job_data, tags, job_date in zip(page_jobs, page_tags, page_dates):
+                # Date Filtering
+                if job_date:
+                    days_old = (now - job_date).days
+                    if days_old > MAX_JOB_AGE_DAYS:
+                        logger.info(f"Skipping old job: {job_data.title} (Posted {days_old} days ago)")
+                        continue
+                
+                # Same posting already stored from another source?
+                signature = near_duplicates.signature(job_data)
+                duplicate = near_duplicates.find_duplicate(job_data, signature)
+                if duplicate:
+                    canonical_id, score = duplicate
+                    logger.info(f"Near-duplicate of {canonical_id} ({score:.2f}): {job_data.title} {job_data.url}")
+                    near_duplicates.link(session, job_data, canonical_id, score)
+                    seen.add(job_data.id)
                     continue
-            
-            logger.info(f"New job detected: {job_data.title}")
-            
-            # Simple tag filtering
-            # Note: We need to access the scraper that found it to use filter_interests? 
-            # Or just move filter_interests to a utility or static method.
-            # For now, just instantiating a helper or using one of the instances
-            # Hack: use first scraper instance for filtering logic as it is shared
-            tags = scrapers[0].filter_interests(job_data)
-            
-            # Save to DB
-            new_job = Job(
-                id=job_data.id,
-                company=job_data.company,
-                title=job_data.title,
-                location=job_data.location,
-                url=job_data.url,
-                tags=tags
-            )
-            session.add(new_job)
-            new_jobs_count += 1
-            
-            # Post to Slack
-            # Create a thread for this batch if it's the first job of the batch, or reuse existing?
-            # Ideally we want ONE parent message for the whole cycle. 
-            # But the cycle logic is streaming jobs one by one.
-            # Let's start the thread BEFORE the loop if we found jobs? 
-            # Actually, we are iterating `all_found_jobs`. We can check if `new_jobs_count == 0` to start it.
-            
-            if new_jobs_count == 0 and not parent_thread_ts:
-                 # This is the first new job we are about to save. Start the thread.
-                 parent_thread_ts = await bot.post_message(f"🚀 *Scraper Cycle Started*: Finding new jobs...")
-            
-            await bot.post_job(job_data, tags, thread_ts=parent_thread_ts)
-            
-        session.commit()
-        session.commit()
+                candidates.append((job_data, tags, job_date, signature))
+
+            # Save to DB, one bulk insert per page
+            rows = [
+                dict(
+                    id=job_data.id,
+                    company=job_data.company,
+                    title=job_data.title,
+                    location=job_data.location,
+                    url=job_data.url,
+                    posted_at=job_date or now, # Undated listings count as posted when first seen
+                    found_at=now,
+                    tags=tags
+                )
+                for job_data, tags, job_date, _ in candidates
+            ]
+            inserted = await insert_jobs(session, rows)
+            seen.update(inserted)
+
+            for job_data, tags, _, signature in candidates:
+                if job_data.id not in inserted:
+                    # Lost a conflict, e.g. the same url stored under another id
+                    continue
+                logger.info(f"New job detected: {job_data.title}")
+                near_duplicates.add(session, job_data, signature)
+                new_jobs_count += 1
+
+            # Slack notifications go to the outbox in the same transaction as the jobs
+            await enqueue_notifications(session, [row for row in rows if row['id'] in inserted], now)
+            await session.commit()
+            if dispatcher is not None and inserted:
+                dispatcher.wake()
+
+        await producer
+        await session.commit()
+        # Only now that the jobs are stored is it safe to move the watermarks forward
+        await asyncio.to_thread(watermarks.commit)
         logger.info(f"Cycle complete. Added {new_jobs_count} new jobs.")
-        
-        if parent_thread_ts and bot.client:
-             # Update the parent message to show final count
-             await bot.client.chat_update(
-                 channel=bot.channel,
-                 ts=parent_thread_ts,
-                 text=f"✅ *Scraper Cycle Complete*: Found {new_jobs_count} new jobs today."
-             )
+
+        if dispatcher is None:
+            # One-off run: post what was queued (and anything left over from earlier runs)
+            await create_dispatcher(AsyncSession).drain()
         
     finally:
-        session.close()
-        await browser_manager.close()
+        if producer and not producer.done():
+            producer.cancel()
+        await session.close()
+        await fetcher.close()
+        if owns_browser:
+            await browser_manager.close()
+        if dispatcher is not None:
+            try:
+                # Posts the rest (all of it on digest channels) and closes the cycle's thread
+                await dispatcher.end_cycle()
+            except Exception as e:
+                logger.error(f"Outbox dispatch failed: {e}")
+
+async def run_retention_job():
+    """Archive old jobs and vacuum, off the event loop so a running cycle isn't stalled."""
+    try:
+        await asyncio.to_thread(run_retention)
+    except Exception as e:
+        logger.error(f"Retention job failed: {e}")
+
+async def run_scheduler(only=None):
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-async def run_scheduler():
+    # One browser for the lifetime of the daemon, contexts are pooled inside it
+    browser_manager = create_browser_manager()
+    # Posts queued notifications as they are committed, and anything a restart left in the outbox
+    dispatcher = create_dispatcher(await init_async_db())
+    dispatch_task = asyncio.create_task(dispatcher.run())
     scheduler = AsyncIOScheduler()
-    scheduler.add_job(run_scraper_cycle, 'interval', hours=24)
+    scheduler.add_job(run_scraper_cycle, 'interval', hours=24, args=[browser_manager, only, dispatcher])
+    # Keeps the hot jobs table small; rows older than JOB_RETENTION_DAYS go to jobs_archive
+    scheduler.add_job(run_retention_job, 'interval', hours=24, id='retention',
+                      next_run_time=datetime.now() + timedelta(hours=1))
     logger.info("Scheduler started. Running every 24 hours.")
     scheduler.start()
     
@@ -154,17 +249,38 @@ async def run_scheduler():
         logger.info(f"Next scraper cycle scheduled for: {next_run}")
 
     # Keep the task alive
-    while True:
-        await asyncio.sleep(3600)
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        dispatch_task.cancel()
+        await browser_manager.close()
+        shutdown_parse_pool()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Internship/co-op job scraper.")
+    parser.add_argument("--now", action="store_true", help="Run one cycle immediately and exit.")
+    parser.add_argument("--only", help=f"Comma-separated scrapers to run ({', '.join(scraper_names())}).")
+    args = parser.parse_args(argv)
 
-def main():
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--now":
-            asyncio.run(run_scraper_cycle())
+    if args.only:
+        args.only = [name.strip().lower() for name in args.only.split(",") if name.strip()]
+        unknown = set(args.only) - set(scraper_names())
+        if unknown:
+            parser.error(f"unknown scraper(s): {', '.join(sorted(unknown))}")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.now:
+        try:
+            asyncio.run(run_scraper_cycle(only=args.only))
+        finally:
+            shutdown_parse_pool()
     else:
         print("Press Ctrl+C to exit")
         try:
-            asyncio.run(run_scheduler())
+            asyncio.run(run_scheduler(only=args.only))
         except (KeyboardInterrupt, SystemExit):
             pass
 
@@ -0,0 +1,173 @@
+"""
+Cross-source near-duplicate detection.
+
+The same posting often shows up on the company site and on a board under
+different URLs (so different JobData.id). Each new job gets a MinHash signature
+over the words of title + company + location; an LSH index (banded
+signatures) returns the few stored jobs that could be similar, and only those
+are compared. Jobs for different terms ("Summer 2025" vs "Fall 2025") are
+never folded, however similar the rest of the posting. Signatures are stored in job_signatures so the index is rebuilt
+at cycle start from history, without a pairwise scan.
+"""
+import re
+import random
+import logging
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from sqlalchemy import func
+
+from .database import ArchivedJob, Job, JobDuplicate, JobSignature
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+WORD = re.compile(r'[a-z0-9]+')
+# Words that differ between copies of the same posting without changing the job
+COMPANY_NOISE = {'the', 'company', 'inc', 'corp', 'corporation', 'llc', 'ltd', 'co'}
+SEASONS = {'summer', 'fall', 'autumn', 'winter', 'spring'}
+YEAR = re.compile(r'^(?:19|20)\d\d$')
+
+def _words(text: Optional[str]) -> List[str]:
+    return WORD.findall((text or '').lower())
+
+def job_term(title: Optional[str]) -> frozenset:
+    """Season and year words of a title; copies of one posting share them."""
+    return frozenset(word for word in _words(title) if word in SEASONS or YEAR.match(word))
+
+def job_shingles(job) -> set:
+    """
+    Word tokens of title, company and location, tagged by field. Words rather
+    than character n-grams: "Software" vs "Hardware Engineering Intern" share
+    most characters but are different jobs, while reordered titles
+    ("Propulsion Engineering Intern" / "Intern - Propulsion Engineering") aren't.
+    """
+    shingles = set(_words(job.title))
+    shingles.update('c:' + word for word in _words(job.company) if word not in COMPANY_NOISE)
+    shingles.update('l:' + word for word in _words(job.location))
+    return shingles
+
+class MinHasher:
+    """MinHash with `num_perm` seeded universal hash functions (stable across processes)."""
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        self.num_perm = num_perm
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+
+    def signature(self, shingles: set) -> List[int]:
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles] or [0]
+        return [min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes) for a, b in self._perms]
+
+def similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+class LSHIndex:
+    """
+    Banded LSH over MinHash signatures. Two signatures sharing all rows of any
+    band become candidates; with 32 bands of 4 rows, pairs above ~0.5 Jaccard
+    are very likely to collide and pairs far below it rarely do.
+    """
+    def __init__(self, bands: int = 32, rows: int = 4):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: Dict[Tuple[int, tuple], List[str]] = {}
+        self.signatures: Dict[str, Sequence[int]] = {}
+
+    def _band_keys(self, signature: Sequence[int]):
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    def add(self, key: str, signature: Sequence[int]):
+        if key in self.signatures:
+            return
+        self.signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(key)
+
+    def candidates(self, signature: Sequence[int]) -> set:
+        found = set()
+        for band_key in self._band_keys(signature):
+            found.update(self._buckets.get(band_key, ()))
+        return found
+
+    def __len__(self):
+        return len(self.signatures)
+
+class NearDuplicateIndex:
+    """
+    Loaded once per cycle. find_duplicate() returns the canonical job a new job
+    duplicates (if any); add() and link() record the outcome through the cycle's
+    session, so they are committed (or rolled back) together with the jobs.
+    """
+    def __init__(self, session_factory, threshold: float = 0.85, history_days: Optional[int] = 90,
+                 hasher: Optional[MinHasher] = None, bands: int = 32):
+        self.Session = session_factory
+        self.threshold = threshold
+        self.history_days = history_days
+        self.hasher = hasher or MinHasher()
+        self.bands = bands
+        self.index = LSHIndex(bands, self.hasher.num_perm // bands)
+        self._hosts: Dict[str, str] = {}
+        self._terms: Dict[str, frozenset] = {}
+        self.logger = logging.getLogger("NearDuplicateIndex")
+
+    def load(self):
+        """Rebuild the in-memory index from stored signatures."""
+        self.index = LSHIndex(self.bands, self.hasher.num_perm // self.bands)
+        self._hosts = {}
+        self._terms = {}
+        session = self.Session()
+        try:
+            # Titles only for the term check; a job may have moved to the archive since
+            query = (session.query(JobSignature.job_id, JobSignature.host, JobSignature.signature,
+                                   func.coalesce(Job.title, ArchivedJob.title))
+                     .outerjoin(Job, Job.id == JobSignature.job_id)
+                     .outerjoin(ArchivedJob, ArchivedJob.id == JobSignature.job_id))
+            if self.history_days is not None:
+                query = query.filter(JobSignature.created_at >= datetime.utcnow() - timedelta(days=self.history_days))
+            for job_id, host, signature, title in query:
+                if len(signature) == self.hasher.num_perm:
+                    self.index.add(job_id, signature)
+                    self._hosts[job_id] = host
+                    if title is not None:
+                        self._terms[job_id] = job_term(title)
+        finally:
+            session.close()
+        self.logger.info(f"Loaded {len(self.index)} job signatures")
+
+    def signature(self, job) -> List[int]:
+        return self.hasher.signature(job_shingles(job))
+
+    def find_duplicate(self, job, signature: Optional[Sequence[int]] = None) -> Optional[Tuple[str, float]]:
+        """(canonical job id, similarity) of the closest stored job from another source, or None."""
+        signature = signature or self.signature(job)
+        host = urlparse(job.url).netloc
+        term = job_term(job.title)
+        best = None
+        for candidate in self.index.candidates(signature):
+            if candidate == job.id or self._hosts.get(candidate) == host:
+                continue
+            if self._terms.get(candidate, term) != term:
+                # Summer vs Fall, 2025 vs 2026: another internship, not a copy
+                continue
+            score = similarity(signature, self.index.signatures[candidate])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (candidate, score)
+        return best
+
+    def add(self, session, job, signature: Optional[Sequence[int]] = None):
+        """Index a newly stored job as a canonical copy."""
+        signature = signature or self.signature(job)
+        host = urlparse(job.url).netloc
+        session.add(JobSignature(job_id=job.id, host=host, signature=list(signature)))
+        self.index.add(job.id, signature)
+        self._hosts[job.id] = host
+        self._terms[job.id] = job_term(job.title)
+
+    def link(self, session, job, canonical_id: str, score: float):
+        """Record `job` as a copy of `canonical_id` instead of storing it again."""
+        session.add(JobDuplicate(id=job.id, canonical_id=canonical_id, company=job.company,
+                                 title=job.title, url=job.url, similarity=score))
@@ -0,0 +1,202 @@
+"""
+Slack notifications through a durable outbox.
+
+The cycle writes one notification_outbox row per new job in the same
+transaction as the job itself, so a job is stored and queued together or not
+at all, and scraping never waits on Slack. OutboxDispatcher drains the table
+on the event loop: due rows are posted (as digests on digest channels), then
+marked sent. Failures are retried with exponential backoff until
+max_attempts, after which the row is marked failed and left for inspection.
+Everything posted during one cycle (begin_cycle() .. end_cycle()), or one
+drain() outside a cycle, goes under a single parent message whose count is
+kept up to date; digest channels are drained once, at the end of the cycle,
+so a cycle's jobs are packed together rather than page by page.
+Rows are only marked after Slack accepted them, so a crash in between means
+a repeat post after restart (at-least-once), never a lost one.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from .database import OutboxEntry
+
+logger = logging.getLogger("Outbox")
+
+def due_notifications(session, now: datetime, limit: int = 200) -> List[OutboxEntry]:
+    """Unsent rows whose next attempt is due, oldest first."""
+    return (session.query(OutboxEntry)
+            .filter(OutboxEntry.sent_at.is_(None), OutboxEntry.failed_at.is_(None),
+                    OutboxEntry.next_attempt_at <= now)
+            .order_by(OutboxEntry.created_at, OutboxEntry.job_id)
+            .limit(limit)
+            .all())
+
+def mark_sent(session, job_ids: List[str], now: datetime):
+    session.query(OutboxEntry).filter(OutboxEntry.job_id.in_(job_ids)).update(
+        {'sent_at': now, 'last_error': None}, synchronize_session=False)
+
+def mark_failed(session, job_ids: List[str], error: str, now: datetime, max_attempts: int,
+                base_backoff: float, max_backoff: float):
+    """Count a failed attempt; schedule the next one, or give up after max_attempts."""
+    for entry in session.query(OutboxEntry).filter(OutboxEntry.job_id.in_(job_ids)):
+        entry.attempts += 1
+        entry.last_error = error[:500]
+        if entry.attempts >= max_attempts:
+            entry.failed_at = now
+            logger.error(f"Giving up on notification for {entry.job_id} after {entry.attempts} attempts: {error}")
+        else:
+            delay = min(max_backoff, base_backoff * (2 ** (entry.attempts - 1)))
+            entry.next_attempt_at = now + timedelta(seconds=delay)
+
+def prune_outbox(session, cutoff: datetime) -> int:
+    """Delete sent or abandoned rows older than `cutoff`."""
+    deleted = (session.query(OutboxEntry)
+               .filter((OutboxEntry.sent_at < cutoff) | (OutboxEntry.failed_at < cutoff))
+               .delete(synchronize_session=False))
+    session.commit()
+    return deleted
+
+def job_from_payload(payload: dict):
+    # scraper_engine pulls in Playwright; keep it out of main's import time
+    from .scraper_engine import JobData
+    return JobData(title=payload.get('title') or "", company=payload.get('company') or "",
+                   url=payload.get('url') or "", location=payload.get('location'))
+
+class OutboxDispatcher:
+    """
+    Drains notification_outbox to a SlackBot. Call run() as a long-lived task
+    (wake() it after queuing), or drain() to empty what is due and return.
+    """
+    def __init__(self, async_session_factory, bot, batch_size: int = 200, poll_interval: float = 30.0,
+                 max_attempts: int = 8, base_backoff: float = 30.0, max_backoff: float = 3600.0,
+                 settle_delay: float = 5.0, clock=datetime.utcnow):
+        self.Session = async_session_factory
+        self.bot = bot
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        # After a wake(), wait this long so the wakes of the next few pages share one drain
+        self.settle_delay = settle_delay
+        self.clock = clock
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock() # One drain at a time, so they can share the parent message
+        self._in_cycle = False
+        self._parent_ts: Optional[str] = None
+        self._posted = 0 # Delivered under _parent_ts so far
+        self.last_batch = 0 # Rows picked up by the last drain_once()
+
+    def wake(self):
+        """New rows were committed, look soon instead of at the next poll."""
+        self._wake.set()
+
+    def begin_cycle(self):
+        """Thread everything posted until end_cycle() under one parent message."""
+        self._in_cycle = True
+
+    async def end_cycle(self) -> int:
+        """Post what the cycle queued and close its thread. Returns how many were delivered."""
+        async with self._lock:
+            self._in_cycle = False
+            return await self._drain()
+
+    def _close_thread(self):
+        self._parent_ts = None
+        self._posted = 0
+
+    async def drain_once(self) -> int:
+        """Post one batch of due notifications into the open thread. Returns how many were delivered."""
+        async with self.Session() as session:
+            entries = await session.run_sync(due_notifications, self.clock(), self.batch_size)
+            # Same job queued twice can't happen (job_id is the key), but keep the batch unique anyway
+            payloads: Dict[str, dict] = {entry.job_id: entry.payload for entry in entries}
+        self.last_batch = len(payloads)
+        if not payloads:
+            return 0
+
+        if self._parent_ts is None:
+            self._parent_ts = await self.bot.post_message(f"🚀 *New jobs found*: posting {len(payloads)}...")
+        outcomes = await self._post(payloads, self._parent_ts)
+        sent = [job_id for job_id, error in outcomes.items() if error is None]
+        failed = {}
+        for job_id, error in outcomes.items():
+            if error is not None:
+                failed.setdefault(error, []).append(job_id)
+
+        now = self.clock()
+        async with self.Session() as session:
+            if sent:
+                await session.run_sync(mark_sent, sent, now)
+            for error, job_ids in failed.items():
+                await session.run_sync(mark_failed, job_ids, error, now, self.max_attempts,
+                                       self.base_backoff, self.max_backoff)
+            await session.commit()
+        if failed:
+            logger.warning(f"{sum(map(len, failed.values()))} notifications failed, will retry")
+        self._posted += len(sent)
+        await self.bot.update_message(self._parent_ts, f"✅ *{self._posted} new jobs* posted.")
+        return len(sent)
+
+    async def _post(self, payloads: Dict[str, dict], thread_ts: Optional[str]) -> Dict[str, Optional[str]]:
+        """Post every payload; job_id -> None if delivered, else the error."""
+        jobs = [(job_from_payload(payload), payload.get('tags') or []) for payload in payloads.values()]
+        job_ids = list(payloads)
+        outcomes = {}
+        if self.bot.digest:
+            groups = await self.bot.digest_groups(jobs)
+            position = 0
+            for group in groups:
+                ids = job_ids[position:position + len(group)]
+                position += len(group)
+                error = await self._attempt(self.bot.post_digest_message(group, thread_ts))
+                outcomes.update((job_id, error) for job_id in ids)
+        else:
+            # In flight together, the Slack limiter paces them
+            errors = await asyncio.gather(*[
+                self._attempt(self.bot.post_job(job_data, tags, thread_ts=thread_ts)) for job_data, tags in jobs])
+            outcomes.update(zip(job_ids, errors))
+        return outcomes
+
+    async def _attempt(self, post) -> Optional[str]:
+        try:
+            return None if await post else "rejected by Slack"
+        except Exception as e:
+            return repr(e)
+
+    async def drain(self) -> int:
+        """Post everything currently due, batch after batch. Returns how many were delivered."""
+        async with self._lock:
+            return await self._drain()
+
+    async def _drain(self) -> int:
+        total = 0
+        try:
+            while True:
+                sent = await self.drain_once()
+                total += sent
+                # A short batch means nothing else was due; an all-failed one is rescheduled
+                if sent == 0 or self.last_batch < self.batch_size:
+                    return total
+        finally:
+            # Within a cycle the thread stays open for the next drain
+            if not self._in_cycle:
+                self._close_thread()
+
+    async def run(self):
+        """Drain forever: after wake(), every poll_interval, and right away on start (rows left by a restart)."""
+        while True:
+            # Cleared before draining, so a wake() during the drain triggers another pass
+            self._wake.clear()
+            # Digests wait for end_cycle(), to pack the whole cycle together
+            if not (self._in_cycle and self.bot.digest):
+                try:
+                    await self.drain()
+                except Exception as e:
+                    logger.error(f"Outbox dispatch failed: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                await asyncio.sleep(self.settle_delay)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,64 @@
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+logger = logging.getLogger("ParsePool")
+
+# Shared worker pool for CPU-bound HTML parsing.
+# None = not started yet, size comes from PARSE_WORKERS (0 parses inline on the loop).
+_executor = None
+_max_workers = None
+
+def configure_parse_pool(max_workers: Optional[int]):
+    """Set the pool size. Takes effect on the next parse; restarts a running pool."""
+    global _max_workers
+    shutdown_parse_pool()
+    _max_workers = max_workers
+
+def _pool_size() -> int:
+    if _max_workers is not None:
+        return _max_workers
+    env_value = os.getenv("PARSE_WORKERS")
+    if env_value is not None:
+        return int(env_value)
+    return os.cpu_count() or 1
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the process pool, starting it on first use. None when parsing inline."""
+    global _executor
+    size = _pool_size()
+    if size <= 0:
+        return None
+    if _executor is None:
+        # spawn: forking a process that already runs an event loop and Playwright threads isn't safe
+        _executor = ProcessPoolExecutor(max_workers=size, mp_context=multiprocessing.get_context("spawn"))
+        logger.info(f"Started parse pool with {size} workers.")
+    return _executor
+
+async def run_parser(func, *args):
+    """
+    Run a module-level parse function (html -> List[JobData]) in the worker pool
+    and await the result without blocking the event loop.
+    """
+    pool = get_parse_pool()
+    if pool is None:
+        return func(*args)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # A worker died (OOM, killed...). Start over with a fresh pool next time, parse this one inline.
+        logger.warning("Parse pool broken, restarting it.")
+        shutdown_parse_pool()
+        return func(*args)
+
+def shutdown_parse_pool():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,147 @@
+import os
+import time
+import random
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# Markers of bot walls / CAPTCHA interstitials served with a 200
+BLOCK_MARKERS = (
+    'g-recaptcha', 'h-captcha', 'px-captcha', 'cf-challenge', 'challenge-platform',
+    '<title>just a moment', '<title>attention required', '<title>access denied',
+)
+
+def looks_blocked(html: Optional[str]) -> bool:
+    """Heuristic check for a CAPTCHA / bot-challenge page."""
+    if not html:
+        return False
+    head = html[:20000].lower()
+    return any(marker in head for marker in BLOCK_MARKERS)
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens per second, up to `burst` saved up.
+    reserve() always takes a token and returns how long the caller has to wait
+    for it, so concurrent callers queue up fairly without a lock.
+    """
+    def __init__(self, rate: float, burst: int, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        self._refill()
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+class HostState:
+    def __init__(self, rate: float, burst: int, clock):
+        self.base_rate = rate
+        self.bucket = TokenBucket(rate, burst, clock)
+        self.blocked_until = 0.0
+        self.strikes = 0
+
+class HostRateLimiter:
+    """
+    Shared per-host politeness. Every navigation awaits acquire(url) first and
+    reports the outcome afterwards. 429/403/CAPTCHA responses halve the host's
+    rate and pause it with exponential backoff (or Retry-After); successes
+    slowly restore the configured rate.
+    """
+    def __init__(self, rate: float = 1.0, burst: int = 3, jitter: float = 0.2,
+                 host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 min_rate: float = 0.05, base_backoff: float = 5.0, max_backoff: float = 300.0,
+                 clock=time.monotonic, sleep=asyncio.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.host_limits = host_limits or {}
+        self.min_rate = min_rate
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.sleep = sleep
+        self._hosts: Dict[str, HostState] = {}
+        self.logger = logging.getLogger("HostRateLimiter")
+
+    def _state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+            state = HostState(rate, burst, self.clock)
+            self._hosts[host] = state
+        return state
+
+    def delay_for(self, url: str) -> float:
+        """Reserve a slot for `url` and return the seconds to wait before using it."""
+        state = self._state(urlparse(url).netloc)
+        wait = state.bucket.reserve()
+        wait = max(wait, state.blocked_until - self.clock())
+        if wait > 0 and self.jitter:
+            # Only jitter when we're waiting anyway, never add idle time to a free slot
+            wait += random.uniform(0, self.jitter / state.bucket.rate)
+        return wait
+
+    async def acquire(self, url: str):
+        wait = self.delay_for(url)
+        if wait > 0:
+            await self.sleep(wait)
+
+    def report(self, url: str, status: Optional[int] = None, html: Optional[str] = None,
+               retry_after: Optional[float] = None):
+        """Feed back the result of a request so the host's rate can adapt."""
+        host = urlparse(url).netloc
+        state = self._state(host)
+        bucket = state.bucket
+
+        if status in (429, 403) or looks_blocked(html):
+            state.strikes += 1
+            backoff = retry_after if retry_after is not None else min(
+                self.max_backoff, self.base_backoff * (2 ** (state.strikes - 1)))
+            state.blocked_until = max(state.blocked_until, self.clock() + backoff)
+            bucket.rate = max(self.min_rate, bucket.rate / 2)
+            bucket.tokens = min(bucket.tokens, 0)
+            self.logger.warning(f"{host} pushed back (status={status}), "
+                                f"pausing {backoff:.0f}s at {bucket.rate:.2f} req/s")
+        elif status is None or status < 400:
+            state.strikes = 0
+            if bucket.rate < state.base_rate:
+                bucket.rate = min(state.base_rate, bucket.rate * 1.25)
+
+# Public JSON APIs built for polling take far more than an HTML site
+DEFAULT_HOST_LIMITS = {
+    'boards-api.greenhouse.io': (20.0, 40),
+    'api.lever.co': (10.0, 20),
+}
+
+def _limits_from_env() -> Dict[str, Tuple[float, int]]:
+    """RATE_LIMITS="www.simplyhired.com=0.5:2,jobs.boeing.com=2:5" -> per-host (rate, burst)."""
+    limits = dict(DEFAULT_HOST_LIMITS)
+    for entry in filter(None, os.getenv("RATE_LIMITS", "").split(",")):
+        host, _, spec = entry.strip().partition("=")
+        rate, _, burst = spec.partition(":")
+        limits[host] = (float(rate), int(burst or 1))
+    return limits
+
+_shared_limiter = None
+
+def shared_rate_limiter() -> HostRateLimiter:
+    """Process-wide limiter so every scraper hitting a host is coordinated (and state survives cycles)."""
+    global _shared_limiter
+    if _shared_limiter is None:
+        _shared_limiter = HostRateLimiter(
+            rate=float(os.getenv("RATE_LIMIT_RPS", "1.0")),
+            burst=int(os.getenv("RATE_LIMIT_BURST", "3")),
+            host_limits=_limits_from_env()
+        )
+    return _shared_limiter
@@ -0,0 +1,92 @@
+"""
+Retention for jobs.db.
+
+Jobs older than JOB_RETENTION_DAYS (by found_at) are moved to jobs_archive in
+batches, with their tags folded into a JSON column, and their MinHash
+signatures are dropped, as are old delivered or abandoned outbox rows.
+Archived IDs still count as known to the cycle's dedupe, so a long-running
+listing is not posted again. Afterwards the freed pages are handed back to
+the filesystem with PRAGMA incremental_vacuum.
+"""
+import os
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .database import ArchivedJob, Job, JobSignature, JobTag, get_engine, init_db
+from .outbox import prune_outbox
+
+DEFAULT_RETENTION_DAYS = 180
+
+logger = logging.getLogger("Retention")
+
+def retention_days_from_env() -> int:
+    return int(os.getenv("JOB_RETENTION_DAYS", str(DEFAULT_RETENTION_DAYS)))
+
+def archive_old_jobs(session, cutoff: datetime, batch_size: int = 1000) -> int:
+    """Move jobs found before `cutoff` to jobs_archive, one committed batch at a time. Returns rows moved."""
+    moved = 0
+    while True:
+        jobs = (session.query(Job)
+                .filter(Job.found_at < cutoff)
+                .order_by(Job.found_at)
+                .limit(batch_size)
+                .all())
+        if not jobs:
+            break
+        ids = [job.id for job in jobs]
+        session.execute(sqlite_insert(ArchivedJob).on_conflict_do_nothing(), [dict(
+            id=job.id, company=job.company, title=job.title, location=job.location, url=job.url,
+            posted_at=job.posted_at, found_at=job.found_at, tags=sorted(job.tags)
+        ) for job in jobs])
+        session.query(JobTag).filter(JobTag.job_id.in_(ids)).delete(synchronize_session=False)
+        session.query(Job).filter(Job.id.in_(ids)).delete(synchronize_session=False)
+        session.commit()
+        session.expunge_all()
+        moved += len(ids)
+    return moved
+
+def prune_signatures(session, cutoff: datetime) -> int:
+    deleted = session.query(JobSignature).filter(JobSignature.created_at < cutoff).delete(synchronize_session=False)
+    session.commit()
+    return deleted
+
+def incremental_vacuum(engine, pages: Optional[int] = None):
+    """
+    Release free pages to the filesystem. A database created before auto_vacuum
+    was enabled gets one full VACUUM to switch it to incremental mode.
+    """
+    with engine.connect() as conn:
+        mode = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+    # VACUUM can't run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if mode != 2: # INCREMENTAL
+            logger.info("Switching jobs.db to incremental auto_vacuum (one-off full VACUUM)")
+            conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.exec_driver_sql("VACUUM")
+        else:
+            conn.execute(text(f"PRAGMA incremental_vacuum({int(pages)})" if pages else "PRAGMA incremental_vacuum"))
+
+def run_retention(db_path: Optional[str] = None, max_age_days: Optional[int] = None,
+                  now: Optional[datetime] = None) -> int:
+    """Archive, prune and vacuum. Safe to run while the Slack server is reading."""
+    max_age_days = max_age_days if max_age_days is not None else retention_days_from_env()
+    cutoff = (now or datetime.utcnow()) - timedelta(days=max_age_days)
+    Session = init_db(db_path)
+    session = Session()
+    try:
+        moved = archive_old_jobs(session, cutoff)
+        pruned = prune_signatures(session, cutoff)
+        prune_outbox(session, cutoff)
+    except Exception as e:
+        logger.error(f"Retention failed: {e}")
+        session.rollback()
+        raise
+    finally:
+        session.close()
+    incremental_vacuum(get_engine(db_path))
+    logger.info(f"Archived {moved} jobs found before {cutoff:%Y-%m-%d}, pruned {pruned} signatures")
+    return moved
@@ -1,8 +1,24 @@
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional
+from abc import ABC
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Optional
 import hashlib
 from .browser_manager import BrowserManager
+from .fetcher import PageFetcher
+from .utils.date_utils import parse_job_dates
+from .classifier import KeywordClassifier
+from .taxonomy import current_taxonomy
+
+def make_job_id(company: str, job_id: Optional[str] = None, url: Optional[str] = None) -> str:
+    """JobData.id without building a JobData, so parsers can check the seen filter first."""
+    if job_id:
+        # Use the explicit ID if provided (more stable)
+        unique_str = f"{company}:{job_id}"
+    else:
+        # Fallback to URL (strip common tracking params if possible or use raw)
+        # Simple strip of query params might be too aggressive if ID is in query
+        unique_str = f"{company}:{url}"
+    return hashlib.md5(unique_str.encode()).hexdigest()
 
 @dataclass
 class JobData:
@@ -16,72 +32,132 @@ class JobData:
     @property
     def id(self) -> str:
         """Generate a unique ID for the job based on company and ID/URL."""
-        if self.job_id:
-            # Use the explicit ID if provided (more stable)
-            unique_str = f"{self.company}:{self.job_id}"
-        else:
-            # Fallback to URL (strip common tracking params if possible or use raw)
-            # Simple strip of query params might be too aggressive if ID is in query
-            unique_str = f"{self.company}:{self.url}"
-            
-        return hashlib.md5(unique_str.encode()).hexdigest()
+        return make_job_id(self.company, self.job_id, self.url)
+
+@dataclass
+class ParsedPage:
+    """Jobs found on one results page plus the absolute URL of the next page, if any."""
+    jobs: List[JobData] = field(default_factory=list)
+    next_url: Optional[str] = None
+    # Relevant jobs dropped by the seen filter, kept as bare ids for the watermarks
+    known_ids: List[str] = field(default_factory=list)
 
 class BaseScraper(ABC):
-    def __init__(self, company_name: str, browser_manager: BrowserManager):
+    """
+    Subclasses implement either iter_pages() (streaming, preferred) or scrape().
+    Each default is written in terms of the other.
+    """
+    def __init__(self, company_name: str, browser_manager: BrowserManager, fetcher: Optional[PageFetcher] = None,
+                 max_pages: int = 5, max_age_days: Optional[int] = None, watermarks=None, seen=None):
         self.company_name = company_name
         self.browser_manager = browser_manager
+        # Normally one fetcher (and its HTTP connection pool) is shared by every scraper in a cycle
+        self.fetcher = fetcher or PageFetcher(browser_manager)
+        # Pagination budget: pages followed per start URL / search term
+        self.max_pages = max_pages
+        # Stop following "next" once a whole page is older than this
+        self.max_age_days = max_age_days
+        # Optional WatermarkStore: stop following "next" once a page has nothing new
+        self.watermarks = watermarks
+        # Optional seen filter (seen_filter.py): known job ids, dropped while parsing
+        self.seen = seen
+
+    async def iter_pages(self) -> AsyncIterator[List[JobData]]:
+        """Yield the jobs of each results page as soon as it is parsed."""
+        if type(self).scrape is BaseScraper.scrape:
+            raise NotImplementedError(f"{type(self).__name__} must implement iter_pages() or scrape()")
+        yield await self.scrape()
+
+    async def iter_jobs(self) -> AsyncIterator[JobData]:
+        """Yield jobs one at a time while pages are still loading."""
+        async for jobs in self.iter_pages():
+            for job in jobs:
+                yield job
 
-    @abstractmethod
     async def scrape(self) -> List[JobData]:
         """Scrape the carrier page/job board and return a list of JobData objects."""
-        pass
+        if type(self).iter_pages is BaseScraper.iter_pages:
+            raise NotImplementedError(f"{type(self).__name__} must implement iter_pages() or scrape()")
+        jobs = []
+        async for page_jobs in self.iter_pages():
+            jobs.extend(page_jobs)
+        return jobs
+
+    def is_seen(self, job_id: str) -> bool:
+        return self.seen is not None and job_id in self.seen
+
+    def drop_seen(self, page: ParsedPage) -> ParsedPage:
+        """
+        Move the page's known jobs to known_ids. For pages parsed in the parse
+        pool: the filter stays in this process instead of being pickled with
+        every page, and only the ids are checked here.
+        """
+        if self.seen is None:
+            return page
+        jobs = []
+        for job in page.jobs:
+            job_id = job.id
+            if job_id in self.seen:
+                page.known_ids.append(job_id)
+            else:
+                jobs.append(job)
+        page.jobs = jobs
+        return page
+
+    def should_stop_paginating(self, key: str, jobs: List[JobData], known_ids: Optional[List[str]] = None) -> bool:
+        """
+        Record the page against the watermark for `key` (source or source:term) and
+        decide whether the next page is worth fetching. `known_ids` are the page's
+        jobs the seen filter already dropped.
+        """
+        if self.watermarks is not None:
+            ids = list(known_ids or []) + [job.id for job in jobs]
+            already_seen = self.watermarks.all_known(key, ids)
+            self.watermarks.observe(key, ids)
+            if already_seen:
+                print(f"[{self.company_name}] Only known jobs on this page, stopping pagination for {key}.")
+                return True
+
+        if self.page_past_age_budget(jobs):
+            print(f"[{self.company_name}] Reached age budget, stopping pagination for {key}.")
+            return True
+        return False
+
+    def page_past_age_budget(self, jobs: List[JobData]) -> bool:
+        """True if every dated job on the page is older than max_age_days."""
+        if self.max_age_days is None:
+            return False
+        now = datetime.utcnow()
+        dates = [d for d in parse_job_dates((job.date_posted for job in jobs), now) if d]
+        if not dates:
+            return False
+        cutoff = now - timedelta(days=self.max_age_days)
+        return max(dates) < cutoff
         
     def filter_interests(self, job: JobData) -> List[str]:
         """Return a list of interests (tags) based on the job title/description."""
-        tags = []
-        title_lower = job.title.lower()
-        
-        keywords = {
-            'aerospace': ['aerospace', 'propulsion', 'flight', 'avionics', 'aircraft', 'space', 'rocket', 'satellite', 'defen'], # 'defen' matches defense
-            'software': ['software', 'developer', 'full stack', 'backend', 'frontend', 'computer science', 'machine learning', 'ai', 'cloud', 'cyber', 'data science', 'data engineer', 'firmware', 'sre', 'devops'],
-            'automotive': ['automotive', 'vehicle', 'autonomous', 'driver', 'adas', 'car', 'ev', 'mobility'],
-            'finance': ['finance', 'accounting', 'audit', 'tax', 'analyst', 'investment', 'trading', 'risk', 'capital'],
-            'manufacturing': ['manufacturing', 'production', 'industrial', 'process', 'supply chain', 'logistics', 'quality', 'operations'],
-            'ece hardware': ['hardware', 'electronics', 'circuit', 'fpga', 'asic', 'pcb', 'embedded', 'signal', 'rf', 'power'],
-            'semiconductors': ['semiconductor', 'lithography', 'wafer', 'device physics', 'vlsi', 'silicon', 'chip', 'fab'],
-            'general': ['business', 'marketing', 'hr', 'recruiter', 'project manager', 'program manager', 'sales', 'consultant', 'strategy', 'admin'],
-        }
-        
-        for category, terms in keywords.items():
-            if any(term in title_lower for term in terms):
-                tags.append(category)
-        
-        # If no specific tag found, mark as 'other'
-        if not tags:
-            tags.append('other')
-            
-        return tags
+        return interest_classifier().classify(job.title)
 
     def is_relevant_role(self, title: str) -> bool:
         """Check if the job title matches Internship or New Grad keywords."""
-        title_lower = title.lower()
-        target_keywords = [
-            'intern', 'internship', 'co-op'
-        ]
-        
-        # Exclude senior roles explicitly to be safe
-        exclude_keywords = ['senior', 'manager', 'lead', 'principal', 'director', 'expert', 'experienced']
-        
-        if any(ex in title_lower for ex in exclude_keywords):
-            return False
-            
-        return any(term in title_lower for term in target_keywords)
+        return is_relevant_role(title)
+
+# Categories, terms and relevance keywords live in taxonomy.json (see taxonomy.py)
+def interest_classifier() -> KeywordClassifier:
+    """The category tagger from the live taxonomy, shared by every scraper."""
+    return current_taxonomy().classifier
+
+def is_relevant_role(title: str) -> bool:
+    """
+    Check if the job title matches Internship or New Grad keywords.
+    Module-level so parse functions running in worker processes can use it.
+    """
+    return current_taxonomy().is_relevant(title)
 
 class JobBoardScraper(BaseScraper):
-    def __init__(self, company_name: str, browser_manager: BrowserManager, search_terms: List[str]):
-        super().__init__(company_name, browser_manager)
+    def __init__(self, company_name: str, browser_manager: BrowserManager, search_terms: List[str],
+                 max_concurrency: int = 1, **kwargs):
+        super().__init__(company_name, browser_manager, **kwargs)
         self.search_terms = search_terms
-
-    @abstractmethod
-    async def scrape(self) -> List[JobData]:
-        pass
+        # How many search terms may be in flight at once
+        self.max_concurrency = max(1, max_concurrency)
@@ -0,0 +1,69 @@
+"""
+Scraper registry.
+
+Scrapers are declared here by name with the dotted path of their class and the
+options they are built with. Nothing is imported until a scraper is actually
+scheduled, so one-off runs (`--now --only boeing`) and tools that only need the
+database don't pay for Playwright/bs4/aiohttp imports of unused sources.
+Adding a source means adding a register_scraper() call, not editing the cycle.
+"""
+import importlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+@dataclass
+class ScraperSpec:
+    name: str
+    target: str # "module:ClassName", module relative to this package
+    options: dict = field(default_factory=dict)
+
+    def load_class(self):
+        module_name, _, class_name = self.target.partition(':')
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        return getattr(module, class_name)
+
+    def create(self, browser_manager, **shared_options):
+        """Import the scraper class and build it with its own options plus the cycle-wide ones."""
+        scraper_cls = self.load_class()
+        return scraper_cls(browser_manager, **self.options, **shared_options)
+
+SCRAPERS: Dict[str, ScraperSpec] = {}
+
+def register_scraper(name: str, target: str, **options):
+    SCRAPERS[name] = ScraperSpec(name=name, target=target, options=options)
+
+def scraper_names() -> List[str]:
+    return list(SCRAPERS)
+
+def create_scrapers(browser_manager, only: Optional[Iterable[str]] = None, **shared_options) -> list:
+    """
+    Instantiate the registered scrapers (or just the ones named in `only`, in registry order).
+    Raises KeyError for unknown names.
+    """
+    if only is not None:
+        only = set(only)
+        unknown = only - set(SCRAPERS)
+        if unknown:
+            raise KeyError(f"Unknown scraper(s): {', '.join(sorted(unknown))}")
+    return [
+        spec.create(browser_manager, **shared_options)
+        for name, spec in SCRAPERS.items()
+        if only is None or name in only
+    ]
+
+register_scraper("boeing", "boeing_scraper:BoeingScraper")
+register_scraper("simplyhired", "simplyhired_scraper:SimplyHiredScraper", search_terms=[
+    "software engineer intern",
+    "aerospace engineering intern",
+    "automotive engineering intern",
+    "finance intern",
+    "manufacturing intern",
+    "supply chain intern",
+    "hardware engineering intern",
+    "embedded systems intern",
+    "semiconductor intern",
+    "VLSI intern"
+])
+# Board tokens come from GREENHOUSE_BOARDS / LEVER_BOARDS (comma-separated); no tokens, no requests
+register_scraper("greenhouse", "greenhouse_scraper:GreenhouseScraper")
+register_scraper("lever", "lever_scraper:LeverScraper")
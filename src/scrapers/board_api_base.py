@@ -0,0 +1,82 @@
+import os
+import asyncio
+from abc import abstractmethod
+from typing import AsyncIterator, Dict, List, Optional
+from ..scraper_engine import BaseScraper, JobData
+
+class JsonBoardScraper(BaseScraper):
+    """
+    Base for ATS providers with public JSON job board endpoints (Greenhouse, Lever...).
+    One request per board token over the fetcher's shared aiohttp session, up to
+    `max_concurrency` boards in flight, each board yielded as a page when it lands.
+    """
+    DEFAULT_BASE_URL = None
+    # Env var holding comma-separated board tokens, used when none are passed in
+    TOKENS_ENV = None
+
+    def __init__(self, company_name: str, browser_manager, board_tokens: Optional[List[str]] = None,
+                 company_names: Optional[Dict[str, str]] = None, max_concurrency: int = 20,
+                 base_url: Optional[str] = None, **kwargs):
+        super().__init__(company_name, browser_manager, **kwargs)
+        if board_tokens is None and self.TOKENS_ENV:
+            board_tokens = [t.strip() for t in os.getenv(self.TOKENS_ENV, "").split(",") if t.strip()]
+        self.board_tokens = board_tokens or []
+        # Display name per token, e.g. {"spacex": "SpaceX"}; defaults to the title-cased token
+        self.company_names = company_names or {}
+        self.max_concurrency = max(1, max_concurrency)
+        self.base_url = base_url or self.DEFAULT_BASE_URL
+
+    @abstractmethod
+    def board_url(self, token: str) -> str:
+        pass
+
+    def board_params(self, token: str) -> Optional[dict]:
+        return None
+
+    @abstractmethod
+    def parse_board(self, token: str, payload) -> List[JobData]:
+        pass
+
+    def company_for(self, token: str) -> str:
+        return self.company_names.get(token) or token.replace('-', ' ').title()
+
+    async def fetch_board(self, token: str) -> List[JobData]:
+        status, payload = await self.fetcher.fetch_json(self.board_url(token), params=self.board_params(token))
+        if payload is None:
+            if status == 404:
+                print(f"[{self.company_name}] No board found for {token}")
+            elif status is None:
+                print(f"[{self.company_name}] Could not reach board {token} (network error)")
+            elif status == 200:
+                print(f"[{self.company_name}] Board {token} returned invalid JSON")
+            else:
+                print(f"[{self.company_name}] Board {token} unavailable (HTTP {status})")
+            return []
+        return self.parse_board(token, payload)
+
+    async def iter_pages(self) -> AsyncIterator[List[JobData]]:
+        if not self.board_tokens:
+            return
+        print(f"[{self.company_name}] Fetching {len(self.board_tokens)} boards...")
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(token):
+            async with limit:
+                return await self.fetch_board(token)
+
+        tasks = [asyncio.create_task(bounded(token)) for token in self.board_tokens]
+        total = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                try:
+                    jobs = await finished
+                except Exception as e:
+                    print(f"[{self.company_name}] Error fetching board: {e}")
+                    continue
+                total += len(jobs)
+                yield jobs
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        print(f"[{self.company_name}] Found {total} jobs.")
@@ -1,80 +1,116 @@
-from typing import List
-from bs4 import BeautifulSoup
-import asyncio
-from ..scraper_engine import BaseScraper, JobData
+from typing import AsyncIterator, List, Optional
+from urllib.parse import urljoin
+from ..scraper_engine import BaseScraper, JobData, ParsedPage, is_relevant_role, make_job_id
+from ..parse_pool import run_parser
+from ..html_backend import parse_html
 
 class BoeingScraper(BaseScraper):
-    def __init__(self, browser_manager):
-        super().__init__("Boeing", browser_manager)
+    def __init__(self, browser_manager, **kwargs):
+        super().__init__("Boeing", browser_manager, **kwargs)
         self.start_urls = [
             "https://jobs.boeing.com/search-jobs",
             "https://jobs.boeing.com/search-jobs/intern/185/1"
         ]
 
-    async def scrape(self) -> List[JobData]:
+    async def iter_pages(self) -> AsyncIterator[List[JobData]]:
         print(f"[{self.company_name}] Starting scrape...")
-        jobs = []
-        
-        context = await self.browser_manager.get_new_context()
-        page = await context.new_page()
-        
-        try:
-            for url in self.start_urls:
+        total = 0
+        visited = set()
+
+        for start_url in self.start_urls:
+            url = start_url
+            pages = 0
+            while url and url not in visited and pages < self.max_pages:
+                visited.add(url)
                 print(f"[{self.company_name}] Scraping URL: {url}")
                 try:
-                    await page.goto(url, timeout=60000)
-                    # Wait for the list to load
-                    await page.wait_for_selector('#search-results-list', timeout=30000)
-                    
-                    # Scrape the jobs from the current page
-                    content = await page.content()
-                    self._extract_jobs_from_page(content, jobs)
+                    # Plain HTTP first, browser only if the results list isn't server-rendered
+                    content = await self.fetcher.fetch(url, '#search-results-list')
+                    if not content:
+                        break
+                    # Parse off the event loop so other scrapers keep running
+                    page = self.drop_seen(await run_parser(parse_boeing_page, content, self.company_name, url))
                 except Exception as e:
-                        print(f"[{self.company_name}] Error scraping URL {url}: {e}")
-            
-        except Exception as e:
-            print(f"[{self.company_name}] Error during scraping: {e}")
-        finally:
-            await context.close()
-                
-        print(f"[{self.company_name}] Found {len(jobs)} jobs.")
-        return jobs
+                    print(f"[{self.company_name}] Error scraping URL {url}: {e}")
+                    break
+
+                pages += 1
+                total += len(page.jobs)
+                yield page.jobs
+
+                if self.should_stop_paginating(f"{self.company_name}:{start_url}", page.jobs, page.known_ids):
+                    break
+                url = page.next_url
+
+        print(f"[{self.company_name}] Found {total} jobs.")
 
     def _extract_jobs_from_page(self, html: str, jobs_list: List[JobData]):
-        soup = BeautifulSoup(html, 'html.parser')
-        results_list = soup.select('#search-results-list ul li')
-        
-        for li in results_list:
-            try:
-                link_elem = li.select_one('a.search-results__job-link')
-                if not link_elem:
-                    continue
-                
-                title_elem = link_elem.select_one('.search-results__job-title')
-                title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
-                
-                href = link_elem.get('href')
-                url = "https://jobs.boeing.com" + href if href.startswith('/') else href
-                
-                loc_elem = li.select_one('.search-results__job-info.location')
-                location = loc_elem.get_text(strip=True) if loc_elem else "Unknown Location"
-                
-                date_elem = li.select_one('.search-results__job-info.date')
-                date_posted = date_elem.get_text(strip=True) if date_elem else None
-                
-                # Filter for Intern only
-                if not self.is_relevant_role(title):
-                    continue
+        jobs_list.extend(parse_boeing_results(html, self.company_name, seen=self.seen))
+
+def parse_boeing_results(html: str, company_name: str = "Boeing", backend: Optional[str] = None,
+                         seen=None) -> List[JobData]:
+    """Parse a Boeing search results page into JobData records."""
+    return parse_boeing_page(html, company_name, backend=backend, seen=seen).jobs
+
+def parse_boeing_page(html: str, company_name: str = "Boeing", page_url: str = "https://jobs.boeing.com/search-jobs",
+                      backend: Optional[str] = None, seen=None) -> ParsedPage:
+    """
+    Parse a Boeing search results page into JobData records and the next page link.
+    Jobs whose id is in `seen` are only reported in known_ids.
+    Pure function of its arguments so it can run in the parse pool.
+    """
+    jobs_list = []
+    known_ids = []
+    doc = parse_html(html, backend)
+    results_list = doc.select('#search-results-list ul li')
+
+    for li in results_list:
+        try:
+            link_elem = li.select_one('a.search-results__job-link')
+            if not link_elem:
+                continue
+
+            title_elem = link_elem.select_one('.search-results__job-title')
+            title = title_elem.text() if title_elem else "Unknown Title"
+
+            href = link_elem.attr('href')
+            url = "https://jobs.boeing.com" + href if href.startswith('/') else href
 
-                job = JobData(
-                    title=title,
-                    company=self.company_name,
-                    url=url,
-                    location=location,
-                    date_posted=date_posted
-                )
-                jobs_list.append(job)
-                
-            except Exception as e:
-                print(f"Error parsing job card: {e}")
+            loc_elem = li.select_one('.search-results__job-info.location')
+            location = loc_elem.text() if loc_elem else "Unknown Location"
+
+            date_elem = li.select_one('.search-results__job-info.date')
+            date_posted = date_elem.text() if date_elem else None
+
+            # Filter for Intern only
+            if not is_relevant_role(title):
                 continue
+
+            if seen is not None:
+                job_id = make_job_id(company_name, url=url)
+                if job_id in seen:
+                    known_ids.append(job_id)
+                    continue
+
+            job = JobData(
+                title=title,
+                company=company_name,
+                url=url,
+                location=location,
+                date_posted=date_posted
+            )
+            jobs_list.append(job)
+
+        except Exception as e:
+            print(f"Error parsing job card: {e}")
+            continue
+
+    next_url = None
+    next_elem = doc.select_one('.pagination a.next')
+    if next_elem:
+        href = next_elem.attr('href')
+        classes = next_elem.attr('class') or ''
+        if href and href != '#' and 'disabled' not in classes:
+            next_url = urljoin(page_url, href)
+
+    return ParsedPage(jobs=jobs_list, next_url=next_url, known_ids=known_ids)
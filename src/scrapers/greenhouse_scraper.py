@@ -0,0 +1,36 @@
+from typing import List
+from .board_api_base import JsonBoardScraper
+from ..scraper_engine import JobData, is_relevant_role, make_job_id
+
+class GreenhouseScraper(JsonBoardScraper):
+    """Greenhouse public Job Board API: GET /v1/boards/{token}/jobs"""
+    DEFAULT_BASE_URL = "https://boards-api.greenhouse.io/v1/boards"
+    TOKENS_ENV = "GREENHOUSE_BOARDS"
+
+    def __init__(self, browser_manager, **kwargs):
+        super().__init__("Greenhouse", browser_manager, **kwargs)
+
+    def board_url(self, token: str) -> str:
+        return f"{self.base_url}/{token}/jobs"
+
+    def parse_board(self, token: str, payload) -> List[JobData]:
+        jobs = []
+        for posting in payload.get('jobs', []):
+            title = posting.get('title') or ""
+            if not is_relevant_role(title):
+                continue
+            company = self.company_names.get(token) or posting.get('company_name') or self.company_for(token)
+            job_id = str(posting.get('id'))
+            if self.is_seen(make_job_id(company, job_id)):
+                continue
+            # first_published is the real posting date, updated_at moves on every edit
+            posted = posting.get('first_published') or posting.get('updated_at')
+            jobs.append(JobData(
+                title=title,
+                company=company,
+                url=posting.get('absolute_url'),
+                location=(posting.get('location') or {}).get('name'),
+                date_posted=posted[:10] if posted else None, # YYYY-MM-DD
+                job_id=job_id
+            ))
+        return jobs
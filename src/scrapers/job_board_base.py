@@ -1,7 +1,6 @@
 import asyncio
-from typing import List
+from typing import AsyncIterator, List, Tuple
 from ..scraper_engine import JobBoardScraper, JobData
-import random
 
 class GenericJobBoardScraper(JobBoardScraper):
     """
@@ -10,28 +9,105 @@ class GenericJobBoardScraper(JobBoardScraper):
     1. Go to search URL with params
     2. Extract jobs
     3. Click 'Next' or go to next page
+
+    Subclasses implement iter_term_pages() (paginated, streaming) or scrape_search_term().
     """
-    
-    async def scrape_search_term(self, context, search_term: str) -> List[JobData]:
+
+    async def iter_term_pages(self, search_term: str) -> AsyncIterator[List[JobData]]:
+        """Yield the jobs of each results page for one search term."""
+        if type(self).scrape_search_term is GenericJobBoardScraper.scrape_search_term:
+            raise NotImplementedError(f"{type(self).__name__} must implement iter_term_pages() or scrape_search_term()")
+        yield await self.scrape_search_term(search_term)
+
+    async def scrape_search_term(self, search_term: str) -> List[JobData]:
         # To be implemented by subclasses like IndeedScraper
-        return []
+        jobs = []
+        async for page_jobs in self.iter_term_pages(search_term):
+            jobs.extend(page_jobs)
+        return jobs
 
-    async def scrape(self) -> List[JobData]:
-        all_jobs = []
-        context = await self.browser_manager.get_new_context()
-        page = await context.new_page()
-        
-        try:
-            for term in self.search_terms:
+    async def _iter_tagged_pages(self) -> AsyncIterator[Tuple[int, int, List[JobData]]]:
+        """
+        Run every search term and yield (term_index, page_index, jobs) as pages complete.
+        Terms are fanned out over up to `max_concurrency` workers, so the board sees
+        at most `max_concurrency` requests in flight from this scraper; pacing is
+        left to the fetcher's shared per-host rate limiter. Pages are leased by
+        the fetcher only when a term needs the browser fallback.
+        """
+        terms = asyncio.Queue()
+        for index, term in enumerate(self.search_terms):
+            terms.put_nowait((index, term))
+
+        # Bounded so a slow consumer pauses the crawl instead of buffering it in memory
+        pages = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        done = object()
+
+        async def worker():
+            while not terms.empty():
+                index, term = terms.get_nowait()
                 print(f"[{self.company_name}] Searching for: {term}")
-                jobs = await self.scrape_search_term(page, term)
-                all_jobs.extend(jobs)
+                try:
+                    page_index = 0
+                    async for jobs in self.iter_term_pages(term):
+                        await pages.put((index, page_index, jobs))
+                        page_index += 1
+                except Exception as e:
+                    print(f"[{self.company_name}] Error on term {term}: {e}")
 
-                await asyncio.sleep(random.uniform(2, 5))
-                
-        except Exception as e:
-            print(f"[{self.company_name}] Error: {e}")
+        async def run_workers():
+            count = min(self.max_concurrency, len(self.search_terms))
+            outcomes = await asyncio.gather(*[worker() for _ in range(count)], return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    print(f"[{self.company_name}] Error: {outcome}")
+            await pages.put(done)
+
+        runner = asyncio.create_task(run_workers())
+        try:
+            while True:
+                item = await pages.get()
+                if item is done:
+                    break
+                yield item
         finally:
-            await context.close()
-            
-        return all_jobs
+            # Consumer stopped early (or failed): don't leave workers crawling in the background
+            if not runner.done():
+                runner.cancel()
+                try:
+                    await runner
+                except asyncio.CancelledError:
+                    pass
+
+    async def iter_pages(self) -> AsyncIterator[List[JobData]]:
+        """Yield pages as they complete, across all terms, skipping jobs already yielded."""
+        seen = set()
+        async for _, _, jobs in self._iter_tagged_pages():
+            fresh = []
+            for job in jobs:
+                if job.id not in seen:
+                    seen.add(job.id)
+                    fresh.append(job)
+            yield fresh
+
+    async def scrape(self) -> List[JobData]:
+        """
+        List adapter. Unlike iter_pages() (completion order) the result is in a
+        deterministic order: search_terms order, then page order within a term.
+        """
+        collected = []
+        async for term_index, page_index, jobs in self._iter_tagged_pages():
+            collected.append((term_index, page_index, jobs))
+        collected.sort(key=lambda item: (item[0], item[1]))
+        return self._merge_results([jobs for _, _, jobs in collected])
+
+    def _merge_results(self, results: List[List[JobData]]) -> List[JobData]:
+        """Flatten per-term results in search_terms order, keeping the first copy of each job."""
+        merged = []
+        seen = set()
+        for jobs in results:
+            for job in jobs:
+                if job.id in seen:
+                    continue
+                seen.add(job.id)
+                merged.append(job)
+        return merged
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import List
+from .board_api_base import JsonBoardScraper
+from ..scraper_engine import JobData, is_relevant_role, make_job_id
+
+class LeverScraper(JsonBoardScraper):
+    """Lever public Postings API: GET /v0/postings/{token}?mode=json"""
+    DEFAULT_BASE_URL = "https://api.lever.co/v0/postings"
+    TOKENS_ENV = "LEVER_BOARDS"
+
+    def __init__(self, browser_manager, **kwargs):
+        super().__init__("Lever", browser_manager, **kwargs)
+
+    def board_url(self, token: str) -> str:
+        return f"{self.base_url}/{token}"
+
+    def board_params(self, token: str) -> dict:
+        return {'mode': 'json'}
+
+    def parse_board(self, token: str, payload) -> List[JobData]:
+        jobs = []
+        for posting in payload or []:
+            title = posting.get('text') or ""
+            if not is_relevant_role(title):
+                continue
+            company = self.company_for(token)
+            if self.is_seen(make_job_id(company, posting.get('id'), posting.get('hostedUrl'))):
+                continue
+            created = posting.get('createdAt') # epoch millis
+            jobs.append(JobData(
+                title=title,
+                company=company,
+                url=posting.get('hostedUrl'),
+                location=(posting.get('categories') or {}).get('location'),
+                date_posted=datetime.utcfromtimestamp(created / 1000).strftime('%Y-%m-%d') if created else None,
+                job_id=posting.get('id')
+            ))
+        return jobs
@@ -1,95 +1,127 @@
-from typing import List
-from bs4 import BeautifulSoup
-import asyncio
-import random
+from typing import AsyncIterator, List, Optional
+from urllib.parse import urlencode, urljoin
 from .job_board_base import GenericJobBoardScraper, JobData
+from ..scraper_engine import ParsedPage, is_relevant_role, make_job_id
+from ..parse_pool import run_parser
+from ..html_backend import parse_html
 
 class SimplyHiredScraper(GenericJobBoardScraper):
-    def __init__(self, browser_manager, search_terms: List[str]):
-        super().__init__("SimplyHired", browser_manager, search_terms)
+    def __init__(self, browser_manager, search_terms: List[str], max_concurrency: int = 3, **kwargs):
+        super().__init__("SimplyHired", browser_manager, search_terms,
+                         max_concurrency=max_concurrency, **kwargs)
         self.base_url = "https://www.simplyhired.com/search"
 
-    async def scrape_search_term(self, page, search_term: str) -> List[JobData]:
-        jobs = []
+    async def iter_term_pages(self, search_term: str) -> AsyncIterator[List[JobData]]:
         # Construct search URL (SimpyHired uses q for query, l for location)
-        url = f"{self.base_url}?q={search_term}&l="
-        
-        try:
-            print(f"[{self.company_name}] Going to {url}")
-            await page.goto(url, timeout=60000)
-            await asyncio.sleep(random.uniform(1, 3))
-            
-            # Wait for list
-            try:
-                await page.wait_for_selector('#job-list', timeout=15000)
-            except:
-                print(f"[{self.company_name}] No results list found.")
-                # Maybe try valid selector for empty state or error
-                return []
-                
-            content = await page.content()
-            self._extract_jobs(content, jobs)
-            
-        except Exception as e:
-             print(f"[{self.company_name}] Error scraping term {search_term}: {e}")
-             
-        return jobs
+        url = f"{self.base_url}?{urlencode({'q': search_term, 'l': ''})}"
+        visited = set()
 
-    def _extract_jobs(self, html: str, jobs_list: List[JobData]):
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # SimplyHired classes (often obfuscated but structured)
-        # Look for the list items
-        cards = soup.select('ul#job-list li article')
-        if not cards:
-             cards = soup.select('ul#job-list li') # Fallback
-
-        for card in cards:
+        while url and url not in visited and len(visited) < self.max_pages:
+            visited.add(url)
             try:
-                title_elem = card.select_one('a.chakra-button') # Often the title is a link with chakra class
-                if not title_elem:
-                     title_elem = card.select_one('h3')
-
-                title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
-                
-                # Company
-                company_elem = card.select_one('[data-testid="companyName"]')
-                company = company_elem.get_text(strip=True) if company_elem else "SimplyHired Job"
-                
-                # Location
-                loc_elem = card.select_one('[data-testid="searchSerpJobLocation"]')
-                location = loc_elem.get_text(strip=True) if loc_elem else "Unknown Location"
-                
-                # URL
-                if title_elem and title_elem.name == 'a':
-                     href = title_elem.get('href')
-                     url = "https://www.simplyhired.com" + href if href.startswith('/') else href
-                else:
-                    # Look for any link
-                    link_elem = card.select_one('a')
-                    href = link_elem.get('href') if link_elem else ""
-                    url = "https://www.simplyhired.com" + href if href.startswith('/') else href
-
-                if not self.is_relevant_role(title):
-                    continue
+                print(f"[{self.company_name}] Going to {url}")
+
+                content = await self.fetcher.fetch(url, '#job-list', selector_timeout=15000)
+                if not content:
+                    print(f"[{self.company_name}] No results list found.")
+                    # Maybe try valid selector for empty state or error
+                    return
 
-                job = JobData(
-                    title=title,
-                    company=company,
-                    url=url,
-                    location=location,
-                    date_posted=None
-                )
-                
-                # Date
-                date_elem = card.select_one('time')
-                if not date_elem:
-                     date_elem = card.select_one('[data-testid="searchSerpJobDate"]')
-                
-                if date_elem:
-                    job.date_posted = date_elem.get_text(strip=True)
-
-                jobs_list.append(job)
-                
+                # Parse off the event loop so other scrapers keep running
+                page = self.drop_seen(await run_parser(parse_simplyhired_page, content, url))
             except Exception as e:
+                print(f"[{self.company_name}] Error scraping term {search_term}: {e}")
+                return
+
+            yield page.jobs
+
+            if self.should_stop_paginating(f"{self.company_name}:{search_term}", page.jobs, page.known_ids):
+                break
+            url = page.next_url
+
+    def _extract_jobs(self, html: str, jobs_list: List[JobData]):
+        jobs_list.extend(parse_simplyhired_results(html, seen=self.seen))
+
+def parse_simplyhired_results(html: str, backend: Optional[str] = None, seen=None) -> List[JobData]:
+    """Parse a SimplyHired search results page into JobData records."""
+    return parse_simplyhired_page(html, backend=backend, seen=seen).jobs
+
+def parse_simplyhired_page(html: str, page_url: str = "https://www.simplyhired.com/search",
+                           backend: Optional[str] = None, seen=None) -> ParsedPage:
+    """
+    Parse a SimplyHired search results page into JobData records and the next page link.
+    Jobs whose id is in `seen` are only reported in known_ids.
+    Pure function of its arguments so it can run in the parse pool.
+    """
+    jobs_list = []
+    known_ids = []
+    doc = parse_html(html, backend)
+
+    # SimplyHired classes (often obfuscated but structured)
+    # Look for the list items
+    cards = doc.select('ul#job-list li article')
+    if not cards:
+        cards = doc.select('ul#job-list li') # Fallback
+
+    for card in cards:
+        try:
+            title_elem = card.select_one('a.chakra-button') # Often the title is a link with chakra class
+            if not title_elem:
+                title_elem = card.select_one('h3')
+
+            title = title_elem.text() if title_elem else "Unknown Title"
+
+            # Company
+            company_elem = card.select_one('[data-testid="companyName"]')
+            company = company_elem.text() if company_elem else "SimplyHired Job"
+
+            # Location
+            loc_elem = card.select_one('[data-testid="searchSerpJobLocation"]')
+            location = loc_elem.text() if loc_elem else "Unknown Location"
+
+            # URL
+            if title_elem and title_elem.tag == 'a':
+                href = title_elem.attr('href')
+                url = "https://www.simplyhired.com" + href if href.startswith('/') else href
+            else:
+                # Look for any link
+                link_elem = card.select_one('a')
+                href = link_elem.attr('href') if link_elem else ""
+                url = "https://www.simplyhired.com" + href if href.startswith('/') else href
+
+            if not is_relevant_role(title):
                 continue
+
+            if seen is not None:
+                job_id = make_job_id(company, url=url)
+                if job_id in seen:
+                    known_ids.append(job_id)
+                    continue
+
+            job = JobData(
+                title=title,
+                company=company,
+                url=url,
+                location=location,
+                date_posted=None
+            )
+
+            # Date
+            date_elem = card.select_one('time')
+            if not date_elem:
+                date_elem = card.select_one('[data-testid="searchSerpJobDate"]')
+
+            if date_elem:
+                job.date_posted = date_elem.text()
+
+            jobs_list.append(job)
+
+        except Exception as e:
+            continue
+
+    next_url = None
+    next_elem = doc.select_one('a[data-testid="pageNumberBlockNext"]')
+    if next_elem and next_elem.attr('href'):
+        next_url = urljoin(page_url, next_elem.attr('href'))
+
+    return ParsedPage(jobs=jobs_list, next_url=next_url, known_ids=known_ids)
@@ -0,0 +1,125 @@
+"""
+Full-text search over stored jobs.
+
+jobs_fts is an FTS5 index over jobs.title/company/location. It is an external
+content table (the text lives only in jobs) kept in sync by triggers, so every
+insert path (the cycle's bulk insert, the ORM, retention's deletes) updates it
+without extra code. Results are ranked by bm25 with title matches weighted
+highest.
+"""
+import re
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger("Search")
+
+FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company, location,
+        content='jobs', content_rowid='rowid', tokenize='porter unicode61')""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, location)
+        VALUES (new.rowid, new.title, new.company, new.location);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location)
+        VALUES ('delete', old.rowid, old.title, old.company, old.location);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, location ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location)
+        VALUES ('delete', old.rowid, old.title, old.company, old.location);
+        INSERT INTO jobs_fts(rowid, title, company, location)
+        VALUES (new.rowid, new.title, new.company, new.location);
+    END""",
+]
+
+# bm25 weights for title, company, location; stored as the table's default rank
+# so ORDER BY rank stays inside FTS5 instead of calling bm25() per row from SQL
+RANK_FUNCTION = "bm25(10.0, 5.0, 1.0)"
+
+SEARCH_WORD = re.compile(r'\w+')
+
+def ensure_search_index(engine):
+    """Create jobs_fts and its triggers; index existing jobs the first time."""
+    with engine.begin() as conn:
+        exists = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'").first()
+        for statement in FTS_DDL:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql(f"INSERT INTO jobs_fts(jobs_fts, rank) VALUES ('rank', '{RANK_FUNCTION}')")
+        if not exists:
+            conn.exec_driver_sql("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+            logger.info("Built the jobs_fts search index")
+
+def match_expression(query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query: every word must match, the last one as
+    a prefix so partial words still find something. User input never reaches
+    FTS5 syntax (quotes, NEAR, column filters...) unescaped.
+    """
+    words = SEARCH_WORD.findall(query.lower())
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words[:-1]] + [f'"{words[-1]}"*']
+    return ' '.join(terms)
+
+@dataclass
+class SearchHit:
+    id: str
+    title: str
+    company: str
+    location: Optional[str]
+    url: str
+    found_at: Optional[datetime]
+
+@dataclass
+class SearchPage:
+    hits: List[SearchHit]
+    total: int
+    page: int
+    per_page: int
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-self.total // self.per_page))
+
+def search_jobs(session, query: str, page: int = 1, per_page: int = 10,
+                since: Optional[datetime] = None) -> SearchPage:
+    """Ranked, paginated search. `page` is 1-based; `since` limits to jobs found on or after it."""
+    page = max(1, page)
+    expression = match_expression(query)
+    if expression is None:
+        return SearchPage([], 0, page, per_page)
+
+    params = {'match': expression, 'limit': per_page, 'offset': (page - 1) * per_page}
+    if since is None:
+        # Rank and page inside the index, then fetch just this page's rows
+        matches = "SELECT rowid, rank FROM jobs_fts WHERE jobs_fts MATCH :match"
+        count = "SELECT count(*) FROM jobs_fts WHERE jobs_fts MATCH :match"
+    else:
+        matches = ("SELECT jobs_fts.rowid AS rowid, jobs_fts.rank AS rank FROM jobs_fts "
+                   "JOIN jobs ON jobs.rowid = jobs_fts.rowid "
+                   "WHERE jobs_fts MATCH :match AND jobs.found_at >= :since")
+        count = f"SELECT count(*) FROM ({matches})"
+        params['since'] = since
+
+    total = session.execute(text(count), params).scalar()
+    rows = session.execute(text(
+        "SELECT jobs.id, jobs.title, jobs.company, jobs.location, jobs.url, jobs.found_at "
+        f"FROM ({matches} ORDER BY rank LIMIT :limit OFFSET :offset) AS hits "
+        "JOIN jobs ON jobs.rowid = hits.rowid ORDER BY hits.rank"
+    ), params).all()
+
+    hits = [SearchHit(id=row[0], title=row[1], company=row[2], location=row[3], url=row[4],
+                      found_at=_as_datetime(row[5])) for row in rows]
+    return SearchPage(hits, total, page, per_page)
+
+def _as_datetime(value) -> Optional[datetime]:
+    # Raw SQL gets SQLite's text timestamps back
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
@@ -0,0 +1,88 @@
+"""
+Seen-job filters handed to scrapers at cycle start.
+
+In-process parsers (board APIs, inline parsing) check each card's job id
+against the filter and drop known jobs before building a JobData. Pages parsed
+in the parse pool come back whole and are filtered in the scraper
+(BaseScraper.drop_seen): the filter runs to megabytes for a large history, too
+much to pickle to a worker with every page. Small histories use an exact set;
+large ones a Bloom filter. A Bloom false positive drops a new job, so the
+error rate is kept very low.
+The cycle still confirms survivors against the database, so a filter never
+lets a known job through twice.
+"""
+import os
+import math
+import hashlib
+from typing import Iterable, Optional
+
+from .database import ArchivedJob, Job, JobDuplicate
+
+class ExactSeenFilter:
+    def __init__(self, ids: Iterable[str] = ()):
+        self._ids = set(ids)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._ids
+
+    def add(self, job_id: str):
+        self._ids.add(job_id)
+
+    def update(self, job_ids: Iterable[str]):
+        self._ids.update(job_ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+class BloomSeenFilter:
+    """Bloom filter sized for `capacity` ids at `error_rate`, with double hashing."""
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        capacity = max(1, capacity)
+        self.size = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, job_id: str):
+        digest = hashlib.blake2b(job_id.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+    def __contains__(self, job_id: str) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(job_id))
+
+    def add(self, job_id: str):
+        for p in self._positions(job_id):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def update(self, job_ids: Iterable[str]):
+        for job_id in job_ids:
+            self.add(job_id)
+
+    def __len__(self):
+        return self.count
+
+def load_seen_filter(session_factory, exact_limit: Optional[int] = None, error_rate: float = 1e-4,
+                     headroom: float = 1.5):
+    """
+    Every stored, archived and folded-duplicate job id, as an exact set up to
+    `exact_limit` ids (SEEN_FILTER_EXACT_LIMIT, default 20k) and a Bloom filter
+    beyond, sized with headroom for the jobs the cycle will add.
+    """
+    if exact_limit is None:
+        exact_limit = int(os.getenv("SEEN_FILTER_EXACT_LIMIT", "20000"))
+    columns = (Job.id, JobDuplicate.id, ArchivedJob.id)
+    session = session_factory()
+    try:
+        total = sum(session.query(column).count() for column in columns)
+        seen = (ExactSeenFilter() if total <= exact_limit
+                else BloomSeenFilter(int(total * headroom), error_rate))
+        for column in columns:
+            seen.update(job_id for (job_id,) in session.query(column).yield_per(10000))
+    finally:
+        session.close()
+    return seen
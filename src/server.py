@@ -1,9 +1,15 @@
 import os
+import re
 import logging
+from datetime import datetime, timedelta
+from typing import Optional
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from .database import init_db
 from .subscription_manager import SubscriptionManager
+from .taxonomy import current_taxonomy
+from .search import search_jobs
+from .slack_bot import escape_mrkdwn
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -24,18 +30,6 @@ app = App(token=os.environ.get("SLACK_BOT_TOKEN"))
 Session = init_db()
 sub_manager = SubscriptionManager(Session)
 
-CATEGORIES = {
-    'aerospace': 'Rockets, avionics, propulsion, and defense.',
-    'software': 'Development, data science, AI, and engineering.',
-    'automotive': 'Autonomous vehicles, ADAS, and EVs.',
-    'finance': 'Banking, trading, audit, and analysis.',
-    'manufacturing': 'Production, supply chain, and operations.',
-    'ece hardware': 'Circuits, FPGA, embedded systems, and electronics.',
-    'semiconductors': 'Chip design, lithography, FAB, and VLSI.',
-    'general': 'Business, marketing, HR, and sales.',
-    'other': 'Miscellaneous roles.'
-}
-
 @app.command("/subscribe")
 def handle_subscribe(ack, respond, command):
     ack()
@@ -45,7 +39,8 @@ def handle_subscribe(ack, respond, command):
     if not text:
         # Show help with categories
         msg = "*Available Job Categories:*\n"
-        for cat, desc in CATEGORIES.items():
+        # Straight from taxonomy.json, so edits show up without restarting the server
+        for cat, desc in current_taxonomy().descriptions.items():
             msg += f"• *{cat}*: {desc}\n"
         
         msg += "\nUsage: `/subscribe <category>`"
@@ -91,6 +86,44 @@ def handle_list_subs(ack, respond, command):
     finally:
         session.close()
 
+SEARCH_PAGE_SIZE = 10
+SEARCH_OPTION = re.compile(r'\b(page|days):(\d+)\b')
+
+def parse_search_text(text: str):
+    """"fpga intern days:30 page:2" -> ("fpga intern", 2, 30)."""
+    options = {name: int(value) for name, value in SEARCH_OPTION.findall(text)}
+    query = ' '.join(SEARCH_OPTION.sub('', text).split())
+    return query, options.get('page', 1), options.get('days')
+
+def format_search_results(query: str, results, days: Optional[int] = None) -> str:
+    if not results.hits:
+        return f"No jobs found for `{query}`."
+    lines = [f"*{results.total} jobs matching `{query}`* (page {results.page}/{results.pages})"]
+    for hit in results.hits:
+        found = f" · found {hit.found_at:%b %d, %Y}" if hit.found_at else ""
+        lines.append(f"• <{hit.url}|{escape_mrkdwn(hit.title)}> — {escape_mrkdwn(hit.company)}"
+                     f" | {escape_mrkdwn(hit.location or 'n/a')}{found}")
+    if results.page < results.pages:
+        window = f" days:{days}" if days else ""
+        lines.append(f"\nNext page: `/search {query}{window} page:{results.page + 1}`")
+    return "\n".join(lines)
+
+@app.command("/search")
+def handle_search(ack, respond, command):
+    ack()
+    query, page, days = parse_search_text(command['text'].strip())
+    if not query:
+        respond("Usage: `/search <keywords> [days:30] [page:2]`, e.g. `/search fpga intern days:30`")
+        return
+
+    since = datetime.utcnow() - timedelta(days=days) if days else None
+    session = Session()
+    try:
+        results = search_jobs(session, query, page=page, per_page=SEARCH_PAGE_SIZE, since=since)
+    finally:
+        session.close()
+    respond(format_search_results(query, results, days))
+
 if __name__ == "__main__":
     # Start Socket Mode
     # Requires SLACK_APP_TOKEN environment variable
@@ -1,16 +1,99 @@
 import os
+import inspect
+import asyncio
+from typing import List, Optional, Tuple
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 from dotenv import load_dotenv
 import pathlib
+from .slack_limiter import shared_slack_limiter
 
 env_path = pathlib.Path(__file__).parent / '.env'
 load_dotenv(dotenv_path=env_path)
 
+# Slack accepts at most 50 blocks per message and 3000 characters per section text.
+# Digests also stay under a total character budget so one message remains readable.
+MAX_BLOCKS = 50
+MAX_SECTION_CHARS = 3000
+MAX_DIGEST_CHARS = 12000
+MAX_FALLBACK_CHARS = 3000
+
+def digest_channels_from_env() -> set:
+    """SLACK_DIGEST_CHANNELS="C123,C456" (or "*" for every channel) post digests instead of one message per job."""
+    return {c.strip() for c in os.getenv("SLACK_DIGEST_CHANNELS", "").split(",") if c.strip()}
+
+def escape_mrkdwn(text) -> str:
+    return str(text or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def digest_job_block(job_data, tags: list) -> dict:
+    """One section per job: linked title, company | location, tags."""
+    tag_str = " ".join(f"#{tag}" for tag in tags)
+    title = escape_mrkdwn(job_data.title)[:300]
+    text = f"*<{job_data.url}|{title}>*\n{escape_mrkdwn(job_data.company)} | {escape_mrkdwn(job_data.location)}"
+    if tag_str:
+        text += f"  {tag_str}"
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text[:MAX_SECTION_CHARS]}}
+
+def mention_blocks(user_ids) -> List[dict]:
+    """The message's mentions, grouped, split over as few sections as fit."""
+    blocks, line = [], "*Heads up:*"
+    for uid in sorted(user_ids):
+        mention = f" <@{uid}>"
+        if len(line) + len(mention) > MAX_SECTION_CHARS:
+            blocks.append(line)
+            line = "*Heads up (cont.):*"
+        line += mention
+    if user_ids:
+        blocks.append(line)
+    return [{"type": "section", "text": {"type": "mrkdwn", "text": text}} for text in blocks]
+
+def block_chars(blocks: List[dict]) -> int:
+    return sum(len(block["text"]["text"]) for block in blocks if "text" in block)
+
+def digest_blocks(entries: List[Tuple[object, list, list]]) -> List[dict]:
+    """One digest message for (job_data, tags, subscriber ids) entries: a header, one section per job, the mentions."""
+    header = {"type": "section", "text": {"type": "mrkdwn",
+              "text": f"*{len(entries)} new job{'s' if len(entries) != 1 else ''}*"}}
+    users = set().union(*(subscribers for _, _, subscribers in entries))
+    return [header] + [digest_job_block(job_data, tags) for job_data, tags, _ in entries] + mention_blocks(users)
+
+def split_digest(entries: List[Tuple[object, list, list]], max_blocks: int = MAX_BLOCKS,
+                 max_chars: int = MAX_DIGEST_CHARS) -> List[list]:
+    """
+    Group entries, in order, into as few messages as fit. A message is closed
+    before the job that would push it past `max_blocks` or `max_chars`
+    (mentions included), never in the middle of a job.
+    """
+    groups, group = [], []
+    for entry in entries:
+        candidate = digest_blocks(group + [entry])
+        if group and (len(candidate) > max_blocks or block_chars(candidate) > max_chars):
+            groups.append(group)
+            group = []
+        group.append(entry)
+    if group:
+        groups.append(group)
+    return groups
+
+def pack_digest(entries: List[Tuple[object, list, list]], max_blocks: int = MAX_BLOCKS,
+                max_chars: int = MAX_DIGEST_CHARS) -> List[List[dict]]:
+    """The blocks of each digest message for `entries`, see split_digest()."""
+    return [digest_blocks(group) for group in split_digest(entries, max_blocks, max_chars)]
+
+def digest_fallback_text(blocks: List[dict]) -> str:
+    """Plain-text version for notifications: the header line."""
+    return blocks[0]["text"]["text"].strip("*")[:MAX_FALLBACK_CHARS]
+
 class SlackBot:
-    def __init__(self, token=None, channel=None, subscription_manager=None):
+    def __init__(self, token=None, channel=None, subscription_manager=None, limiter=None,
+                 digest: Optional[bool] = None):
         self.token = token or os.getenv("SLACK_BOT_TOKEN")
         self.channel = channel or os.getenv("SLACK_CHANNEL")
+        if digest is None:
+            channels = digest_channels_from_env()
+            digest = "*" in channels or self.channel in channels
+        # Digest channels get many jobs per message (post_digest) instead of one each (post_job)
+        self.digest = digest
         # If no token, we are in dry run mode
         if self.token:
             # Fix for SSL Cert Error on some Macs/Environments
@@ -23,12 +106,15 @@ class SlackBot:
             self.client = None
             
         self.sub_manager = subscription_manager
+        # Paces and retries Web API calls per (method, channel), see slack_limiter.py
+        self.limiter = limiter or shared_slack_limiter()
 
     async def post_message(self, text: str) -> str:
         """Post a simple message and return its timestamp (ts) for threading."""
         if self.client:
             try:
-                response = await self.client.chat_postMessage(
+                response = await self.limiter.call(
+                    'chat.postMessage', self.channel, self.client.chat_postMessage,
                     channel=self.channel,
                     text=text
                 )
@@ -38,9 +124,67 @@ class SlackBot:
                 return None
         return None
 
-    async def post_job(self, job_data, tags: list, thread_ts: str = None):
+    async def update_message(self, ts: str, text: str):
+        """Replace the text of a message posted earlier (e.g. the cycle's parent message)."""
+        if self.client and ts:
+            try:
+                await self.limiter.call('chat.update', self.channel, self.client.chat_update,
+                                        channel=self.channel, ts=ts, text=text)
+            except SlackApiError as e:
+                print(f"Error updating message: {e.response['error']}")
+
+    async def subscribers_for(self, tags: list) -> list:
+        if not self.sub_manager:
+            return []
+        subscribers = self.sub_manager.get_subscribers_for_tags(tags)
+        if inspect.isawaitable(subscribers):
+            # AsyncSubscriptionManager, doesn't block the event loop
+            subscribers = await subscribers
+        return subscribers or []
+
+    async def post_digest(self, jobs: List[Tuple[object, list]], thread_ts: str = None) -> int:
+        """
+        Post (job_data, tags) pairs packed into as few messages as Slack's
+        limits allow, mentions grouped per message. Returns messages sent.
+        """
+        if not jobs:
+            return 0
+        groups = await self.digest_groups(jobs)
+        for group in groups:
+            await self.post_digest_message(group, thread_ts)
+        return len(groups)
+
+    async def digest_groups(self, jobs: List[Tuple[object, list]]) -> List[list]:
+        """(job_data, tags) pairs with their subscribers, grouped one list per digest message."""
+        subscribers = await asyncio.gather(*[self.subscribers_for(tags) for _, tags in jobs])
+        return split_digest([(job_data, tags, subs) for (job_data, tags), subs in zip(jobs, subscribers)])
+
+    async def post_digest_message(self, group: list, thread_ts: str = None) -> bool:
+        """Post one group from digest_groups(). True once Slack accepted it."""
+        blocks = digest_blocks(group)
+        if self.client:
+            try:
+                await self.limiter.call(
+                    'chat.postMessage', self.channel, self.client.chat_postMessage,
+                    channel=self.channel,
+                    blocks=blocks,
+                    text=digest_fallback_text(blocks),
+                    thread_ts=thread_ts
+                )
+            except SlackApiError as e:
+                print(f"Error posting digest to Slack: {e.response['error']}")
+                return False
+        else:
+            print("--- [DRY RUN] SLACK DIGEST ---")
+            print(f"Parent Thread: {thread_ts}")
+            for block in blocks:
+                print(block["text"]["text"])
+            print("------------------------------")
+        return True
+
+    async def post_job(self, job_data, tags: list, thread_ts: str = None) -> bool:
         """
-        Post a job to Slack.
+        Post a job to Slack. Returns False if Slack rejected it.
         tags: list of strings (e.g. ['aerospace', 'finance'])
         thread_ts: Optional timestamp of parent message to thread this reply under.
         """
@@ -48,11 +192,10 @@ class SlackBot:
         
         # Calculate Mentions
         mentions_str = ""
-        if self.sub_manager:
-            subscribers = self.sub_manager.get_subscribers_for_tags(tags)
-            if subscribers:
-                mentions_str = " ".join([f"<@{uid}>" for uid in subscribers])
-                mentions_str = f"\n*Heads up:* {mentions_str}"
+        subscribers = await self.subscribers_for(tags)
+        if subscribers:
+            mentions_str = " ".join([f"<@{uid}>" for uid in subscribers])
+            mentions_str = f"\n*Heads up:* {mentions_str}"
         
         message_blocks = [
             {
@@ -86,11 +229,9 @@ class SlackBot:
         
         if self.client:
             try:
-                # Rate limit protection: 1 msg/sec limit usually
-                import asyncio
-                await asyncio.sleep(1.2)
-                
-                await self.client.chat_postMessage(
+                # Bursts go straight out, then ~1/s per channel; 429s wait for Retry-After and retry
+                await self.limiter.call(
+                    'chat.postMessage', self.channel, self.client.chat_postMessage,
                     channel=self.channel,
                     blocks=message_blocks,
                     text=f"New Job: {job_data.title}", # Fallback text
@@ -98,6 +239,7 @@ class SlackBot:
                 )
             except SlackApiError as e:
                 print(f"Error posting to Slack: {e.response['error']}")
+                return False
         else:
             print("--- [DRY RUN] SLACK POST ---")
             print(f"Parent Thread: {thread_ts}")
@@ -107,3 +249,4 @@ class SlackBot:
             print(f"Mentions: {mentions_str}")
             print(f"URL: {job_data.url}")
             print("----------------------------")
+        return True
@@ -0,0 +1,122 @@
+"""
+Rate limiting for Slack Web API calls.
+
+Slack enforces limits per method and, for chat.postMessage, per channel
+(about one message a second, with short bursts allowed). Each (method, channel)
+gets its own TokenBucket, so a burst of posts goes out at once and the rest
+queue at the steady rate while several calls are in flight. A 429 pauses that
+key for its Retry-After and the call is retried; transient failures (5xx,
+connection errors) are retried with exponential backoff.
+"""
+import os
+import time
+import random
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import aiohttp
+from slack_sdk.errors import SlackApiError
+
+from .rate_limiter import TokenBucket
+
+# (rate per second, burst) per channel
+DEFAULT_METHOD_LIMITS = {
+    'chat.postMessage': (1.0, 4),
+    'chat.update': (0.8, 3), # Tier 3, ~50 per minute
+}
+
+def retry_after_of(error: SlackApiError) -> Optional[float]:
+    """Seconds from a 429's Retry-After header, if any."""
+    headers = getattr(error.response, 'headers', None) or {}
+    for name, value in headers.items():
+        if name.lower() == 'retry-after':
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+class SlackRateLimiter:
+    def __init__(self, method_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 default_limit: Tuple[float, int] = (1.0, 2), max_retries: int = 5,
+                 base_backoff: float = 1.0, max_backoff: float = 60.0,
+                 clock=time.monotonic, sleep=asyncio.sleep):
+        self.method_limits = dict(DEFAULT_METHOD_LIMITS, **(method_limits or {}))
+        self.default_limit = default_limit
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self.logger = logging.getLogger("SlackRateLimiter")
+
+    def _bucket(self, key: Tuple[str, str]) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self.method_limits.get(key[0], self.default_limit)
+            bucket = TokenBucket(rate, burst, self.clock)
+            self._buckets[key] = bucket
+        return bucket
+
+    def delay_for(self, method: str, channel: str) -> float:
+        """Reserve a slot for one call and return the seconds to wait before making it."""
+        return self._bucket((method, channel)).reserve()
+
+    def pause(self, method: str, channel: str, seconds: float):
+        """
+        Hold calls for this key for `seconds` (Slack said so). The bucket is
+        left with one token and its refill pushed past the pause, so waiting
+        callers then go out one by one at the normal rate rather than all at once.
+        """
+        bucket = self._bucket((method, channel))
+        bucket.tokens = min(bucket.tokens, 1)
+        bucket.updated = max(bucket.updated, self.clock() + seconds)
+
+    def backoff(self, attempt: int) -> float:
+        return min(self.max_backoff, self.base_backoff * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+    async def call(self, method: str, channel: str, send: Callable[..., Awaitable], /, **kwargs):
+        """
+        await send(**kwargs) within the limits for (method, channel), retrying
+        429s, 5xx and connection errors up to max_retries times. Other Slack
+        errors (channel_not_found, invalid_blocks...) are raised right away.
+        """
+        attempt = 0
+        while True:
+            wait = self.delay_for(method, channel)
+            if wait > 0:
+                await self.sleep(wait)
+            try:
+                return await send(**kwargs)
+            except SlackApiError as e:
+                status = getattr(e.response, 'status_code', None)
+                if status != 429 and (status is None or status < 500):
+                    raise
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff(attempt)
+                if status == 429:
+                    # Pause the whole key so concurrent calls wait too; the retry's delay_for() waits it out
+                    retry_after = retry_after_of(e)
+                    self.pause(method, channel, retry_after if retry_after is not None else delay)
+                    delay = 0
+                self.logger.warning(f"{method} to {channel} failed with {status}, retrying")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff(attempt)
+                self.logger.warning(f"{method} to {channel} failed ({e!r}), retrying in {delay:.1f}s")
+            attempt += 1
+            if delay > 0:
+                await self.sleep(delay)
+
+_shared_limiter = None
+
+def shared_slack_limiter() -> SlackRateLimiter:
+    """Process-wide, so every SlackBot posting to a channel shares its budget."""
+    global _shared_limiter
+    if _shared_limiter is None:
+        _shared_limiter = SlackRateLimiter(max_retries=int(os.getenv("SLACK_MAX_RETRIES", "5")))
+    return _shared_limiter
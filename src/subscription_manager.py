@@ -1,23 +1,128 @@
-from sqlalchemy.orm import Session
-from .database import Subscription
+import time
+import asyncio
 import logging
+import threading
+from typing import Dict, Iterable, Optional, Set
+from sqlalchemy.orm import Session
+from .database import Subscription, bump_version, read_version
+
+# meta counter bumped by every subscription write, in the same transaction
+SUBSCRIPTIONS_VERSION = 'subscriptions'
+
+# Query bodies take a sync Session so the blocking manager and the async one
+# (through AsyncSession.run_sync) run exactly the same code.
+
+def add_subscription(session: Session, user_id: str, interest: str) -> bool:
+    """Stage a subscription; False if the user already has it."""
+    # ID is composite of user_id + interest to enforce uniqueness
+    sub_id = f"{user_id}:{interest}"
+    if session.get(Subscription, sub_id) is not None:
+        return False
+    session.add(Subscription(id=sub_id, user_id=user_id, interest=interest))
+    bump_version(session, SUBSCRIPTIONS_VERSION)
+    return True
+
+def remove_subscription(session: Session, user_id: str, interest: str) -> int:
+    sub_id = f"{user_id}:{interest}"
+    removed = session.query(Subscription).filter_by(id=sub_id).delete()
+    if removed:
+        bump_version(session, SUBSCRIPTIONS_VERSION)
+    return removed
+
+def subscribers_for_tags(session: Session, tags: list) -> list:
+    """Unique user_ids subscribed to ANY of the tags, sorted."""
+    if not tags:
+        return []
+    # Note: tags in DB are lowercase usually, ensure matching logic
+    tags_lower = [t.lower() for t in tags]
+    rows = session.query(Subscription.user_id).filter(Subscription.interest.in_(tags_lower)).distinct()
+    return sorted(user_id for (user_id,) in rows)
+
+def user_subscriptions(session: Session, user_id: str) -> list:
+    rows = session.query(Subscription.interest).filter_by(user_id=user_id).order_by(Subscription.interest)
+    return [interest for (interest,) in rows]
+
+class SubscriberIndex:
+    """
+    tag -> user ids, mirrored from the subscriptions table so mention lookups
+    are a few set unions instead of a query per posted job. Writes made through
+    the owning manager are applied in place; writes from another process (the
+    Slack server vs the scraper) are noticed through the meta version counter,
+    read at most every `check_interval` seconds.
+    """
+    def __init__(self, check_interval: float = 2.0, clock=time.monotonic):
+        self.check_interval = check_interval
+        self.clock = clock
+        self.version = None
+        self._by_tag: Optional[Dict[str, Set[str]]] = None
+        self._stale = False # Out of step with the table, reload on the next lookup
+        self._checked = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._by_tag is not None
+
+    def due(self) -> bool:
+        return not self.loaded or self._stale or self.clock() - self._checked >= self.check_interval
+
+    def refresh(self, session: Session) -> bool:
+        """Reload from the table if its version moved since the last load. Takes a sync Session (run_sync-able)."""
+        self._checked = self.clock()
+        version = read_version(session, SUBSCRIPTIONS_VERSION)
+        if self.loaded and not self._stale and version == self.version:
+            return False
+        by_tag = {}
+        for user_id, interest in session.query(Subscription.user_id, Subscription.interest):
+            by_tag.setdefault(interest, set()).add(user_id)
+        # Queries happen outside the lock: under run_sync they may yield to the event loop
+        with self._lock:
+            self._by_tag = by_tag
+            self._stale = False
+            self.version = version
+        return True
+
+    def subscribers(self, tags: Iterable[str]) -> list:
+        """Unique user_ids subscribed to ANY of the tags, sorted."""
+        users = set()
+        with self._lock:
+            by_tag = self._by_tag or {}
+            for tag in tags:
+                users |= by_tag.get(tag.lower(), set())
+        return sorted(users)
+
+    def applied(self, version: int, user_id: str, interest: str, subscribed: bool):
+        """Apply a write this process just committed, which moved the counter to `version`."""
+        with self._lock:
+            if not self.loaded:
+                return
+            if self._stale or version != self.version + 1:
+                # Someone else wrote in between: keep serving the old map until the next lookup reloads it
+                self._stale = True
+                return
+            if subscribed:
+                self._by_tag.setdefault(interest, set()).add(user_id)
+            else:
+                users = self._by_tag.get(interest, set())
+                users.discard(user_id)
+                if not users:
+                    self._by_tag.pop(interest, None)
+            self.version = version
 
 class SubscriptionManager:
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, check_interval: float = 2.0):
         self.Session = session_factory
         self.logger = logging.getLogger("SubscriptionManager")
+        self.index = SubscriberIndex(check_interval)
 
     def add_subscription(self, user_id: str, interest: str):
         """Subscribe a user to a specific interest/tag."""
         session = self.Session()
         try:
-            # ID is composite of user_id + interest to enforce uniqueness
-            sub_id = f"{user_id}:{interest}"
-            existing = session.query(Subscription).filter_by(id=sub_id).first()
-            if not existing:
-                new_sub = Subscription(id=sub_id, user_id=user_id, interest=interest)
-                session.add(new_sub)
+            if add_subscription(session, user_id, interest):
+                version = read_version(session, SUBSCRIPTIONS_VERSION)
                 session.commit()
+                self.index.applied(version, user_id, interest, True)
                 self.logger.info(f"Subscribed {user_id} to {interest}")
             else:
                 self.logger.info(f"User {user_id} already subscribed to {interest}")
@@ -31,9 +136,10 @@ class SubscriptionManager:
         """Unsubscribe a user from an interest."""
         session = self.Session()
         try:
-            sub_id = f"{user_id}:{interest}"
-            session.query(Subscription).filter_by(id=sub_id).delete()
-            session.commit()
+            if remove_subscription(session, user_id, interest):
+                version = read_version(session, SUBSCRIPTIONS_VERSION)
+                session.commit()
+                self.index.applied(version, user_id, interest, False)
             self.logger.info(f"Unsubscribed {user_id} from {interest}")
         except Exception as e:
              self.logger.error(f"Error removing subscription: {e}")
@@ -44,24 +150,86 @@ class SubscriptionManager:
     def get_subscribers_for_tags(self, tags: list) -> list:
         """
         Return a list of unique user_ids that are subscribed to ANY of the provided tags.
+        Served from the in-memory index; the database is only asked for its version.
         """
         if not tags:
             return []
-            
+
+        if self.index.due():
+            session = self.Session()
+            try:
+                self.index.refresh(session)
+            except Exception as e:
+                self.logger.error(f"Error getting subscribers: {e}")
+                if not self.index.loaded:
+                    return []
+            finally:
+                session.close()
+        return self.index.subscribers(tags)
+
+    def get_user_subscriptions(self, user_id: str) -> list:
+        """Interests the user is subscribed to."""
         session = self.Session()
-        subscribers = set()
         try:
-            # Find subscriptions where interest matches any of the tags
-            # Note: tags in DB are lowercase usually, ensure matching logic
-            tags_lower = [t.lower() for t in tags]
-            
-            subs = session.query(Subscription).filter(Subscription.interest.in_(tags_lower)).all()
-            for sub in subs:
-                subscribers.add(sub.user_id)
-                
-        except Exception as e:
-            self.logger.error(f"Error getting subscribers: {e}")
+            return user_subscriptions(session, user_id)
         finally:
             session.close()
-            
-        return list(subscribers)
+
+class AsyncSubscriptionManager:
+    """
+    Same API as SubscriptionManager, awaitable, over an async_sessionmaker
+    (see async_database.init_async_db). Used from the event loop (SlackBot) so
+    subscriber lookups don't stall the scrapers.
+    """
+    def __init__(self, async_session_factory, check_interval: float = 2.0):
+        self.Session = async_session_factory
+        self.logger = logging.getLogger("SubscriptionManager")
+        self.index = SubscriberIndex(check_interval)
+        # Lookups for a whole digest arrive at once; only one of them reloads
+        self._refresh_lock = asyncio.Lock()
+
+    async def add_subscription(self, user_id: str, interest: str):
+        async with self.Session() as session:
+            try:
+                if await session.run_sync(add_subscription, user_id, interest):
+                    version = await session.run_sync(read_version, SUBSCRIPTIONS_VERSION)
+                    await session.commit()
+                    self.index.applied(version, user_id, interest, True)
+                    self.logger.info(f"Subscribed {user_id} to {interest}")
+                else:
+                    self.logger.info(f"User {user_id} already subscribed to {interest}")
+            except Exception as e:
+                self.logger.error(f"Error adding subscription: {e}")
+                await session.rollback()
+
+    async def remove_subscription(self, user_id: str, interest: str):
+        async with self.Session() as session:
+            try:
+                if await session.run_sync(remove_subscription, user_id, interest):
+                    version = await session.run_sync(read_version, SUBSCRIPTIONS_VERSION)
+                    await session.commit()
+                    self.index.applied(version, user_id, interest, False)
+                self.logger.info(f"Unsubscribed {user_id} from {interest}")
+            except Exception as e:
+                self.logger.error(f"Error removing subscription: {e}")
+                await session.rollback()
+
+    async def get_subscribers_for_tags(self, tags: list) -> list:
+        if not tags:
+            return []
+        if self.index.due():
+            async with self._refresh_lock:
+                # Another lookup may have refreshed while this one waited
+                if self.index.due():
+                    async with self.Session() as session:
+                        try:
+                            await session.run_sync(self.index.refresh)
+                        except Exception as e:
+                            self.logger.error(f"Error getting subscribers: {e}")
+                            if not self.index.loaded:
+                                return []
+        return self.index.subscribers(tags)
+
+    async def get_user_subscriptions(self, user_id: str) -> list:
+        async with self.Session() as session:
+            return await session.run_sync(user_subscriptions, user_id)
@@ -0,0 +1,110 @@
+"""
+Job category taxonomy.
+
+src/taxonomy.json (or TAXONOMY_PATH) is the single source for categories, their
+terms, exclusions and Slack descriptions, plus the intern/new-grad relevance
+terms. It is compiled once into KeywordClassifiers; the shared TaxonomyIndex
+re-stats the file at most every `check_interval` seconds and, when the mtime
+moves, compiles the new version and swaps it in as one object. A file that
+fails to load is logged and the previous version stays in service.
+"""
+import os
+import json
+import time
+import logging
+import pathlib
+import threading
+from typing import Dict, List, Optional
+
+from .classifier import KeywordClassifier
+
+DEFAULT_TAXONOMY_PATH = pathlib.Path(__file__).parent / 'taxonomy.json'
+
+logger = logging.getLogger("Taxonomy")
+
+class Taxonomy:
+    """One compiled version of the taxonomy file. Immutable once built."""
+    def __init__(self, data: dict, mtime: float = 0.0):
+        categories = data['categories']
+        self.fallback: Optional[str] = data.get('fallback', 'other')
+        self.terms: Dict[str, List[str]] = {name: list(spec['terms']) for name, spec in categories.items()}
+        self.exclusions: Dict[str, List[str]] = {
+            name: list(spec['exclude']) for name, spec in categories.items() if spec.get('exclude')
+        }
+        self.descriptions: Dict[str, str] = {name: spec.get('description', '') for name, spec in categories.items()}
+        if self.fallback:
+            self.descriptions[self.fallback] = data.get('fallback_description', '')
+        self.mtime = mtime
+
+        self.classifier = KeywordClassifier(self.terms, self.exclusions, fallback=self.fallback)
+        relevance = data.get('relevance', {})
+        self.relevance = KeywordClassifier({
+            'include': relevance.get('include', []),
+            'exclude': relevance.get('exclude', []),
+        }, fallback=None)
+
+    @classmethod
+    def from_file(cls, path) -> 'Taxonomy':
+        path = pathlib.Path(path)
+        mtime = path.stat().st_mtime
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f), mtime)
+
+    def categories(self) -> List[str]:
+        """Subscribable tags, fallback included."""
+        return list(self.descriptions)
+
+    def is_relevant(self, title: str) -> bool:
+        tags = self.relevance.classify(title)
+        return 'include' in tags and 'exclude' not in tags
+
+class TaxonomyIndex:
+    """Holds the current Taxonomy and reloads it when the file changes on disk."""
+    def __init__(self, path=None, check_interval: float = 2.0, clock=time.monotonic):
+        self.path = pathlib.Path(path or os.getenv("TAXONOMY_PATH") or DEFAULT_TAXONOMY_PATH)
+        self.check_interval = check_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._current = Taxonomy.from_file(self.path)
+        self._mtime = self._current.mtime
+        self._checked = clock()
+
+    def current(self) -> Taxonomy:
+        """The live taxonomy; cheap enough to call per page (a stat every check_interval at most)."""
+        if self.clock() - self._checked >= self.check_interval:
+            self.reload_if_changed()
+        return self._current
+
+    def reload_if_changed(self) -> bool:
+        with self._lock:
+            self._checked = self.clock()
+            try:
+                mtime = self.path.stat().st_mtime
+            except OSError as e:
+                logger.warning(f"Cannot stat taxonomy {self.path}: {e}")
+                return False
+            if mtime == self._mtime:
+                return False
+            # Remember the mtime even if the load fails, so a broken file isn't retried on every check
+            self._mtime = mtime
+            try:
+                taxonomy = Taxonomy.from_file(self.path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.error(f"Keeping previous taxonomy, failed to load {self.path}: {e}")
+                return False
+            # Readers grab self._current once per call, so they see the old or the new version, never a mix
+            self._current = taxonomy
+            logger.info(f"Reloaded taxonomy from {self.path} ({len(taxonomy.terms)} categories)")
+            return True
+
+_shared_index = None
+
+def shared_taxonomy() -> TaxonomyIndex:
+    """Process-wide index, so scrapers, the cycle and the Slack server share one compiled copy."""
+    global _shared_index
+    if _shared_index is None:
+        _shared_index = TaxonomyIndex()
+    return _shared_index
+
+def current_taxonomy() -> Taxonomy:
+    return shared_taxonomy().current()
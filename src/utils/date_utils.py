@@ -1,12 +1,110 @@
 import re
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
 
-def parse_job_date(date_str: str) -> Optional[datetime]:
+# Listing pages repeat a handful of strings ("Just posted", "3 days ago") thousands
+# of times, so the parse of a normalized string is cached. The cached value never
+# depends on the clock: it is a spec that _resolve() turns into a datetime for `now`.
+CACHE_SIZE = 4096
+
+NOW_TERMS = re.compile(r'just posted|today|hours? ago|minutes? ago')
+DAYS_AGO = re.compile(r'(\d+)\s+days?')
+SHORT_DAYS_AGO = re.compile(r'(\d+)d')
+DATE_PREFIX = re.compile(r'^(?:posted|date|on)\s+')
+WHITESPACE = re.compile(r'\s+')
+
+ISO_DATE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')             # 2024-01-01
+SLASH_DATE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')           # 01/01/2024 (US, then UK)
+MONTH_DATE = re.compile(r'^([a-z]{3}) (\d{1,2})(?:, (\d{4}))?$')    # Jan 01, 2024 / Jan 01
+
+MONTHS = {name: index for index, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1)}
+
+# ('ago', days) | ('date', datetime) | ('no_year', month, day) | None
+DateSpec = Optional[Tuple]
+
+def normalize_date_string(date_str: str) -> str:
+    return WHITESPACE.sub(' ', date_str.lower().strip())
+
+def _build_date(year: int, month: int, day: int) -> Optional[datetime]:
+    try:
+        return datetime(year, month, day)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_normalized(term: str) -> DateSpec:
+    # 1. Handle "Just posted", "Today", "Active x hours ago"
+    if NOW_TERMS.search(term):
+        return ('ago', 0)
+
+    if 'yesterday' in term:
+        return ('ago', 1)
+
+    # 2. Handle "30+ days ago" -> Treat as 31 days just to be safe (it's definitely > 7)
+    if '30+' in term:
+        return ('ago', 31)
+
+    # 3. Handle "X days ago", "posted 14 days ago"
+    days_match = DAYS_AGO.search(term)
+    if days_match:
+        return ('ago', int(days_match.group(1)))
+
+    # 4. Handle "Xd ago" common on some mobile views
+    short_days_match = SHORT_DAYS_AGO.search(term)
+    if short_days_match:
+        return ('ago', int(short_days_match.group(1)))
+
+    # 5. Handle Absolute Dates
+    # Remove "Posted" or "Date:" prefix if any
+    cleaned_date = DATE_PREFIX.sub('', term).strip()
+
+    match = ISO_DATE.match(cleaned_date)
+    if match:
+        dt = _build_date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        return ('date', dt) if dt else None
+
+    match = SLASH_DATE.match(cleaned_date)
+    if match:
+        first, second, year = (int(part) for part in match.groups())
+        # US month/day first, UK day/month if that isn't a valid date
+        dt = _build_date(year, first, second) or _build_date(year, second, first)
+        return ('date', dt) if dt else None
+
+    match = MONTH_DATE.match(cleaned_date)
+    if match and match.group(1) in MONTHS:
+        month, day = MONTHS[match.group(1)], int(match.group(2))
+        if match.group(3):
+            dt = _build_date(int(match.group(3)), month, day)
+            return ('date', dt) if dt else None
+        # No year: resolved against `now`
+        return ('no_year', month, day)
+
+    return None
+
+def _resolve(spec: DateSpec, now: datetime) -> Optional[datetime]:
+    if spec is None:
+        return None
+    kind = spec[0]
+    if kind == 'ago':
+        return now - timedelta(days=spec[1])
+    if kind == 'date':
+        return spec[1]
+    # Assume the current year; if that makes it in the future (e.g. scraped in Jan,
+    # posted in Dec), it was last year
+    _, month, day = spec
+    dt = _build_date(now.year, month, day)
+    if dt is None or dt > now + timedelta(days=1):  # buffer
+        dt = _build_date(now.year - 1, month, day)
+    return dt
+
+def parse_job_date(date_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
     """
     Parse a date string from a job board into a datetime object.
     Returns None if the date cannot be parsed.
-    
+    Relative dates are counted back from `now` (default: datetime.utcnow()).
+
     Supported formats:
     - "3 days ago"
     - "30+ days ago"
@@ -18,67 +116,9 @@ def parse_job_date(date_str: str) -> Optional[datetime]:
     """
     if not date_str:
         return None
-        
-    term = date_str.lower().strip()
-    now = datetime.utcnow()
-    
-    # 1. Handle "Just posted", "Today", "Active x days ago"
-    if any(x in term for x in ['just posted', 'today', 'hours ago', 'minutes ago']):
-        return now
-        
-    if 'yesterday' in term:
-        return now - timedelta(days=1)
-        
-    # 2. Handle "30+ days ago" -> Treat as 31 days just to be safe (it's definitely > 7)
-    if '30+' in term:
-        return now - timedelta(days=31)
-        
-    # 3. Handle "X days ago"
-    # Match "3 days ago", "posted 14 days ago"
-    days_match = re.search(r'(\d+)\s+days?', term)
-    if days_match:
-        try:
-            days = int(days_match.group(1))
-            return now - timedelta(days=days)
-        except ValueError:
-            pass
-
-    # 4. Handle "Xd ago" common on some mobile views
-    short_days_match = re.search(r'(\d+)d', term)
-    if short_days_match:
-         try:
-            days = int(short_days_match.group(1))
-            return now - timedelta(days=days)
-         except ValueError:
-            pass
+    return _resolve(_parse_normalized(normalize_date_string(date_str)), now or datetime.utcnow())
 
-    # 5. Handle Absolute Dates
-    # Try common formats
-    # Note: If no year is present, we might assume current year or check past/future?
-    # Simple approach: try parsing
-    
-    # Remove "Posted" or "Date:" prefix if any
-    cleaned_date = re.sub(r'^(posted|date|on)\s+', '', term, flags=re.IGNORECASE).strip()
-    
-    formats = [
-        '%b %d, %Y',       # Jan 01, 2024
-        '%Y-%m-%d',        # 2024-01-01
-        '%m/%d/%Y',        # 01/01/2024
-        '%d/%m/%Y',        # 01/01/2024 (UK) - less likely for US boards but possible
-        '%b %d'            # Jan 01 (Implies current year mostly)
-    ]
-    
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(cleaned_date, fmt)
-            # If format had no year, it defaults to 1900.
-            if dt.year == 1900:
-                dt = dt.replace(year=now.year)
-                # If that makes it in the future (e.g. scraped in Jan, posted in Dec), subtract a year
-                if dt > now + timedelta(days=1): # buffer
-                    dt = dt.replace(year=now.year - 1)
-            return dt
-        except ValueError:
-            continue
-            
-    return None
+def parse_job_dates(date_strs: Iterable[Optional[str]], now: Optional[datetime] = None) -> List[Optional[datetime]]:
+    """parse_job_date() over a batch, every relative date counted from the same `now`."""
+    now = now or datetime.utcnow()
+    return [parse_job_date(date_str, now) for date_str in date_strs]
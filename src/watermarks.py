@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Dict, Iterable, List
+import logging
+from .database import CrawlWatermark
+
+class WatermarkStore:
+    """
+    Per-source / per-search-term record of the newest job IDs already crawled.
+    Loaded once at cycle start; IDs seen during the crawl are held in memory and
+    only written by commit() once the cycle has stored its jobs, so a crashed
+    cycle never hides jobs from the next one.
+    """
+    def __init__(self, session_factory, keep: int = 500):
+        self.Session = session_factory
+        self.keep = keep
+        self._known: Dict[str, set] = {}
+        self._pending: Dict[str, List[str]] = {}
+        self.logger = logging.getLogger("WatermarkStore")
+
+    def load(self):
+        """Read every watermark in one query."""
+        session = self.Session()
+        try:
+            self._known = {row.key: set(row.job_ids or []) for row in session.query(CrawlWatermark).all()}
+        finally:
+            session.close()
+        self._pending = {}
+
+    def all_known(self, key: str, job_ids: Iterable[str]) -> bool:
+        """True if there is at least one ID and every one of them was seen by a previous crawl."""
+        known = self._known.get(key)
+        job_ids = list(job_ids)
+        if not known or not job_ids:
+            return False
+        return all(job_id in known for job_id in job_ids)
+
+    def observe(self, key: str, job_ids: Iterable[str]):
+        """Remember IDs seen this crawl, in crawl (newest first) order."""
+        pending = self._pending.setdefault(key, [])
+        pending.extend(job_ids)
+
+    def commit(self):
+        """Merge this crawl's IDs in front of the stored ones and persist them."""
+        if not self._pending:
+            return
+        session = self.Session()
+        try:
+            for key, seen in self._pending.items():
+                row = session.get(CrawlWatermark, key)
+                if row is None:
+                    row = CrawlWatermark(key=key, job_ids=[])
+                    session.add(row)
+                merged = list(dict.fromkeys(seen + list(row.job_ids or [])))[:self.keep]
+                row.job_ids = merged
+                row.updated_at = datetime.utcnow()
+                self._known[key] = set(merged)
+            session.commit()
+            self._pending = {}
+        except Exception as e:
+            self.logger.error(f"Error saving watermarks: {e}")
+            session.rollback()
+        finally:
+            session.close()
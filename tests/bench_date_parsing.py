@@ -0,0 +1,50 @@
+"""
+Benchmark parse_job_date on a listing-sized batch of date strings.
+
+Run from the repo root:
+    python tests/bench_date_parsing.py [iterations]
+
+Compares a cold cache (every string parsed from scratch) with the warm LRU
+cache, per call and through parse_job_dates().
+"""
+import sys
+import os
+import timeit
+from datetime import datetime
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.date_utils import parse_job_date, parse_job_dates, _parse_normalized
+
+# What a few result pages look like: a handful of distinct strings, repeated
+SAMPLES = ["Just posted", "Today", "1 day ago", "3 days ago", "Posted 14 days ago", "30+ days ago",
+           "Yesterday", "2d ago", "Jan 05, 2025", "2025-01-05", "1/5/2025", "Dec 20", "Recently"]
+BATCH = SAMPLES * 400
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    now = datetime(2025, 3, 10)
+    print(f"{len(BATCH)} strings, {iterations} iterations\n")
+
+    def cold():
+        for date_str in BATCH:
+            _parse_normalized.cache_clear()
+            parse_job_date(date_str, now)
+
+    def warm():
+        for date_str in BATCH:
+            parse_job_date(date_str, now)
+
+    def batch():
+        parse_job_dates(BATCH, now)
+
+    baseline = None
+    for name, func in [('cold cache', cold), ('warm cache', warm), ('parse_job_dates', batch)]:
+        func()
+        seconds = min(timeit.repeat(func, number=1, repeat=iterations))
+        baseline = baseline or seconds
+        print(f"{name:<18}{seconds * 1e6 / len(BATCH):>8.2f} us/string{baseline / seconds:>8.1f}x")
+
+if __name__ == '__main__':
+    main()
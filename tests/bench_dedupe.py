@@ -0,0 +1,71 @@
+"""
+Benchmark the cycle's dedupe + insert against a large jobs table.
+
+Run from the repo root:
+    python tests/bench_dedupe.py [history_rows] [page_size]
+
+Seeds a temporary jobs.db with `history_rows` jobs (default 100k), then stores
+a batch where half the jobs are already known, once the old way (a query and
+session.add per job) and once with existing_job_ids() + insert_jobs().
+"""
+import sys
+import os
+import time
+import tempfile
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database import init_db, existing_job_ids, insert_jobs, Job
+
+def job_row(n, prefix='job'):
+    return dict(id=f"{prefix}{n}", company="Bench", title=f"Software Intern {n}",
+                location="Remote", url=f"https://example.com/{prefix}/{n}", tags=['software'])
+
+def seed(Session, rows):
+    session = Session()
+    for start in range(0, rows, 10000):
+        insert_jobs(session, [job_row(n) for n in range(start, min(rows, start + 10000))])
+    session.commit()
+    session.close()
+
+def per_row(Session, batch):
+    session = Session()
+    for row in batch:
+        if session.query(Job).filter_by(id=row['id']).first():
+            continue
+        session.add(Job(**row))
+    session.rollback()
+    session.close()
+
+def bulk(Session, batch):
+    session = Session()
+    known = existing_job_ids(session, [row['id'] for row in batch])
+    insert_jobs(session, [row for row in batch if row['id'] not in known])
+    session.rollback()
+    session.close()
+
+def main():
+    history = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Session = init_db(os.path.join(tmpdir, 'jobs.db'))
+        seed(Session, history)
+        # Half already stored, half new
+        batch = [job_row(n) for n in range(history - page_size // 2, history)]
+        batch += [job_row(n, 'new') for n in range(page_size // 2)]
+
+        print(f"{history} stored jobs, batch of {len(batch)}\n")
+        baseline = None
+        for name, func in [('query + add per job', per_row), ('chunked IN + bulk insert', bulk)]:
+            timings = []
+            for _ in range(3):
+                started = time.perf_counter()
+                func(Session, batch)
+                timings.append(time.perf_counter() - started)
+            seconds = min(timings)
+            baseline = baseline or seconds
+            print(f"{name:<28}{seconds * 1000:>9.1f} ms{baseline / seconds:>8.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark the HTML parser backends on the stored result pages.
+
+Run from the repo root:
+    python tests/bench_parsers.py [iterations]
+
+Prints the mean time per page for every installed backend and checks that all
+of them return the same JobData as html.parser. Set HTML_PARSER to the winner.
+"""
+import sys
+import os
+import timeit
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.html_backend import available_backends
+from src.scrapers.boeing_scraper import parse_boeing_results
+from src.scrapers.simplyhired_scraper import parse_simplyhired_results
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+PAGES = [
+    ('boeing_results.html', lambda html, backend: parse_boeing_results(html, "Boeing", backend=backend)),
+    ('simplyhired_results.html', lambda html, backend: parse_simplyhired_results(html, backend=backend)),
+]
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    backends = available_backends()
+    print(f"Backends: {', '.join(backends)} ({iterations} iterations each)\n")
+    print(f"{'page':<28}{'backend':<14}{'ms/page':>10}{'speedup':>10}  jobs")
+
+    for filename, parse in PAGES:
+        with open(os.path.join(FIXTURES, filename), encoding='utf-8') as f:
+            html = f.read()
+
+        reference = parse(html, 'html.parser')
+        baseline = None
+        for backend in reversed(backends):  # html.parser first, it's the baseline
+            result = parse(html, backend)
+            status = len(result) if result == reference else f"{len(result)} MISMATCH"
+            seconds = min(timeit.repeat(lambda: parse(html, backend), number=iterations, repeat=3)) / iterations
+            baseline = baseline or seconds
+            print(f"{filename:<28}{backend:<14}{seconds * 1000:>10.2f}{baseline / seconds:>9.1f}x  {status}")
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark /search queries on a large jobs table.
+
+Run from the repo root:
+    python tests/bench_search.py [rows]
+
+Seeds a temporary jobs.db with `rows` jobs (default 300k, indexed by the FTS
+triggers as they are inserted) and times a few typical searches, first page
+and a deep page, against a LIKE scan of the same table.
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import text
+from src.database import init_db, insert_jobs
+from src.search import search_jobs
+
+FIELDS = ['Software', 'Hardware', 'FPGA', 'Propulsion', 'Finance', 'Supply Chain', 'Avionics', 'Data Science']
+KINDS = ['Intern', 'Internship', 'Co-op', 'Engineer I', 'Analyst']
+COMPANIES = ['Boeing', 'SpaceX', 'Anduril', 'Lockheed Martin', 'Northrop Grumman', 'Tesla', 'Intel', 'Goldman Sachs']
+CITIES = ['Seattle, WA', 'Arlington, VA', 'Hawthorne, CA', 'Austin, TX', 'New York, NY', 'Huntsville, AL']
+
+QUERIES = ['fpga intern', 'propulsion', 'goldman analyst new york', 'supply chain co-op austin', 'fpga intern 42 seattle']
+
+def seed(Session, rows):
+    rng = random.Random(7)
+    session = Session()
+    for start in range(0, rows, 20000):
+        insert_jobs(session, [dict(
+            id=f"job{n}", title=f"{rng.choice(FIELDS)} {rng.choice(KINDS)} {n % 97}",
+            company=rng.choice(COMPANIES), location=rng.choice(CITIES), url=f"https://example.com/{n}"
+        ) for n in range(start, min(rows, start + 20000))])
+    session.commit()
+    session.close()
+
+def timed(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, result
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Session = init_db(os.path.join(tmpdir, 'jobs.db'))
+        started = time.perf_counter()
+        seed(Session, rows)
+        print(f"Seeded {rows} jobs in {time.perf_counter() - started:.1f}s\n")
+        print(f"{'query':<30}{'page 1':>10}{'page 20':>10}{'LIKE scan':>11}  matches")
+
+        session = Session()
+        for query in QUERIES:
+            first, results = timed(lambda: search_jobs(session, query))
+            deep, _ = timed(lambda: search_jobs(session, query, page=20))
+            pattern = f"%{query.split()[0]}%"
+            like, _ = timed(lambda: session.execute(text(
+                "SELECT count(*) FROM jobs WHERE title LIKE :p OR company LIKE :p OR location LIKE :p"
+            ), {'p': pattern}).all(), repeat=2)
+            print(f"{query:<30}{first:>8.1f}ms{deep:>8.1f}ms{like:>9.1f}ms  {results.total}")
+        session.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+import unittest
+import asyncio
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import database
+from src import async_database
+from src.subscription_manager import SubscriptionManager, AsyncSubscriptionManager
+
+def rows(prefix, found_at):
+    return [dict(id=f"{prefix}{n}", company="Co", title=f"Intern {n}", url=f"https://example.com/{prefix}/{n}",
+                 tags=['software', 'finance'][:n % 2 + 1], found_at=found_at - timedelta(days=n))
+            for n in range(6)]
+
+class TestSyncAsyncParity(unittest.TestCase):
+    """The same operations through database.py and async_database.py, on separate temp DBs."""
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.sync_path = os.path.join(self.tmpdir.name, 'sync.db')
+        self.async_path = os.path.join(self.tmpdir.name, 'async.db')
+        self.now = datetime(2025, 3, 10)
+
+    def tearDown(self):
+        database.dispose_engines()
+        asyncio.run(async_database.dispose_async_engines())
+        self.tmpdir.cleanup()
+
+    def run_sync(self):
+        Session = database.init_db(self.sync_path)
+        session = Session()
+        try:
+            first = database.insert_jobs(session, rows("a", self.now))
+            second = database.insert_jobs(session, rows("a", self.now)[:2] + rows("b", self.now)[:2])
+            session.commit()
+            known = database.existing_job_ids(session, ["a1", "b1", "zz"])
+            recent = [job.id for job in database.jobs_with_tag_since(session, 'finance', self.now - timedelta(days=4))]
+            counts = database.tag_counts(session)
+        finally:
+            session.close()
+
+        manager = SubscriptionManager(Session)
+        manager.add_subscription("U1", "software")
+        manager.add_subscription("U2", "finance")
+        manager.add_subscription("U2", "finance")
+        manager.add_subscription("U3", "software")
+        manager.remove_subscription("U3", "software")
+        subscribers = manager.get_subscribers_for_tags(['software', 'FINANCE'])
+        subs = manager.get_user_subscriptions("U2")
+        return first, second, known, recent, counts, subscribers, subs
+
+    async def run_async(self):
+        Session = await async_database.init_async_db(self.async_path)
+        async with Session() as session:
+            first = await async_database.insert_jobs(session, rows("a", self.now))
+            second = await async_database.insert_jobs(session, rows("a", self.now)[:2] + rows("b", self.now)[:2])
+            await session.commit()
+            known = await async_database.existing_job_ids(session, ["a1", "b1", "zz"])
+            recent = [job.id for job in await async_database.jobs_with_tag_since(
+                session, 'finance', self.now - timedelta(days=4))]
+            counts = await async_database.tag_counts(session)
+
+        manager = AsyncSubscriptionManager(Session)
+        await manager.add_subscription("U1", "software")
+        await manager.add_subscription("U2", "finance")
+        await manager.add_subscription("U2", "finance")
+        await manager.add_subscription("U3", "software")
+        await manager.remove_subscription("U3", "software")
+        subscribers = await manager.get_subscribers_for_tags(['software', 'FINANCE'])
+        subs = await manager.get_user_subscriptions("U2")
+        return first, second, known, recent, counts, subscribers, subs
+
+    def test_identical_results(self):
+        sync_result = self.run_sync()
+        async_result = asyncio.run(self.run_async())
+        self.assertEqual(sync_result, async_result)
+        first, second, known, recent, counts, subscribers, subs = sync_result
+        self.assertEqual(len(first), 6)
+        self.assertEqual(second, {"b0", "b1"})
+        self.assertEqual(known, {"a1", "b1"})
+        self.assertEqual(recent, ["a1", "b1", "a3"])
+        self.assertEqual(subscribers, ["U1", "U2"])
+        self.assertEqual(subs, ["finance"])
+
+    def test_async_engine_pragmas(self):
+        async def check():
+            await async_database.init_async_db(self.async_path)
+            async with async_database.get_async_engine(self.async_path).connect() as conn:
+                return (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+        self.assertEqual(asyncio.run(check()), 'wal')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+import asyncio
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+
+from aiohttp import web
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fetcher import PageFetcher
+from src.rate_limiter import HostRateLimiter
+from src.scrapers.greenhouse_scraper import GreenhouseScraper
+from src.scrapers.lever_scraper import LeverScraper
+
+def greenhouse_board(token):
+    return {"jobs": [
+        {"id": 101, "title": "Software Engineering Intern", "company_name": f"{token.title()} Inc",
+         "absolute_url": f"https://boards.greenhouse.io/{token}/jobs/101",
+         "location": {"name": "Hawthorne, CA"}, "first_published": "2025-01-05T10:00:00-05:00",
+         "updated_at": "2025-01-20T10:00:00-05:00"},
+        {"id": 102, "title": "Senior Staff Engineer", "absolute_url": f"https://boards.greenhouse.io/{token}/jobs/102",
+         "location": {"name": "Remote"}, "updated_at": "2025-01-05T10:00:00-05:00"},
+    ]}
+
+def lever_board(token):
+    return [
+        {"id": "a1b2-c3", "text": "Hardware Intern", "hostedUrl": f"https://jobs.lever.co/{token}/a1b2-c3",
+         "categories": {"location": "Austin, TX"}, "createdAt": 1736071200000},
+        {"id": "d4e5-f6", "text": "Director of Sales", "hostedUrl": f"https://jobs.lever.co/{token}/d4e5-f6",
+         "categories": {}, "createdAt": 1736071200000},
+    ]
+
+class StandInBoards:
+    """Local stand-in for the Greenhouse and Lever board APIs that tracks concurrency."""
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+
+    async def track(self, builder, token):
+        self.requests += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        if token.startswith("missing"):
+            raise web.HTTPNotFound()
+        if token.startswith("throttled"):
+            raise web.HTTPServiceUnavailable()
+        return web.json_response(builder(token))
+
+    async def greenhouse(self, request):
+        return await self.track(greenhouse_board, request.match_info['token'])
+
+    async def lever(self, request):
+        self.last_query = dict(request.query)
+        return await self.track(lever_board, request.match_info['token'])
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/v1/boards/{token}/jobs', self.greenhouse)
+        app.router.add_get('/v0/postings/{token}', self.lever)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f'http://127.0.0.1:{port}'
+
+class TestBoardApiScrapers(unittest.TestCase):
+    def run_scraper(self, scraper_cls, path, tokens, **kwargs):
+        async def run():
+            server = StandInBoards()
+            base = await server.start()
+            fetcher = PageFetcher(None, rate_limiter=HostRateLimiter(rate=1000, burst=1000))
+            scraper = scraper_cls(None, fetcher=fetcher, board_tokens=tokens, base_url=f"{base}{path}", **kwargs)
+            try:
+                jobs = await scraper.scrape()
+            finally:
+                await fetcher.close()
+                await server.runner.cleanup()
+            return server, jobs
+
+        return asyncio.run(run())
+
+    def test_greenhouse_mapping(self):
+        server, jobs = self.run_scraper(GreenhouseScraper, '/v1/boards', ["spacex"])
+        self.assertEqual(len(jobs), 1)
+        job = jobs[0]
+        self.assertEqual(job.title, "Software Engineering Intern")
+        self.assertEqual(job.company, "Spacex Inc")
+        self.assertEqual(job.job_id, "101")
+        self.assertEqual(job.location, "Hawthorne, CA")
+        self.assertEqual(job.date_posted, "2025-01-05")
+
+    def test_lever_mapping(self):
+        server, jobs = self.run_scraper(LeverScraper, '/v0/postings', ["anduril"],
+                                        company_names={"anduril": "Anduril Industries"})
+        self.assertEqual(server.last_query, {"mode": "json"})
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0].company, "Anduril Industries")
+        self.assertEqual(jobs[0].job_id, "a1b2-c3")
+        self.assertEqual(jobs[0].url, "https://jobs.lever.co/anduril/a1b2-c3")
+        self.assertEqual(jobs[0].date_posted, "2025-01-05")
+
+    def test_ids_are_stable_across_urls(self):
+        _, first = self.run_scraper(GreenhouseScraper, '/v1/boards', ["spacex"])
+        _, second = self.run_scraper(GreenhouseScraper, '/v1/boards', ["spacex"])
+        second[0].url += "?gh_src=slack"
+        self.assertEqual(first[0].id, second[0].id)
+
+    def test_many_boards_with_concurrency_limit(self):
+        tokens = [f"company{i}" for i in range(60)] + ["missing-board"]
+        server, jobs = self.run_scraper(GreenhouseScraper, '/v1/boards', tokens, max_concurrency=8)
+        self.assertEqual(server.requests, 61)
+        self.assertEqual(server.peak, 8)
+        # The 404 board is skipped, everything else comes through
+        self.assertEqual(len(jobs), 60)
+        self.assertEqual(len({job.id for job in jobs}), 60)
+
+    def test_failures_are_reported_as_such(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            _, jobs = self.run_scraper(GreenhouseScraper, '/v1/boards', ["missing-board", "throttled-board"])
+        self.assertEqual(jobs, [])
+        self.assertIn("No board found for missing-board", output.getvalue())
+        self.assertIn("throttled-board unavailable (HTTP 503)", output.getvalue())
+        self.assertNotIn("No board found for throttled-board", output.getvalue())
+
+    def test_no_tokens_no_requests(self):
+        server, jobs = self.run_scraper(GreenhouseScraper, '/v1/boards', [])
+        self.assertEqual(server.requests, 0)
+        self.assertEqual(jobs, [])
+
+if __name__ == '__main__':
+    unittest.main()
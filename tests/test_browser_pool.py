@@ -0,0 +1,121 @@
+import unittest
+import asyncio
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.browser_manager import BrowserManager
+
+# Minimal stand-ins for the Playwright objects the pool touches
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        pass
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts_created = 0
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **kwargs):
+        self.contexts_created += 1
+        ctx = FakeContext()
+        async def add_init_script(script):
+            pass
+        ctx.add_init_script = add_init_script
+        return ctx
+
+class TestBrowserPool(unittest.TestCase):
+    def make_manager(self, pool_size=2, max_uses=3):
+        bm = BrowserManager(pool_size=pool_size, max_uses=max_uses)
+        bm.playwright = object()  # Skip launching a real browser in init()
+        bm.browser = FakeBrowser()
+        return bm
+
+    def test_contexts_are_reused(self):
+        async def run():
+            bm = self.make_manager()
+            for _ in range(3):
+                async with bm.lease_page():
+                    pass
+            return bm.browser.contexts_created
+
+        self.assertEqual(asyncio.run(run()), 1)
+
+    def test_recycle_after_max_uses(self):
+        async def run():
+            bm = self.make_manager(pool_size=1, max_uses=2)
+            for _ in range(5):
+                async with bm.lease_page():
+                    pass
+            return bm.browser.contexts_created
+
+        # Uses 1-2 on the first context, 3-4 on the second, 5 on the third
+        self.assertEqual(asyncio.run(run()), 3)
+
+    def test_unhealthy_page_is_replaced(self):
+        async def run():
+            bm = self.make_manager(pool_size=1)
+            async with bm.lease_page() as page:
+                page.closed = True
+            async with bm.lease_page() as page:
+                self.assertFalse(page.closed)
+            return bm.browser.contexts_created
+
+        self.assertEqual(asyncio.run(run()), 2)
+
+    def test_pool_size_bounds_concurrent_leases(self):
+        async def run():
+            # No recycling here, so contexts_created only reflects the concurrency bound
+            bm = self.make_manager(pool_size=2, max_uses=1000)
+            active = 0
+            peak = 0
+
+            async def worker():
+                nonlocal active, peak
+                async with bm.lease_page():
+                    active += 1
+                    peak = max(peak, active)
+                    await asyncio.sleep(0.01)
+                    active -= 1
+
+            await asyncio.gather(*[worker() for _ in range(6)])
+            return peak, bm.browser.contexts_created
+
+        peak, created = asyncio.run(run())
+        self.assertEqual(peak, 2)
+        self.assertEqual(created, 2)
+
+    def test_failed_lease_discards_context(self):
+        async def run():
+            bm = self.make_manager(pool_size=1)
+            with self.assertRaises(RuntimeError):
+                async with bm.lease_page():
+                    raise RuntimeError("navigation failed")
+            async with bm.lease_page():
+                pass
+            return bm.browser.contexts_created
+
+        self.assertEqual(asyncio.run(run()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
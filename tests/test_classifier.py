@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.classifier import KeywordClassifier
+from src.scraper_engine import interest_classifier, is_relevant_role
+
+class TestKeywordClassifier(unittest.TestCase):
+    def test_short_terms_need_word_boundaries(self):
+        classifier = interest_classifier()
+        self.assertEqual(classifier.classify("Maintenance Technician"), ['other'])   # 'ai'
+        self.assertEqual(classifier.classify("Web Developer"), ['software'])         # 'ev'
+        self.assertEqual(classifier.classify("Career Fair Coordinator"), ['other'])  # 'car'
+        self.assertEqual(classifier.classify("Performance Engineer"), ['other'])     # 'rf'
+        self.assertEqual(classifier.classify("AI/ML Intern"), ['software'])
+        self.assertEqual(classifier.classify("EV Charging Intern"), ['automotive'])
+
+    def test_plurals_prefixes_and_hyphens(self):
+        classifier = interest_classifier()
+        self.assertIn('automotive', classifier.classify("Electric Vehicles Intern"))
+        self.assertIn('aerospace', classifier.classify("Defence Systems Intern"))
+        self.assertIn('software', classifier.classify("Data Scientist Intern"))
+        self.assertIn('software', classifier.classify("Cybersecurity Intern"))
+        self.assertIn('manufacturing', classifier.classify("Supply-Chain Intern"))
+
+    def test_batch_matches_single(self):
+        classifier = interest_classifier()
+        titles = ["Software Engineer Intern", "Finance Intern", "Barista", "",
+                  "Embedded Software Intern", "Aerospace Supply Chain Intern"]
+        self.assertEqual(classifier.classify_many(titles), [classifier.classify(t) for t in titles])
+
+    def test_batch_offsets_survive_case_folding_length_changes(self):
+        # 'İ'.lower() is two characters, which used to shift every later title's matches
+        classifier = interest_classifier()
+        titles = ['İ' * 20 + ' Office Clerk', 'Marketing Intern', 'Software Intern']
+        self.assertEqual(classifier.classify_many(titles), [classifier.classify(t) for t in titles])
+        self.assertIn('software', classifier.classify_many(titles)[2])
+        self.assertNotIn('software', classifier.classify_many(titles)[1])
+
+    def test_nested_terms_and_exclusions(self):
+        classifier = KeywordClassifier(
+            {'data': ['data'], 'science': ['data science']},
+            exclusions={'data': ['database']},
+            fallback=None
+        )
+        self.assertEqual(classifier.classify("Data Science Intern"), ['data', 'science'])
+        self.assertEqual(classifier.classify("Database Data Intern"), [])
+        self.assertEqual(classifier.classify("Cook"), [])
+
+    def test_relevance(self):
+        self.assertTrue(is_relevant_role("Software Engineering Intern"))
+        self.assertTrue(is_relevant_role("Summer Internship 2025"))
+        self.assertTrue(is_relevant_role("Co-op Student, Manufacturing"))
+        self.assertFalse(is_relevant_role("International Relations Analyst"))
+        self.assertFalse(is_relevant_role("Internal Audit Intern Lead"))
+        self.assertFalse(is_relevant_role("Senior Software Engineer"))
+
+if __name__ == '__main__':
+    unittest.main()
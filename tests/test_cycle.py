@@ -0,0 +1,119 @@
+import unittest
+import asyncio
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import main
+from src import database
+from src import async_database
+from src.database import Job, OutboxEntry
+from src.scraper_engine import BaseScraper, JobData
+
+def job(n, company="Acme", date_posted="Today"):
+    return JobData(title=f"Software Engineering Intern {n}", company=company,
+                   url=f"https://{company.lower()}.com/jobs/{n}", location="Remote",
+                   date_posted=date_posted, job_id=str(n))
+
+class FakeScraper(BaseScraper):
+    def __init__(self, pages, **kwargs):
+        super().__init__("Fake", None, **kwargs)
+        self.pages = pages
+
+    async def iter_pages(self):
+        for page in self.pages:
+            yield list(page)
+
+class FakeBrowserManager:
+    async def close(self):
+        pass
+
+class FakeDispatcher:
+    """Records what the cycle tells it instead of posting to Slack."""
+    def __init__(self):
+        self.events = []
+
+    def begin_cycle(self):
+        self.events.append('begin')
+
+    def wake(self):
+        self.events.append('wake')
+
+    async def end_cycle(self):
+        self.events.append('end')
+
+class TestScraperCycle(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'jobs.db')
+        env = mock.patch.dict(os.environ, {"JOBS_DB_PATH": self.db_path})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        database.dispose_engines()
+        self.tmpdir.cleanup()
+
+    def run_cycle(self, pages, **patches):
+        dispatcher = FakeDispatcher()
+
+        def create_scrapers(browser_manager, only=None, **kwargs):
+            return [FakeScraper(pages, **kwargs)]
+
+        async def run():
+            try:
+                with mock.patch.multiple(main, create_scrapers=create_scrapers, **patches):
+                    await main.run_scraper_cycle(FakeBrowserManager(), dispatcher=dispatcher)
+            finally:
+                await async_database.dispose_async_engines()
+
+        asyncio.run(run())
+        return dispatcher.events
+
+    def stored(self):
+        session = database.init_db(self.db_path)()
+        try:
+            return (sorted(job_id for (job_id,) in session.query(Job.id)),
+                    sorted(job_id for (job_id,) in session.query(OutboxEntry.job_id)))
+        finally:
+            session.close()
+
+    def test_stores_and_queues_new_jobs_once(self):
+        pages = [
+            [job(1), job(2), job(3, date_posted="30+ days ago")],
+            [job(2), job(4)], # job 2 again, e.g. on the next results page
+        ]
+        events = self.run_cycle(pages)
+        new_ids = sorted(job(n).id for n in (1, 2, 4))
+        jobs, outbox = self.stored()
+        self.assertEqual(jobs, new_ids)
+        # Every stored job is queued for Slack, and nothing else; the old one is neither
+        self.assertEqual(outbox, new_ids)
+        self.assertEqual(events, ['begin', 'wake', 'wake', 'end'])
+
+        # Next cycle sees the same listings: nothing stored, queued or woken
+        events = self.run_cycle(pages)
+        self.assertEqual(self.stored(), (jobs, outbox))
+        self.assertEqual(events, ['begin', 'end'])
+
+    def test_jobs_and_outbox_rows_commit_together(self):
+        enqueue = main.enqueue_notifications
+        calls = []
+
+        async def failing_enqueue(session, rows, now=None):
+            calls.append(len(rows))
+            if len(calls) == 2:
+                raise RuntimeError("disk full")
+            return await enqueue(session, rows, now)
+
+        with self.assertRaises(RuntimeError):
+            self.run_cycle([[job(1)], [job(2)]], enqueue_notifications=failing_enqueue)
+        # The first page is committed whole; the second neither stored nor queued
+        self.assertEqual(self.stored(), ([job(1).id], [job(1).id]))
+
+if __name__ == '__main__':
+    unittest.main()
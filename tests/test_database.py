@@ -0,0 +1,161 @@
+import unittest
+import sys
+import os
+import tempfile
+import pickle
+import sqlite3
+import threading
+from unittest import mock
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database import (init_db, get_engine, dispose_engines, existing_job_ids, insert_jobs, jobs_with_tag_since, tag_counts,
+                          Job, JobDuplicate, JobTag)
+
+def row(job_id, url=None):
+    return dict(id=job_id, company="Test Co", title="Intern", location="Remote",
+                url=url or f"https://example.com/{job_id}", tags=['software'])
+
+class TestBulkDedupe(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.Session = init_db(os.path.join(self.tmpdir.name, 'jobs.db'))
+        self.session = self.Session()
+
+    def tearDown(self):
+        self.session.close()
+        self.tmpdir.cleanup()
+
+    def test_existing_ids_in_chunks(self):
+        insert_jobs(self.session, [row(f"job{n}") for n in range(0, 30, 2)])
+        self.session.add(JobDuplicate(id="dup", canonical_id="job0"))
+        self.session.commit()
+        candidates = [f"job{n}" for n in range(30)] + ["dup", "job1"]
+        expected = {f"job{n}" for n in range(0, 30, 2)} | {"dup"}
+        self.assertEqual(existing_job_ids(self.session, candidates, chunk_size=4), expected)
+        self.assertEqual(existing_job_ids(self.session, []), set())
+
+    def test_insert_skips_conflicts(self):
+        self.assertEqual(insert_jobs(self.session, [row("a"), row("b")]), {"a", "b"})
+        # Same id, and a new id reusing a stored url, are both skipped
+        inserted = insert_jobs(self.session, [row("a"), row("c", url="https://example.com/b"), row("d")])
+        self.assertEqual(inserted, {"d"})
+        self.session.commit()
+        self.assertEqual(self.session.query(Job).count(), 3)
+        self.assertEqual(self.session.get(Job, "d").tags, ['software'])
+        self.assertIsNotNone(self.session.get(Job, "d").found_at)
+        self.assertEqual(insert_jobs(self.session, []), set())
+
+class TestJobTags(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'jobs.db')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_migrates_pickled_tags(self):
+        # A jobs.db written before job_tags existed
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE jobs (id VARCHAR PRIMARY KEY, company VARCHAR NOT NULL, title VARCHAR NOT NULL, "
+                     "location VARCHAR, url VARCHAR UNIQUE NOT NULL, posted_at DATETIME, found_at DATETIME, tags BLOB)")
+        conn.executemany("INSERT INTO jobs (id, company, title, url, found_at, tags) VALUES (?, 'Co', 'Intern', ?, ?, ?)", [
+            ("a", "https://a", "2025-01-01 00:00:00", pickle.dumps(['software', 'aerospace'])),
+            ("b", "https://b", "2025-01-02 00:00:00", pickle.dumps([])),
+            ("c", "https://c", "2025-01-03 00:00:00", None),
+        ])
+        conn.commit()
+        conn.close()
+
+        Session = init_db(self.db_path)
+        session = Session()
+        self.assertEqual(sorted(session.get(Job, "a").tags), ['aerospace', 'software'])
+        self.assertEqual(list(session.get(Job, "b").tags), [])
+        self.assertEqual(session.query(JobTag).count(), 2)
+        session.close()
+
+        # Idempotent, and the old column is gone
+        Session = init_db(self.db_path)
+        session = Session()
+        self.assertEqual(session.query(JobTag).count(), 2)
+        session.close()
+        conn = sqlite3.connect(self.db_path)
+        self.assertNotIn('tags', [row[1] for row in conn.execute("PRAGMA table_info(jobs)")])
+        conn.close()
+
+    def test_tag_queries(self):
+        Session = init_db(self.db_path)
+        session = Session()
+        now = datetime.utcnow()
+        insert_jobs(session, [
+            dict(row("old"), tags=['software'], found_at=now - timedelta(days=10)),
+            dict(row("new"), tags=['software', 'finance'], found_at=now - timedelta(days=1)),
+            dict(row("newest"), tags=['software'], found_at=now),
+        ])
+        session.add(Job(id="orm", company="Co", title="Intern", url="https://orm", tags=['finance']))
+        session.commit()
+
+        week_ago = now - timedelta(days=7)
+        self.assertEqual([job.id for job in jobs_with_tag_since(session, 'software', week_ago)], ["newest", "new"])
+        self.assertEqual(len(jobs_with_tag_since(session, 'software')), 3)
+        self.assertEqual(tag_counts(session), {'software': 3, 'finance': 2})
+        self.assertEqual(tag_counts(session, since=week_ago), {'software': 2, 'finance': 2})
+
+        # Tag lookups go through the (tag, job_id) index
+        plan = session.connection().exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT job_id FROM job_tags WHERE tag = 'software'").all()
+        self.assertIn('ix_job_tags_tag_job', ' '.join(str(step[-1]) for step in plan))
+        session.close()
+
+class TestEngine(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'jobs.db')
+
+    def tearDown(self):
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_shared_engine_with_pragmas(self):
+        with mock.patch.dict(os.environ, {"JOBS_DB_PATH": self.db_path}):
+            Session = init_db()
+            self.assertIs(init_db(self.db_path), Session)
+            self.assertIs(get_engine(), get_engine(self.db_path))
+        self.assertTrue(os.path.exists(self.db_path))
+
+        with get_engine(self.db_path).connect() as conn:
+            pragma = lambda name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            self.assertEqual(pragma('journal_mode'), 'wal')
+            self.assertEqual(pragma('synchronous'), 1) # NORMAL
+            self.assertEqual(pragma('busy_timeout'), 10000)
+            self.assertEqual(pragma('foreign_keys'), 1)
+
+    def test_readers_not_blocked_by_writer(self):
+        Session = init_db(self.db_path)
+        writer = Session()
+        insert_jobs(writer, [row("a")])
+        writer.commit()
+        # Open write transaction, not committed yet
+        insert_jobs(writer, [row("b")])
+
+        seen = []
+        def read():
+            reader = Session()
+            try:
+                seen.append(sorted(job_id for (job_id,) in reader.query(Job.id)))
+            finally:
+                reader.close()
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join(timeout=5)
+        self.assertEqual(seen, [["a"]])
+
+        writer.commit()
+        writer.close()
+        read()
+        self.assertEqual(seen[-1], ["a", "b"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@ import os
 # Add src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.utils.date_utils import parse_job_date
+from src.utils.date_utils import parse_job_date, parse_job_dates, _parse_normalized
 
 class TestDateParsing(unittest.TestCase):
     def test_relative_days(self):
@@ -65,5 +65,41 @@ class TestDateParsing(unittest.TestCase):
         self.assertIsNone(parse_job_date(None))
         self.assertIsNone(parse_job_date(""))
 
+    def test_explicit_now(self):
+        now = datetime(2025, 3, 10, 12, 0)
+        self.assertEqual(parse_job_date("3 days ago", now=now), datetime(2025, 3, 7, 12, 0))
+        self.assertEqual(parse_job_date("Just posted", now=now), now)
+        self.assertEqual(parse_job_date("  YESTERDAY ", now=now), datetime(2025, 3, 9, 12, 0))
+        self.assertEqual(parse_job_date("5 hours ago", now=now), now)
+        self.assertEqual(parse_job_date("Posted 2d ago", now=now), datetime(2025, 3, 8, 12, 0))
+
+    def test_cache_is_independent_of_now(self):
+        first = parse_job_date("4 days ago", now=datetime(2025, 1, 10))
+        second = parse_job_date("4 days ago", now=datetime(2025, 6, 10))
+        self.assertEqual(first, datetime(2025, 1, 6))
+        self.assertEqual(second, datetime(2025, 6, 6))
+        # Case and whitespace variants share one cache entry
+        _parse_normalized.cache_clear()
+        parse_job_dates(["4 Days  ago", "4 days ago", " 4 DAYS AGO"])
+        self.assertEqual(_parse_normalized.cache_info().currsize, 1)
+
+    def test_absolute_formats(self):
+        self.assertEqual(parse_job_date("1/5/2025"), datetime(2025, 1, 5))
+        self.assertEqual(parse_job_date("25/12/2024"), datetime(2024, 12, 25))
+        self.assertEqual(parse_job_date("Posted Jan 5, 2025"), datetime(2025, 1, 5))
+        self.assertIsNone(parse_job_date("2025-02-30"))
+        self.assertIsNone(parse_job_date("Foo 05, 2025"))
+        self.assertIsNone(parse_job_date("Recently"))
+
+    def test_date_without_year(self):
+        # Dec seen in January belongs to last year
+        self.assertEqual(parse_job_date("Dec 20", now=datetime(2025, 1, 3)), datetime(2024, 12, 20))
+        self.assertEqual(parse_job_date("Jan 02", now=datetime(2025, 1, 3)), datetime(2025, 1, 2))
+
+    def test_batch(self):
+        now = datetime(2025, 3, 10)
+        strings = ["Today", None, "3 days ago", "", "2025-01-05", "garbage"]
+        self.assertEqual(parse_job_dates(strings, now=now), [parse_job_date(s, now=now) for s in strings])
+
 if __name__ == '__main__':
     unittest.main()
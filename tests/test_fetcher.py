@@ -0,0 +1,126 @@
+import unittest
+import asyncio
+import sys
+import os
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fetcher import PageFetcher, has_selector
+from src.rate_limiter import HostRateLimiter
+
+SERVER_RENDERED = '<html><body><ul id="job-list"><li>Job</li></ul></body></html>'
+JS_SHELL = '<html><body><div id="root"></div><script src="app.js"></script></body></html>'
+
+class FakePage:
+    def __init__(self):
+        self.visited = []
+
+    async def goto(self, url, timeout=None):
+        self.visited.append(url)
+
+    async def wait_for_selector(self, selector, timeout=None):
+        pass
+
+    async def content(self):
+        return '<html><body><ul id="job-list"><li>Rendered</li></ul></body></html>'
+
+class FakeBrowserManager:
+    def __init__(self):
+        self.page = FakePage()
+
+    @asynccontextmanager
+    async def lease_page(self):
+        yield self.page
+
+class TestHasSelector(unittest.TestCase):
+    def test_id_selector(self):
+        self.assertTrue(has_selector(SERVER_RENDERED, '#job-list'))
+        self.assertFalse(has_selector(JS_SHELL, '#job-list'))
+        # Prefix of another id must not count
+        self.assertFalse(has_selector('<ul id="job-list-empty"></ul>', '#job-list'))
+        # Nor an attribute that merely ends in "id"
+        self.assertFalse(has_selector('<ul data-testid="job-list"></ul>', '#job-list'))
+        self.assertFalse(has_selector('<div data-id="job-list"></div>', '#job-list'))
+        self.assertTrue(has_selector('<ul class="x"\nid="job-list"></ul>', '#job-list'))
+
+    def test_css_selector(self):
+        self.assertTrue(has_selector(SERVER_RENDERED, 'ul#job-list li'))
+        self.assertFalse(has_selector(JS_SHELL, 'ul#job-list li'))
+
+    def test_empty(self):
+        self.assertFalse(has_selector(None, '#job-list'))
+
+class TestPageFetcher(unittest.TestCase):
+    def fast_limiter(self):
+        return HostRateLimiter(rate=1000, burst=1000, base_backoff=0)
+
+    async def start_server(self):
+        async def rendered(request):
+            return web.Response(text=SERVER_RENDERED, content_type='text/html')
+
+        async def shell(request):
+            return web.Response(text=JS_SHELL, content_type='text/html')
+
+        async def blocked(request):
+            return web.Response(status=403, text='nope')
+
+        app = web.Application()
+        app.router.add_get('/rendered', rendered)
+        app.router.add_get('/shell', shell)
+        app.router.add_get('/blocked', blocked)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return runner, f'http://127.0.0.1:{port}'
+
+    def test_http_first_then_browser_fallback(self):
+        async def run():
+            runner, base = await self.start_server()
+            bm = FakeBrowserManager()
+            fetcher = PageFetcher(bm, rate_limiter=self.fast_limiter())
+            try:
+                rendered = await fetcher.fetch(f'{base}/rendered', '#job-list')
+                shell = await fetcher.fetch(f'{base}/shell', '#job-list')
+                blocked = await fetcher.fetch(f'{base}/blocked', '#job-list')
+            finally:
+                await fetcher.close()
+                await runner.cleanup()
+            return bm.page.visited, rendered, shell, blocked, base
+
+        visited, rendered, shell, blocked, base = asyncio.run(run())
+        self.assertEqual(rendered, SERVER_RENDERED)
+        self.assertIn('Rendered', shell)
+        self.assertIn('Rendered', blocked)
+        # Only the two failing URLs went through the browser
+        self.assertEqual(visited, [f'{base}/shell', f'{base}/blocked'])
+
+    def test_host_skips_http_after_repeated_failures(self):
+        async def run():
+            runner, base = await self.start_server()
+            fetcher = PageFetcher(FakeBrowserManager(), max_http_failures=2, rate_limiter=self.fast_limiter())
+            calls = []
+            original = fetcher._fetch_http
+
+            async def counting_fetch(url):
+                calls.append(url)
+                return await original(url)
+
+            fetcher._fetch_http = counting_fetch
+            try:
+                for _ in range(4):
+                    await fetcher.fetch(f'{base}/shell', '#job-list')
+            finally:
+                await fetcher.close()
+                await runner.cleanup()
+            return calls
+
+        self.assertEqual(len(asyncio.run(run())), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.html_backend import available_backends, parse_html
+from src.scrapers.boeing_scraper import parse_boeing_results
+from src.scrapers.simplyhired_scraper import parse_simplyhired_results
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+class TestHtmlBackends(unittest.TestCase):
+    """Every installed backend must produce exactly what html.parser produces."""
+
+    def test_boeing_identical_across_backends(self):
+        html = load_fixture('boeing_results.html')
+        reference = parse_boeing_results(html, "Boeing", backend='html.parser')
+        self.assertTrue(reference)
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(parse_boeing_results(html, "Boeing", backend=backend), reference)
+
+    def test_simplyhired_identical_across_backends(self):
+        html = load_fixture('simplyhired_results.html')
+        reference = parse_simplyhired_results(html, backend='html.parser')
+        self.assertTrue(reference)
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(parse_simplyhired_results(html, backend=backend), reference)
+
+    def test_node_api(self):
+        html = '<div id="a"> <b> hi </b>\n <i>there</i> <a href="/x" data-testid="q">L</a></div>'
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                doc = parse_html(html, backend)
+                div = doc.select_one('#a')
+                self.assertEqual(div.text(), 'hithereL')
+                link = doc.select_one('[data-testid="q"]')
+                self.assertEqual(link.tag, 'a')
+                self.assertEqual(link.attr('href'), '/x')
+                self.assertIsNone(link.attr('missing'))
+                self.assertIsNone(doc.select_one('#nope'))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            parse_html('<p></p>', 'regex')
+
+if __name__ == '__main__':
+    unittest.main()
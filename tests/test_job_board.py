@@ -0,0 +1,61 @@
+import unittest
+import asyncio
+import sys
+import os
+from contextlib import asynccontextmanager
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.scraper_engine import JobData
+from src.scrapers.job_board_base import GenericJobBoardScraper
+
+class FakeBrowserManager:
+    @asynccontextmanager
+    async def lease_page(self):
+        yield object()
+
+class SlowBoardScraper(GenericJobBoardScraper):
+    """Terms finish in reverse order so the merge has to restore term order."""
+    def __init__(self, browser_manager, search_terms, max_concurrency):
+        super().__init__("Board", browser_manager, search_terms, max_concurrency=max_concurrency)
+        self.active = 0
+        self.peak = 0
+
+    async def scrape_search_term(self, search_term):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01 * (len(self.search_terms) - self.search_terms.index(search_term)))
+        self.active -= 1
+        if search_term == "broken":
+            raise RuntimeError("boom")
+        return [
+            JobData(title=f"{search_term} intern", company="Board", url=f"https://board.test/{search_term}"),
+            JobData(title="Shared intern", company="Board", url="https://board.test/shared"),
+        ]
+
+class TestConcurrentSearchTerms(unittest.TestCase):
+    def run_scraper(self, terms, max_concurrency):
+        scraper = SlowBoardScraper(FakeBrowserManager(), terms, max_concurrency)
+        jobs = asyncio.run(scraper.scrape())
+        return scraper, jobs
+
+    def test_results_merge_in_term_order(self):
+        terms = ["a", "b", "c", "d", "e"]
+        scraper, jobs = self.run_scraper(terms, max_concurrency=3)
+        titles = [job.title for job in jobs]
+        # Each term's own job in order, the shared job kept once after its first term
+        self.assertEqual(titles, ["a intern", "Shared intern", "b intern", "c intern", "d intern", "e intern"])
+
+    def test_parallelism_is_bounded(self):
+        terms = [str(i) for i in range(8)]
+        scraper, _ = self.run_scraper(terms, max_concurrency=3)
+        self.assertEqual(scraper.peak, 3)
+
+    def test_failed_term_does_not_drop_others(self):
+        scraper, jobs = self.run_scraper(["a", "broken", "c"], max_concurrency=2)
+        titles = [job.title for job in jobs]
+        self.assertEqual(titles, ["a intern", "Shared intern", "c intern"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database import init_db, insert_jobs, JobDuplicate, JobSignature
+from src.near_duplicates import LSHIndex, MinHasher, NearDuplicateIndex, job_shingles, similarity
+from src.scraper_engine import JobData
+
+def boeing(title, location="Seattle, WA", job_id="1"):
+    return JobData(title=title, company="Boeing", url=f"https://jobs.boeing.com/job/{job_id}",
+                   location=location, job_id=job_id)
+
+def simplyhired(title, location="Seattle, WA", company="The Boeing Company", key="abc"):
+    return JobData(title=title, company=company, url=f"https://www.simplyhired.com/job/{key}",
+                   location=location)
+
+class TestMinHash(unittest.TestCase):
+    def test_similarity_tracks_jaccard(self):
+        hasher = MinHasher()
+        left = job_shingles(boeing("Propulsion Engineering Intern"))
+        right = job_shingles(simplyhired("Intern - Propulsion Engineering"))
+        self.assertEqual(left, right)
+        self.assertEqual(similarity(hasher.signature(left), hasher.signature(right)), 1.0)
+
+        other = job_shingles(boeing("Hardware Engineering Intern"))
+        self.assertLess(similarity(hasher.signature(left), hasher.signature(other)), 0.85)
+
+    def test_lsh_candidates(self):
+        hasher = MinHasher()
+        index = LSHIndex()
+        index.add("a", hasher.signature(job_shingles(boeing("Software Engineering Intern"))))
+        index.add("b", hasher.signature(job_shingles(boeing("Finance Analyst Intern", "New York, NY"))))
+        candidates = index.candidates(hasher.signature(job_shingles(simplyhired("Software Engineering Intern"))))
+        self.assertIn("a", candidates)
+        self.assertNotIn("b", candidates)
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.Session = init_db(os.path.join(self.tmpdir.name, 'jobs.db'))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_persists_between_cycles_and_links_duplicates(self):
+        original = boeing("Software Engineering Intern")
+        index = NearDuplicateIndex(self.Session)
+        index.load()
+        session = self.Session()
+        self.assertIsNone(index.find_duplicate(original))
+        index.add(session, original)
+        session.commit()
+        session.close()
+
+        # Next cycle starts from the stored signatures
+        index = NearDuplicateIndex(self.Session)
+        index.load()
+        copy = simplyhired("Software Engineering Intern")
+        canonical_id, score = index.find_duplicate(copy)
+        self.assertEqual(canonical_id, original.id)
+        self.assertGreaterEqual(score, 0.85)
+
+        session = self.Session()
+        index.link(session, copy, canonical_id, score)
+        session.commit()
+        self.assertEqual(session.get(JobDuplicate, copy.id).canonical_id, original.id)
+        self.assertEqual(session.query(JobSignature).count(), 1)
+        session.close()
+
+    def test_ignores_same_source_and_different_jobs(self):
+        index = NearDuplicateIndex(self.Session)
+        session = self.Session()
+        index.add(session, boeing("Software Engineering Intern", job_id="1"))
+        # Two requisitions on the same site are both real
+        self.assertIsNone(index.find_duplicate(boeing("Software Engineering Intern", job_id="2")))
+        self.assertIsNone(index.find_duplicate(simplyhired("Software Engineering Intern", "Arlington, VA")))
+        self.assertIsNone(index.find_duplicate(simplyhired("Hardware Engineering Intern")))
+        session.close()
+
+    def test_different_terms_are_not_folded(self):
+        index = NearDuplicateIndex(self.Session)
+        session = self.Session()
+        index.add(session, boeing("Software Engineering Intern - Summer 2025"))
+        session.close()
+        self.assertIsNone(index.find_duplicate(simplyhired("Software Engineering Intern - Fall 2025")))
+        self.assertIsNone(index.find_duplicate(simplyhired("Software Engineering Intern - Summer 2026")))
+        self.assertIsNotNone(index.find_duplicate(simplyhired("Software Engineering Intern - Summer 2025")))
+
+    def test_stored_terms_survive_a_reload(self):
+        original = boeing("Software Engineering Intern - Summer 2025")
+        session = self.Session()
+        insert_jobs(session, [dict(id=original.id, company=original.company, title=original.title,
+                                   location=original.location, url=original.url)])
+        NearDuplicateIndex(self.Session).add(session, original)
+        session.commit()
+        session.close()
+
+        index = NearDuplicateIndex(self.Session)
+        index.load()
+        self.assertIsNone(index.find_duplicate(simplyhired("Software Engineering Intern - Fall 2025")))
+        self.assertIsNotNone(index.find_duplicate(simplyhired("Software Engineering Intern - Summer 2025")))
+
+if __name__ == '__main__':
+    unittest.main()
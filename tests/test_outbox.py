@@ -0,0 +1,206 @@
+import unittest
+import asyncio
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import database
+from src import async_database
+from src.database import OutboxEntry
+from src.outbox import OutboxDispatcher
+from src.slack_bot import SlackBot
+from src.slack_limiter import SlackRateLimiter
+from test_slack_limiter import FakeSlack
+
+NOW = datetime(2025, 6, 1, 12, 0)
+
+def row(n, tags=('software',)):
+    return dict(id=f"job{n}", company="Acme", title=f"Software Intern {n}", location="Remote",
+                url=f"https://acme.com/jobs/{n}", posted_at=NOW, found_at=NOW, tags=list(tags))
+
+class Clock:
+    def __init__(self):
+        self.now = NOW
+
+    def __call__(self):
+        return self.now
+
+class TestOutbox(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'jobs.db')
+        self.Session = database.init_db(self.db_path)
+        self.clock = Clock()
+
+    def tearDown(self):
+        database.dispose_engines()
+        self.tmpdir.cleanup()
+
+    def store(self, rows):
+        session = self.Session()
+        inserted = database.insert_jobs(session, rows)
+        database.enqueue_notifications(session, [r for r in rows if r['id'] in inserted], NOW)
+        session.commit()
+        session.close()
+
+    def outbox(self):
+        session = self.Session()
+        try:
+            return {entry.job_id: entry for entry in session.query(OutboxEntry)}
+        finally:
+            session.close()
+
+    def drain(self, slack, digest=False, times=1, **kwargs):
+        async def run():
+            AsyncSession = await async_database.init_async_db(self.db_path)
+            bot = SlackBot(token="xoxb-test", channel="C1", digest=digest,
+                           limiter=SlackRateLimiter(method_limits={'chat.postMessage': (1000.0, 100)}))
+            bot.client = await slack.start()
+            dispatcher = OutboxDispatcher(AsyncSession, bot, clock=self.clock, **kwargs)
+            try:
+                return [await dispatcher.drain() for _ in range(times)]
+            finally:
+                await slack.stop()
+                await async_database.dispose_async_engines()
+        return asyncio.run(run())
+
+    def posted_jobs(self, slack):
+        return [form.get('text') for method, form in slack.calls
+                if method == 'chat.postMessage' and 'thread_ts' in form]
+
+    def test_queued_in_the_job_transaction(self):
+        session = self.Session()
+        database.insert_jobs(session, [row(1)])
+        database.enqueue_notifications(session, [row(1)], NOW)
+        session.rollback()
+        session.close()
+        self.assertEqual(self.outbox(), {})
+
+        self.store([row(1), row(2)])
+        self.store([row(2)]) # Already stored, so not queued again
+        self.assertEqual(sorted(self.outbox()), ["job1", "job2"])
+
+    def test_drains_once(self):
+        self.store([row(n) for n in range(5)])
+        slack = FakeSlack()
+        self.assertEqual(self.drain(slack, times=2), [5, 0])
+        methods = [method for method, _ in slack.calls]
+        # Parent message, the jobs threaded under it, then the parent's final count
+        self.assertEqual(methods, ['chat.postMessage'] * 6 + ['chat.update'])
+        self.assertEqual(sorted(self.posted_jobs(slack)), [f"New Job: Software Intern {n}" for n in range(5)])
+        self.assertTrue(all(entry.sent_at == NOW for entry in self.outbox().values()))
+
+    def test_digest_channel_gets_one_message(self):
+        self.store([row(n) for n in range(30)])
+        slack = FakeSlack()
+        self.assertEqual(self.drain(slack, digest=True), [30])
+        self.assertEqual(self.posted_jobs(slack), ["30 new jobs"])
+
+    def test_failed_posts_are_retried_later(self):
+        self.store([row(1)])
+        # Parent message goes through, the job itself is refused
+        slack = FakeSlack(script=[(200, {}), (400, {})])
+        self.assertEqual(self.drain(slack, base_backoff=60), [0])
+        entry = self.outbox()["job1"]
+        self.assertEqual((entry.attempts, entry.sent_at), (1, None))
+        self.assertEqual(entry.next_attempt_at, NOW + timedelta(seconds=60))
+
+        # Not due yet
+        slack = FakeSlack()
+        self.assertEqual(self.drain(slack), [0])
+        self.assertEqual(slack.calls, [])
+
+        # Picked up again once due, e.g. by a dispatcher started after a restart
+        self.clock.now = NOW + timedelta(minutes=2)
+        self.assertEqual(self.drain(slack), [1])
+        self.assertEqual(self.posted_jobs(slack), ["New Job: Software Intern 1"])
+
+    def test_gives_up_after_max_attempts(self):
+        self.store([row(1)])
+        # Parent message, refused job, parent update; twice
+        slack = FakeSlack(script=[(200, {}), (400, {}), (200, {})] * 2)
+        self.drain(slack, max_attempts=2, base_backoff=0)
+        self.drain(slack, max_attempts=2, base_backoff=0)
+        entry = self.outbox()["job1"]
+        self.assertEqual(entry.attempts, 2)
+        self.assertIsNotNone(entry.failed_at)
+        calls = len(slack.calls)
+        self.drain(slack, max_attempts=2, base_backoff=0)
+        self.assertEqual(len(slack.calls), calls)
+
+    def test_run_wakes_on_new_rows(self):
+        slack = FakeSlack()
+
+        async def run():
+            AsyncSession = await async_database.init_async_db(self.db_path)
+            bot = SlackBot(token="xoxb-test", channel="C1", digest=False)
+            bot.client = await slack.start()
+            dispatcher = OutboxDispatcher(AsyncSession, bot, poll_interval=60, settle_delay=0.05, clock=self.clock)
+            task = asyncio.create_task(dispatcher.run())
+            try:
+                await asyncio.sleep(0.05)
+                await asyncio.to_thread(self.store, [row(1)])
+                dispatcher.wake()
+                for _ in range(100):
+                    await asyncio.sleep(0.02)
+                    if self.posted_jobs(slack):
+                        break
+            finally:
+                task.cancel()
+                # Let a drain in flight unwind before its database and Slack go away
+                await asyncio.gather(task, return_exceptions=True)
+                await slack.stop()
+                await async_database.dispose_async_engines()
+
+        asyncio.run(run())
+        self.assertEqual(self.posted_jobs(slack), ["New Job: Software Intern 1"])
+
+    def run_cycle(self, slack, digest, pages):
+        """Queue `pages` one after another like a cycle does, with the dispatcher running."""
+        async def run():
+            AsyncSession = await async_database.init_async_db(self.db_path)
+            bot = SlackBot(token="xoxb-test", channel="C1", digest=digest,
+                           limiter=SlackRateLimiter(method_limits={'chat.postMessage': (1000.0, 100),
+                                                                   'chat.update': (1000.0, 100)}))
+            bot.client = await slack.start()
+            dispatcher = OutboxDispatcher(AsyncSession, bot, poll_interval=60, settle_delay=0.01, clock=self.clock)
+            dispatcher.begin_cycle()
+            task = asyncio.create_task(dispatcher.run())
+            try:
+                for page in pages:
+                    await asyncio.to_thread(self.store, page)
+                    dispatcher.wake()
+                    # Long enough for the dispatcher to drain between pages
+                    await asyncio.sleep(0.2)
+                await dispatcher.end_cycle()
+            finally:
+                task.cancel()
+                # Let a drain in flight unwind before its database and Slack go away
+                await asyncio.gather(task, return_exceptions=True)
+                await slack.stop()
+                await async_database.dispose_async_engines()
+
+        asyncio.run(run())
+
+    def test_cycle_posts_under_one_parent(self):
+        slack = FakeSlack()
+        self.run_cycle(slack, False, [[row(1), row(2)], [row(3)], [row(4)]])
+        parents = [form for method, form in slack.calls if method == 'chat.postMessage' and 'thread_ts' not in form]
+        self.assertEqual(len(parents), 1)
+        threads = {form['thread_ts'] for method, form in slack.calls if method == 'chat.postMessage' and 'thread_ts' in form}
+        self.assertEqual(len(threads), 1)
+        updates = [form['text'] for method, form in slack.calls if method == 'chat.update']
+        self.assertEqual(updates[-1], "✅ *4 new jobs* posted.")
+        self.assertEqual(len(self.posted_jobs(slack)), 4)
+
+    def test_cycle_digest_is_packed_once(self):
+        slack = FakeSlack()
+        self.run_cycle(slack, True, [[row(n) for n in range(p * 10, p * 10 + 10)] for p in range(3)])
+        self.assertEqual(self.posted_jobs(slack), ["30 new jobs"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import asyncio
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parse_pool import run_parser, configure_parse_pool, shutdown_parse_pool
+from src.scrapers.boeing_scraper import parse_boeing_results
+from src.scrapers.simplyhired_scraper import parse_simplyhired_results
+
+BOEING_HTML = """
+<section id="search-results-list"><ul>
+  <li><a class="search-results__job-link" href="/job/1">
+      <h2 class="search-results__job-title">Propulsion Engineering Intern</h2></a>
+      <span class="search-results__job-info location">Seattle, WA</span>
+      <span class="search-results__job-info date">01/05/2025</span></li>
+  <li><a class="search-results__job-link" href="/job/2">
+      <h2 class="search-results__job-title">Senior Structures Engineer</h2></a></li>
+</ul></section>
+"""
+
+SIMPLYHIRED_HTML = """
+<ul id="job-list">
+  <li><article><h3><a class="chakra-button" href="/job/abc">Software Engineer Intern</a></h3>
+      <span data-testid="companyName">Acme</span>
+      <span data-testid="searchSerpJobLocation">Remote</span>
+      <time>3 days ago</time></article></li>
+</ul>
+"""
+
+class TestParsePool(unittest.TestCase):
+    def tearDown(self):
+        configure_parse_pool(None)
+
+    def test_pool_matches_inline(self):
+        configure_parse_pool(0)
+        inline_boeing = asyncio.run(run_parser(parse_boeing_results, BOEING_HTML, "Boeing"))
+        inline_sh = asyncio.run(run_parser(parse_simplyhired_results, SIMPLYHIRED_HTML))
+
+        configure_parse_pool(2)
+
+        async def run():
+            return await asyncio.gather(
+                run_parser(parse_boeing_results, BOEING_HTML, "Boeing"),
+                run_parser(parse_simplyhired_results, SIMPLYHIRED_HTML),
+            )
+
+        pooled_boeing, pooled_sh = asyncio.run(run())
+        shutdown_parse_pool()
+
+        self.assertEqual(pooled_boeing, inline_boeing)
+        self.assertEqual(pooled_sh, inline_sh)
+        self.assertEqual([j.title for j in pooled_boeing], ["Propulsion Engineering Intern"])
+        self.assertEqual(pooled_boeing[0].url, "https://jobs.boeing.com/job/1")
+        self.assertEqual(pooled_sh[0].company, "Acme")
+        self.assertEqual(pooled_sh[0].date_posted, "3 days ago")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import asyncio
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.rate_limiter import HostRateLimiter, TokenBucket, looks_blocked
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=3, clock=clock)
+        # Burst goes through immediately
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        # Then callers queue at 2/s
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        clock.now = 10
+        self.assertEqual(bucket.reserve(), 0.0)
+
+class TestHostRateLimiter(unittest.TestCase):
+    def make(self, **kwargs):
+        clock = FakeClock()
+        return HostRateLimiter(rate=1.0, burst=1, jitter=0, clock=clock, **kwargs), clock
+
+    def test_hosts_are_independent(self):
+        limiter, _ = self.make()
+        self.assertEqual(limiter.delay_for("https://a.test/1"), 0.0)
+        self.assertEqual(limiter.delay_for("https://b.test/1"), 0.0)
+        self.assertAlmostEqual(limiter.delay_for("https://a.test/2"), 1.0)
+
+    def test_host_overrides(self):
+        limiter, _ = self.make(host_limits={"fast.test": (10.0, 5)})
+        delays = [limiter.delay_for("https://fast.test/x") for _ in range(6)]
+        self.assertEqual(delays[:5], [0.0] * 5)
+        self.assertAlmostEqual(delays[5], 0.1)
+
+    def test_backoff_on_429_and_recovery(self):
+        limiter, clock = self.make(base_backoff=5)
+        url = "https://a.test/x"
+        limiter.delay_for(url)
+        limiter.report(url, 429)
+        self.assertGreaterEqual(limiter.delay_for(url), 5.0)
+        self.assertEqual(limiter._state("a.test").bucket.rate, 0.5)
+
+        # A second strike doubles the pause
+        clock.now = 100
+        limiter.report(url, 403)
+        self.assertGreaterEqual(limiter.delay_for(url), 10.0)
+
+        # Successes bring the rate back up to the configured one, no further
+        clock.now = 1000
+        for _ in range(20):
+            limiter.report(url, 200)
+        self.assertEqual(limiter._state("a.test").bucket.rate, 1.0)
+
+    def test_retry_after_wins(self):
+        limiter, _ = self.make(base_backoff=5)
+        limiter.report("https://a.test/x", 429, retry_after=42)
+        self.assertGreaterEqual(limiter.delay_for("https://a.test/x"), 42)
+
+    def test_captcha_page_counts_as_block(self):
+        limiter, _ = self.make()
+        limiter.report("https://a.test/x", 200, '<html><title>Just a moment...</title></html>')
+        self.assertGreater(limiter.delay_for("https://a.test/x"), 1.0)
+
+    def test_acquire_sleeps_for_delay(self):
+        slept = []
+
+        async def fake_sleep(seconds):
+            slept.append(seconds)
+
+        limiter = HostRateLimiter(rate=1.0, burst=1, jitter=0, clock=FakeClock(), sleep=fake_sleep)
+
+        async def run():
+            await limiter.acquire("https://a.test/1")
+            await limiter.acquire("https://a.test/2")
+
+        asyncio.run(run())
+        self.assertEqual(len(slept), 1)
+        self.assertAlmostEqual(slept[0], 1.0)
+
+class TestLooksBlocked(unittest.TestCase):
+    def test_markers(self):
+        self.assertTrue(looks_blocked('<div class="g-recaptcha"></div>'))
+        self.assertTrue(looks_blocked('<html><title>Attention Required! | Cloudflare</title>'))
+        self.assertFalse(looks_blocked('<ul id="job-list"></ul>'))
+        self.assertFalse(looks_blocked(None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import subprocess
+import sys
+import os
+
+# Add src to path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from src.scrapers import SCRAPERS, create_scrapers, register_scraper, scraper_names
+
+class TestScraperRegistry(unittest.TestCase):
+    def test_builtin_scrapers_registered(self):
+        self.assertIn("boeing", scraper_names())
+        self.assertIn("simplyhired", scraper_names())
+
+    def test_only_subset(self):
+        scrapers = create_scrapers(None, only=["boeing"], fetcher=object())
+        self.assertEqual([type(s).__name__ for s in scrapers], ["BoeingScraper"])
+
+    def test_registry_options_and_shared_options(self):
+        scrapers = create_scrapers(None, only=["simplyhired"], fetcher=object(), max_age_days=3)
+        self.assertEqual(len(scrapers[0].search_terms), len(SCRAPERS["simplyhired"].options["search_terms"]))
+        self.assertEqual(scrapers[0].max_age_days, 3)
+
+    def test_unknown_name(self):
+        with self.assertRaises(KeyError):
+            create_scrapers(None, only=["monster"])
+
+    def test_register_new_source(self):
+        register_scraper("boeing_interns", "boeing_scraper:BoeingScraper", max_pages=1)
+        try:
+            scrapers = create_scrapers(None, only=["boeing_interns"], fetcher=object())
+            self.assertEqual(scrapers[0].max_pages, 1)
+        finally:
+            del SCRAPERS["boeing_interns"]
+
+    def test_main_import_is_lazy(self):
+        code = (
+            "import sys, src.main;"
+            "heavy = [m for m in ('playwright', 'aiohttp', 'slack_sdk', 'apscheduler', 'bs4',"
+            " 'src.scrapers.boeing_scraper') if m in sys.modules];"
+            "print(','.join(heavy))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "")
+
+    def test_cli_only(self):
+        from src.main import parse_args
+        args = parse_args(["--now", "--only", "Boeing, simplyhired"])
+        self.assertTrue(args.now)
+        self.assertEqual(args.only, ["boeing", "simplyhired"])
+        with self.assertRaises(SystemExit):
+            parse_args(["--only", "monster"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database import (init_db, dispose_engines, existing_job_ids, insert_jobs,
+                          ArchivedJob, Job, JobSignature, JobTag)
+from src.retention import run_retention
+
+NOW = datetime(2025, 6, 1)
+
+def row(n, days_old):
+    return dict(id=f"job{n}", company="Co", title=f"Intern {n}", url=f"https://example.com/{n}",
+                posted_at=NOW - timedelta(days=days_old + 2), found_at=NOW - timedelta(days=days_old),
+                tags=['software', 'finance'])
+
+class TestRetention(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'jobs.db')
+
+    def tearDown(self):
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_archives_old_jobs_and_keeps_them_known(self):
+        Session = init_db(self.db_path)
+        session = Session()
+        insert_jobs(session, [row(n, days_old=n * 10) for n in range(30)]) # 0..290 days old
+        session.add(JobSignature(job_id="job29", signature=[1], created_at=NOW - timedelta(days=290)))
+        session.add(JobSignature(job_id="job0", signature=[1], created_at=NOW))
+        session.commit()
+        session.close()
+
+        self.assertEqual(run_retention(self.db_path, max_age_days=95, now=NOW), 20)
+
+        session = Session()
+        self.assertEqual(session.query(Job).count(), 10)
+        self.assertEqual(session.query(ArchivedJob).count(), 20)
+        self.assertEqual(session.query(JobTag).count(), 20)
+        archived = session.get(ArchivedJob, "job15")
+        self.assertEqual(archived.tags, ['finance', 'software'])
+        self.assertEqual(archived.posted_at, NOW - timedelta(days=152))
+        self.assertEqual([s.job_id for s in session.query(JobSignature)], ["job0"])
+        # Still known to dedupe, so a long-running listing isn't posted again
+        self.assertEqual(existing_job_ids(session, ["job1", "job15", "new"]), {"job1", "job15"})
+        session.close()
+
+        # Nothing left to move
+        self.assertEqual(run_retention(self.db_path, max_age_days=95, now=NOW), 0)
+
+    def test_switches_old_database_to_incremental_vacuum(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE filler (data BLOB)")
+        conn.executemany("INSERT INTO filler VALUES (?)", [(b'x' * 4000,) for _ in range(200)])
+        conn.commit()
+        conn.execute("DELETE FROM filler")
+        conn.commit()
+        self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 0)
+        self.assertGreater(conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+        conn.close()
+
+        run_retention(self.db_path, now=NOW)
+        dispose_engines()
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+        self.assertEqual(conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+        conn.close()
+
+    def test_indexes_added_to_existing_table(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE jobs (id VARCHAR PRIMARY KEY, company VARCHAR NOT NULL, title VARCHAR NOT NULL, "
+                     "location VARCHAR, url VARCHAR UNIQUE NOT NULL, posted_at DATETIME, found_at DATETIME)")
+        conn.close()
+        init_db(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(jobs)")}
+        conn.close()
+        self.assertTrue({'ix_jobs_found_at', 'ix_jobs_posted_at', 'ix_jobs_company'} <= indexes)
+
+    def test_new_database_uses_incremental_vacuum(self):
+        init_db(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+        conn.close()
+
+if __name__ == '__main__':
+    unittest.main()
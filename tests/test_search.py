@@ -0,0 +1,81 @@
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database import init_db, dispose_engines, insert_jobs, Job
+from src.retention import archive_old_jobs
+from src.search import match_expression, search_jobs
+
+NOW = datetime(2025, 6, 1)
+
+def row(job_id, title, company="Boeing", location="Seattle, WA", days_old=0):
+    return dict(id=job_id, title=title, company=company, location=location,
+                url=f"https://example.com/{job_id}", found_at=NOW - timedelta(days=days_old))
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.Session = init_db(os.path.join(self.tmpdir.name, 'jobs.db'))
+        self.session = self.Session()
+        insert_jobs(self.session, [
+            row("fpga", "FPGA Design Intern", days_old=40),
+            row("fpga2", "Embedded Engineering Intern", company="FPGA Corp", days_old=2),
+            row("sw", "Software Engineering Internship", location="Arlington, VA", days_old=1),
+            row("fin", "Finance Intern", company="Goldman Sachs", location="New York, NY"),
+        ])
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def ids(self, query, **kwargs):
+        return [hit.id for hit in search_jobs(self.session, query, **kwargs).hits]
+
+    def test_ranked_matches(self):
+        # Title matches rank above company matches
+        self.assertEqual(self.ids("fpga"), ["fpga", "fpga2"])
+        # Prefix on the last word: "intern" also finds "Internship"; stemming: "designs" finds "Design"
+        self.assertEqual(set(self.ids("intern")), {"fpga", "fpga2", "sw", "fin"})
+        self.assertEqual(self.ids("designs intern"), ["fpga"])
+        self.assertEqual(self.ids("new york"), ["fin"])
+        # Last word is a prefix
+        self.assertEqual(self.ids("softw"), ["sw"])
+        self.assertEqual(self.ids("arlington software"), ["sw"])
+
+    def test_pagination_and_since(self):
+        first = search_jobs(self.session, "intern", page=1, per_page=3)
+        second = search_jobs(self.session, "intern", page=2, per_page=3)
+        self.assertEqual((first.total, first.pages), (4, 2))
+        self.assertEqual(len(first.hits), 3)
+        self.assertEqual(len(second.hits), 1)
+        self.assertFalse({hit.id for hit in first.hits} & {hit.id for hit in second.hits})
+        self.assertEqual(self.ids("fpga", since=NOW - timedelta(days=30)), ["fpga2"])
+        self.assertIsInstance(first.hits[0].found_at, datetime)
+
+    def test_kept_in_sync(self):
+        # ORM insert, update and delete (retention) all go through the triggers
+        self.session.add(Job(id="orm", title="Propulsion Intern", company="SpaceX", url="https://example.com/orm"))
+        self.session.commit()
+        self.assertEqual(self.ids("propulsion"), ["orm"])
+        self.session.get(Job, "orm").title = "Avionics Intern"
+        self.session.commit()
+        self.assertEqual(self.ids("propulsion"), [])
+        self.assertEqual(self.ids("avionics"), ["orm"])
+        archive_old_jobs(self.session, NOW - timedelta(days=30))
+        self.assertEqual(self.ids("fpga"), ["fpga2"])
+
+    def test_user_input_is_escaped(self):
+        self.assertIsNone(match_expression("  ?! "))
+        self.assertEqual(match_expression('title:"fpga" OR NEAR(x'), '"title" "fpga" "or" "near" "x"*')
+        self.assertEqual(search_jobs(self.session, '"').total, 0)
+        self.assertEqual(self.ids('fpga" OR "'), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import asyncio
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database import init_db, insert_jobs
+from src.parse_pool import configure_parse_pool
+from src.scraper_engine import JobData, make_job_id
+from src.scrapers.boeing_scraper import BoeingScraper, parse_boeing_page
+from src.scrapers.greenhouse_scraper import GreenhouseScraper
+from src.seen_filter import BloomSeenFilter, ExactSeenFilter, load_seen_filter
+from src.watermarks import WatermarkStore
+from test_streaming import FakeFetcher, boeing_page
+
+BASE = "https://jobs.boeing.com/search-jobs"
+
+def boeing_id(i):
+    return make_job_id("Boeing", url=f"https://jobs.boeing.com/job/{i}")
+
+class TestBloomSeenFilter(unittest.TestCase):
+    def test_no_false_negatives_and_few_false_positives(self):
+        seen = BloomSeenFilter(10000, error_rate=1e-3)
+        ids = [f"job-{i}" for i in range(10000)]
+        seen.update(ids)
+        self.assertTrue(all(job_id in seen for job_id in ids))
+        false_positives = sum(f"other-{i}" in seen for i in range(20000))
+        self.assertLess(false_positives, 20000 * 5e-3)
+        self.assertEqual(len(seen), 10000)
+
+    def test_make_job_id_matches_job_data(self):
+        job = JobData(title="Intern", company="Acme", url="https://acme.com/1")
+        self.assertEqual(make_job_id("Acme", url="https://acme.com/1"), job.id)
+        job.job_id = "42"
+        self.assertEqual(make_job_id("Acme", "42", "https://acme.com/1"), job.id)
+
+class TestLoadSeenFilter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.Session = init_db(os.path.join(self.tmpdir.name, 'jobs.db'))
+        session = self.Session()
+        now = datetime.utcnow()
+        insert_jobs(session, [dict(id=boeing_id(i), company="Boeing", title=f"Intern {i}",
+                                   url=f"https://jobs.boeing.com/job/{i}", posted_at=now, found_at=now)
+                              for i in range(50)])
+        session.commit()
+        session.close()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_exact_for_small_histories(self):
+        seen = load_seen_filter(self.Session)
+        self.assertIsInstance(seen, ExactSeenFilter)
+        self.assertEqual(len(seen), 50)
+        self.assertIn(boeing_id(7), seen)
+
+    def test_bloom_beyond_the_limit(self):
+        seen = load_seen_filter(self.Session, exact_limit=10)
+        self.assertIsInstance(seen, BloomSeenFilter)
+        self.assertTrue(all(boeing_id(i) in seen for i in range(50)))
+
+class TestParsersSkipSeen(unittest.TestCase):
+    def setUp(self):
+        configure_parse_pool(0)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.Session = init_db(os.path.join(self.tmpdir.name, 'jobs.db'))
+
+    def tearDown(self):
+        configure_parse_pool(None)
+        self.tmpdir.cleanup()
+
+    def test_known_jobs_are_not_built(self):
+        seen = ExactSeenFilter([boeing_id(1), boeing_id(3)])
+        page = parse_boeing_page(boeing_page([1, 2, 3, 4]), seen=seen)
+        self.assertEqual([job.url for job in page.jobs],
+                         ["https://jobs.boeing.com/job/2", "https://jobs.boeing.com/job/4"])
+        self.assertEqual(page.known_ids, [boeing_id(1), boeing_id(3)])
+
+    def test_fully_seen_page_still_stops_pagination(self):
+        pages = {
+            BASE: boeing_page([1, 2], next_href="/search-jobs?p=2"),
+            f"{BASE}?p=2": boeing_page([3]),
+        }
+        store = WatermarkStore(self.Session)
+        store.observe(f"Boeing:{BASE}", [boeing_id(i) for i in (1, 2, 3)])
+        store.commit()
+        store.load()
+        fetcher = FakeFetcher(pages)
+        scraper = BoeingScraper(None, fetcher=fetcher, watermarks=store,
+                                seen=ExactSeenFilter(boeing_id(i) for i in (1, 2, 3)))
+        scraper.start_urls = [BASE]
+
+        async def run():
+            return [jobs async for jobs in scraper.iter_pages()]
+
+        self.assertEqual(asyncio.run(run()), [[]])
+        self.assertEqual(fetcher.requested, [BASE])
+
+    def test_filter_is_not_sent_to_parse_workers(self):
+        class LocalOnlyFilter(ExactSeenFilter):
+            def __reduce__(self):
+                raise AssertionError("seen filter pickled for a parse worker")
+
+        configure_parse_pool(1)
+        fetcher = FakeFetcher({BASE: boeing_page([1, 2, 3])})
+        scraper = BoeingScraper(None, fetcher=fetcher, seen=LocalOnlyFilter([boeing_id(2)]))
+        scraper.start_urls = [BASE]
+
+        async def run():
+            return [jobs async for jobs in scraper.iter_pages()]
+
+        [jobs] = asyncio.run(run())
+        self.assertEqual([job.url for job in jobs],
+                         ["https://jobs.boeing.com/job/1", "https://jobs.boeing.com/job/3"])
+
+    def test_board_scraper_skips_seen(self):
+        scraper = GreenhouseScraper(None, company_names={'acme': 'Acme'},
+                                    seen=ExactSeenFilter([make_job_id('Acme', '1')]))
+        payload = {'jobs': [
+            {'id': 1, 'title': 'Software Intern', 'absolute_url': 'https://acme.com/1'},
+            {'id': 2, 'title': 'Hardware Intern', 'absolute_url': 'https://acme.com/2'},
+        ]}
+        self.assertEqual([job.job_id for job in scraper.parse_board('acme', payload)], ['2'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import asyncio
+import json
+import sys
+import os
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.scraper_engine import JobData
+from src.slack_bot import SlackBot, MAX_BLOCKS, MAX_SECTION_CHARS, block_chars, pack_digest
+from test_slack_limiter import FakeSlack
+
+def job(n, title=None):
+    return JobData(title=title or f"Software Engineering Intern {n}", company="Acme",
+                   url=f"https://acme.com/jobs/{n}", location="Remote")
+
+def mentions_in(blocks):
+    return [part[2:-1] for block in blocks if block["text"]["text"].startswith("*Heads up")
+            for part in block["text"]["text"].split() if part.startswith("<@")]
+
+class TestPackDigest(unittest.TestCase):
+    def test_fills_messages_up_to_the_block_limit(self):
+        messages = pack_digest([(job(n), ["software"], []) for n in range(120)])
+        self.assertEqual([len(m) for m in messages], [MAX_BLOCKS, MAX_BLOCKS, 1 + 120 - 2 * (MAX_BLOCKS - 1)])
+        self.assertEqual(messages[0][0]["text"]["text"], f"*{MAX_BLOCKS - 1} new jobs*")
+        # Order is kept across messages
+        links = [b["text"]["text"] for m in messages for b in m[1:]]
+        self.assertIn("acme.com/jobs/0|", links[0])
+        self.assertIn("acme.com/jobs/119|", links[-1])
+
+    def test_splits_at_the_character_budget(self):
+        entries = [(job(n, "Intern " + "x" * 400), ["software"], []) for n in range(40)]
+        messages = pack_digest(entries, max_chars=4000)
+        self.assertGreater(len(messages), 1)
+        self.assertTrue(all(block_chars(m) <= 4000 for m in messages))
+        self.assertEqual(sum(len(m) - 1 for m in messages), 40)
+
+    def test_mentions_grouped_per_message(self):
+        entries = [(job(n), ["software"], ["U1", f"U{n % 3 + 2}"]) for n in range(60)]
+        first, second = pack_digest(entries)
+        self.assertEqual(mentions_in(first), ["U1", "U2", "U3", "U4"])
+        self.assertEqual(len(first), MAX_BLOCKS)
+        self.assertEqual(sorted(mentions_in(second)), ["U1", "U2", "U3", "U4"])
+
+    def test_many_mentions_are_split_into_sections(self):
+        users = [f"U{n:010d}" for n in range(400)]
+        [message] = pack_digest([(job(1), ["software"], users)])
+        self.assertTrue(all(len(b["text"]["text"]) <= MAX_SECTION_CHARS for b in message))
+        self.assertEqual(sorted(mentions_in(message)), users)
+
+    def test_markup_in_titles_is_escaped(self):
+        [message] = pack_digest([(job(1, "R&D <Intern>"), [], [])])
+        self.assertIn("R&amp;D &lt;Intern&gt;", message[1]["text"]["text"])
+
+class TestSlackBotDigest(unittest.TestCase):
+    def test_digest_channel_selection(self):
+        with mock.patch.dict(os.environ, {"SLACK_DIGEST_CHANNELS": "C1, C3"}):
+            self.assertTrue(SlackBot(channel="C1").digest)
+            self.assertFalse(SlackBot(channel="C2").digest)
+            self.assertFalse(SlackBot(channel="C1", digest=False).digest)
+        with mock.patch.dict(os.environ, {"SLACK_DIGEST_CHANNELS": "*"}):
+            self.assertTrue(SlackBot(channel="C9").digest)
+
+    def test_post_digest_sends_few_messages(self):
+        slack = FakeSlack()
+
+        class Subscriptions:
+            async def get_subscribers_for_tags(self, tags):
+                return ["U1"] if "software" in tags else ["U2"]
+
+        async def run():
+            bot = SlackBot(token="xoxb-test", channel="C1", subscription_manager=Subscriptions(), digest=True)
+            bot.client = await slack.start()
+            try:
+                jobs = [(job(n), ["software"] if n % 2 else ["finance"]) for n in range(100)]
+                return await bot.post_digest(jobs, thread_ts="1.0001")
+            finally:
+                await slack.stop()
+
+        self.assertEqual(asyncio.run(run()), 3)
+        self.assertEqual(len(slack.calls), 3)
+        for _, form in slack.calls:
+            blocks = form["blocks"]
+            if isinstance(blocks, str):
+                blocks = json.loads(blocks)
+            self.assertLessEqual(len(blocks), MAX_BLOCKS)
+            self.assertEqual(form["thread_ts"], "1.0001")
+            self.assertEqual(sorted(mentions_in(blocks)), ["U1", "U2"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import asyncio
+import sys
+import os
+
+from aiohttp import web
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.scraper_engine import JobData
+from src.slack_bot import SlackBot
+from src.slack_limiter import SlackRateLimiter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+class FakeSlack:
+    """Local stand-in for the Slack Web API. `script` holds (status, extra headers) to answer with first."""
+    def __init__(self, script=None, latency=0.0):
+        self.script = list(script or [])
+        self.latency = latency
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def handle(self, request):
+        form = dict(await request.post()) if request.content_type != 'application/json' else await request.json()
+        self.calls.append((request.match_info['method'], form))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        status, headers = self.script.pop(0) if self.script else (200, {})
+        if status == 200:
+            return web.json_response({"ok": True, "ts": f"{len(self.calls)}.0001"})
+        error = "ratelimited" if status == 429 else "internal_error"
+        return web.json_response({"ok": False, "error": error}, status=status, headers=headers)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/api/{method}', self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return AsyncWebClient(token="xoxb-test", base_url=f'http://127.0.0.1:{port}/api/')
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+class TestSlackRateLimiter(unittest.TestCase):
+    def post(self, slack, limiter, channels, text="hi"):
+        async def run():
+            client = await slack.start()
+            try:
+                return await asyncio.gather(*[
+                    limiter.call('chat.postMessage', channel, client.chat_postMessage, channel=channel, text=text)
+                    for channel in channels
+                ], return_exceptions=True)
+            finally:
+                await slack.stop()
+        return asyncio.run(run())
+
+    def test_retry_after_is_honoured(self):
+        clock = FakeClock()
+        slack = FakeSlack(script=[(429, {'Retry-After': '7'})])
+        limiter = SlackRateLimiter(clock=clock, sleep=clock.sleep)
+        [response] = self.post(slack, limiter, ["C1"])
+        self.assertTrue(response["ok"])
+        self.assertEqual(len(slack.calls), 2)
+        self.assertEqual(clock.slept, [7.0])
+
+    def test_server_errors_back_off_then_give_up(self):
+        clock = FakeClock()
+        slack = FakeSlack(script=[(500, {})] * 3)
+        limiter = SlackRateLimiter(max_retries=2, base_backoff=1.0, clock=clock, sleep=clock.sleep)
+        [error] = self.post(slack, limiter, ["C1"])
+        self.assertIsInstance(error, SlackApiError)
+        self.assertEqual(len(slack.calls), 3)
+        self.assertEqual(len(clock.slept), 2)
+        self.assertLess(clock.slept[0], clock.slept[1] + 1e-9)
+
+    def test_other_errors_are_not_retried(self):
+        slack = FakeSlack(script=[(400, {})])
+        [error] = self.post(slack, SlackRateLimiter(), ["C1"])
+        self.assertIsInstance(error, SlackApiError)
+        self.assertEqual(len(slack.calls), 1)
+
+    def test_bursts_go_out_concurrently_per_channel(self):
+        slack = FakeSlack(latency=0.05)
+        limiter = SlackRateLimiter(method_limits={'chat.postMessage': (50.0, 4)})
+        responses = self.post(slack, limiter, ["C1"] * 4 + ["C2"] * 4 + ["C1"] * 2)
+        self.assertTrue(all(r["ok"] for r in responses))
+        self.assertEqual(len(slack.calls), 10)
+        # Two full bursts in flight at once; the extra C1 posts queue behind C1's burst
+        self.assertGreaterEqual(slack.peak, 8)
+        self.assertEqual(limiter.delay_for('chat.postMessage', 'C3'), 0.0)
+
+    def test_pause_spaces_out_waiting_callers(self):
+        clock = FakeClock()
+        limiter = SlackRateLimiter(method_limits={'chat.postMessage': (1.0, 4)}, clock=clock)
+        limiter.pause('chat.postMessage', 'C1', 5)
+        delays = [limiter.delay_for('chat.postMessage', 'C1') for _ in range(3)]
+        self.assertEqual(delays, [5.0, 6.0, 7.0])
+        # Other channels are unaffected
+        self.assertEqual(limiter.delay_for('chat.postMessage', 'C2'), 0.0)
+
+class TestSlackBotPosting(unittest.TestCase):
+    def test_post_job_goes_through_the_limiter(self):
+        clock = FakeClock()
+        slack = FakeSlack(script=[(429, {'Retry-After': '2'})])
+
+        async def run():
+            bot = SlackBot(token="xoxb-test", channel="C1",
+                           limiter=SlackRateLimiter(clock=clock, sleep=clock.sleep))
+            bot.client = await slack.start()
+            try:
+                job = JobData(title="Software Intern", company="Acme", url="https://acme.com/1", location="Remote")
+                await bot.post_job(job, ["software"], thread_ts="1.0001")
+                await bot.update_message("1.0001", "done")
+            finally:
+                await slack.stop()
+
+        asyncio.run(run())
+        methods = [method for method, _ in slack.calls]
+        self.assertEqual(methods, ['chat.postMessage', 'chat.postMessage', 'chat.update'])
+        self.assertEqual(clock.slept, [2.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+import asyncio
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parse_pool import configure_parse_pool
+from src.scraper_engine import BaseScraper, JobData
+from src.scrapers.boeing_scraper import BoeingScraper
+
+def boeing_page(job_ids, next_href=None, posted=None):
+    posted = posted or datetime.utcnow().strftime('%m/%d/%Y')
+    items = "".join(
+        f'<li><a class="search-results__job-link" href="/job/{i}">'
+        f'<h2 class="search-results__job-title">Engineering Intern {i}</h2></a>'
+        f'<span class="search-results__job-info date">{posted}</span></li>'
+        for i in job_ids
+    )
+    pagination = f'<nav class="pagination"><a class="next" href="{next_href}">Next</a></nav>' if next_href else ''
+    return f'<section id="search-results-list"><ul>{items}</ul></section>{pagination}'
+
+class FakeFetcher:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    async def fetch(self, url, wait_selector, **kwargs):
+        self.requested.append(url)
+        return self.pages.get(url)
+
+class ListOnlyScraper(BaseScraper):
+    async def scrape(self):
+        return [JobData(title="A Intern", company="X", url="https://x/1")]
+
+class StreamingScraper(BaseScraper):
+    async def iter_pages(self):
+        yield [JobData(title="A Intern", company="X", url="https://x/1")]
+        yield [JobData(title="B Intern", company="X", url="https://x/2")]
+
+class TestScraperAdapters(unittest.TestCase):
+    def test_list_scraper_streams_one_page(self):
+        scraper = ListOnlyScraper("X", None)
+
+        async def run():
+            return [jobs async for jobs in scraper.iter_pages()]
+
+        self.assertEqual(len(asyncio.run(run())), 1)
+
+    def test_streaming_scraper_collects_list(self):
+        scraper = StreamingScraper("X", None)
+        jobs = asyncio.run(scraper.scrape())
+        self.assertEqual([j.title for j in jobs], ["A Intern", "B Intern"])
+
+        async def run():
+            return [job.title async for job in scraper.iter_jobs()]
+
+        self.assertEqual(asyncio.run(run()), ["A Intern", "B Intern"])
+
+    def test_neither_implemented(self):
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(BaseScraper("X", None).scrape())
+
+class TestBoeingPagination(unittest.TestCase):
+    def setUp(self):
+        configure_parse_pool(0)
+
+    def tearDown(self):
+        configure_parse_pool(None)
+
+    def make_scraper(self, pages, **kwargs):
+        fetcher = FakeFetcher(pages)
+        scraper = BoeingScraper(None, fetcher=fetcher, **kwargs)
+        scraper.start_urls = ["https://jobs.boeing.com/search-jobs"]
+        return scraper, fetcher
+
+    def collect_pages(self, scraper):
+        async def run():
+            return [[job.url for job in jobs] async for jobs in scraper.iter_pages()]
+        return asyncio.run(run())
+
+    def test_follows_next_links(self):
+        base = "https://jobs.boeing.com/search-jobs"
+        scraper, fetcher = self.make_scraper({
+            base: boeing_page([1, 2], next_href="/search-jobs?p=2"),
+            f"{base}?p=2": boeing_page([3], next_href="/search-jobs?p=3"),
+            f"{base}?p=3": boeing_page([4]),
+        })
+        pages = self.collect_pages(scraper)
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(pages[2], ["https://jobs.boeing.com/job/4"])
+
+    def test_page_budget(self):
+        base = "https://jobs.boeing.com/search-jobs"
+        scraper, fetcher = self.make_scraper({
+            base: boeing_page([1], next_href="/search-jobs?p=2"),
+            f"{base}?p=2": boeing_page([2], next_href="/search-jobs?p=3"),
+            f"{base}?p=3": boeing_page([3]),
+        }, max_pages=2)
+        self.assertEqual(len(self.collect_pages(scraper)), 2)
+        self.assertEqual(len(fetcher.requested), 2)
+
+    def test_age_budget_stops_pagination(self):
+        base = "https://jobs.boeing.com/search-jobs"
+        old = (datetime.utcnow() - timedelta(days=30)).strftime('%m/%d/%Y')
+        scraper, fetcher = self.make_scraper({
+            base: boeing_page([1], next_href="/search-jobs?p=2", posted=old),
+            f"{base}?p=2": boeing_page([2]),
+        }, max_age_days=7)
+        self.assertEqual(len(self.collect_pages(scraper)), 1)
+
+    def test_next_link_loop_is_not_followed(self):
+        base = "https://jobs.boeing.com/search-jobs"
+        scraper, fetcher = self.make_scraper({
+            base: boeing_page([1], next_href="/search-jobs"),
+        }, max_pages=10)
+        self.assertEqual(len(self.collect_pages(scraper)), 1)
+
+if __name__ == '__main__':
+    unittest.main()
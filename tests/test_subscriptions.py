@@ -0,0 +1,135 @@
+import unittest
+import asyncio
+import sys
+import os
+import tempfile
+
+from sqlalchemy import event
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import database
+from src import async_database
+from src.subscription_manager import SubscriptionManager, AsyncSubscriptionManager, SubscriberIndex
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestSubscriberIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'jobs.db')
+        self.Session = database.init_db(self.path)
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        database.dispose_engines()
+        self.tmpdir.cleanup()
+
+    def manager(self):
+        manager = SubscriptionManager(self.Session)
+        manager.index = SubscriberIndex(check_interval=5.0, clock=self.clock)
+        return manager
+
+    def count_queries(self):
+        statements = []
+        event.listen(database.get_engine(self.path), 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        return statements
+
+    def test_own_writes_update_in_place(self):
+        manager = self.manager()
+        manager.add_subscription("U1", "software")
+        manager.add_subscription("U2", "finance")
+        self.assertEqual(manager.get_subscribers_for_tags(["Software", "finance"]), ["U1", "U2"])
+
+        statements = self.count_queries()
+        manager.add_subscription("U3", "software")
+        manager.remove_subscription("U1", "software")
+        self.assertEqual(manager.get_subscribers_for_tags(["software"]), ["U3"])
+        # Nothing reloaded: only the writes themselves hit the database
+        self.assertFalse(any(s.startswith("SELECT subscriptions.user_id, subscriptions.interest")
+                             for s in statements))
+
+    def test_lookups_between_checks_skip_the_database(self):
+        manager = self.manager()
+        manager.add_subscription("U1", "software")
+        manager.get_subscribers_for_tags(["software"])
+        statements = self.count_queries()
+        for _ in range(100):
+            manager.get_subscribers_for_tags(["software", "finance"])
+        self.assertEqual(statements, [])
+
+    def test_other_process_writes_are_picked_up(self):
+        manager = self.manager()
+        manager.add_subscription("U1", "software")
+        self.assertEqual(manager.get_subscribers_for_tags(["software"]), ["U1"])
+
+        # e.g. the Slack server, with its own index
+        SubscriptionManager(self.Session).add_subscription("U9", "software")
+        self.assertEqual(manager.get_subscribers_for_tags(["software"]), ["U1"])
+        self.clock.now += 5.0
+        self.assertEqual(manager.get_subscribers_for_tags(["software"]), ["U1", "U9"])
+
+    def test_own_write_after_foreign_write_reloads(self):
+        manager = self.manager()
+        manager.get_subscribers_for_tags(["software"])
+        SubscriptionManager(self.Session).add_subscription("U9", "software")
+        # Version jumps by two, so the in-place update can't be trusted
+        manager.add_subscription("U1", "software")
+        self.assertEqual(manager.get_subscribers_for_tags(["software"]), ["U1", "U9"])
+
+    def test_stale_index_keeps_serving_until_reloaded(self):
+        manager = self.manager()
+        manager.add_subscription("U1", "software")
+        manager.get_subscribers_for_tags(["software"])
+        # A lookup already past its refresh must not trip over the version jump
+        manager.index.applied(manager.index.version + 2, "U9", "software", True)
+        self.assertEqual(manager.index.subscribers(["software"]), ["U1"])
+        self.assertTrue(manager.index.due())
+        SubscriptionManager(self.Session).add_subscription("U9", "software")
+        self.assertEqual(manager.get_subscribers_for_tags(["software"]), ["U1", "U9"])
+
+    def test_concurrent_async_lookups_reload_once(self):
+        SubscriptionManager(self.Session).add_subscription("U1", "software")
+
+        async def run():
+            AsyncSession = await async_database.init_async_db(self.path)
+            manager = AsyncSubscriptionManager(AsyncSession)
+            manager.index = SubscriberIndex(check_interval=5.0, clock=self.clock)
+            refreshes = []
+            refresh = manager.index.refresh
+            manager.index.refresh = lambda session: refreshes.append(1) or refresh(session)
+            try:
+                results = await asyncio.gather(*[manager.get_subscribers_for_tags(["software"]) for _ in range(200)])
+            finally:
+                await async_database.dispose_async_engines()
+            return results, len(refreshes)
+
+        results, refreshes = asyncio.run(run())
+        self.assertEqual(refreshes, 1)
+        self.assertTrue(all(users == ["U1"] for users in results))
+
+    def test_async_manager_shares_the_index_logic(self):
+        SubscriptionManager(self.Session).add_subscription("U1", "software")
+
+        async def run():
+            AsyncSession = await async_database.init_async_db(self.path)
+            manager = AsyncSubscriptionManager(AsyncSession)
+            manager.index = SubscriberIndex(check_interval=5.0, clock=self.clock)
+            first = await manager.get_subscribers_for_tags(["software"])
+            await manager.add_subscription("U2", "software")
+            await manager.remove_subscription("U1", "software")
+            second = await manager.get_subscribers_for_tags(["software"])
+            await async_database.dispose_async_engines()
+            return first, second
+
+        self.assertEqual(asyncio.run(run()), (["U1"], ["U2"]))
+
+if __name__ == '__main__':
+    unittest.main()
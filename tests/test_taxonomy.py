@@ -0,0 +1,82 @@
+import unittest
+import json
+import sys
+import os
+import tempfile
+
+# Add parent dir to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.taxonomy import Taxonomy, TaxonomyIndex, DEFAULT_TAXONOMY_PATH
+
+def taxonomy_data(terms):
+    return {
+        "fallback": "other",
+        "categories": {"rockets": {"description": "Things that fly.", "terms": terms}},
+        "fallback_description": "Everything else.",
+        "relevance": {"include": ["intern"], "exclude": ["senior"]}
+    }
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+class TestTaxonomy(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'taxonomy.json')
+        self.clock = FakeClock()
+        self.write(["rocket"], mtime=1000)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, terms, mtime, raw=None):
+        with open(self.path, 'w') as f:
+            f.write(raw if raw is not None else json.dumps(taxonomy_data(terms)))
+        os.utime(self.path, (mtime, mtime))
+
+    def test_default_file_loads(self):
+        taxonomy = Taxonomy.from_file(DEFAULT_TAXONOMY_PATH)
+        self.assertEqual(taxonomy.categories()[-1], 'other')
+        self.assertEqual(set(taxonomy.terms), set(taxonomy.categories()) - {'other'})
+        self.assertTrue(all(taxonomy.descriptions.values()))
+        self.assertEqual(taxonomy.classifier.classify("Device Driver Intern"), ['other'])
+
+    def test_reloads_on_mtime_change(self):
+        index = TaxonomyIndex(self.path, check_interval=5, clock=self.clock)
+        first = index.current()
+        self.assertEqual(first.classifier.classify("Rocket Intern"), ['rockets'])
+        self.assertEqual(first.descriptions, {'rockets': 'Things that fly.', 'other': 'Everything else.'})
+
+        self.write(["satellite"], mtime=2000)
+        # Not re-checked before the interval is up
+        self.assertIs(index.current(), first)
+        self.clock.now = 5
+        second = index.current()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.classifier.classify("Satellite Intern"), ['rockets'])
+        # The old version is untouched for anyone still holding it
+        self.assertEqual(first.classifier.classify("Satellite Intern"), ['other'])
+
+        self.clock.now = 10
+        self.assertIs(index.current(), second)
+
+    def test_broken_file_keeps_previous_version(self):
+        index = TaxonomyIndex(self.path, check_interval=0, clock=self.clock)
+        first = index.current()
+        self.write(None, mtime=2000, raw="{not json")
+        with self.assertLogs("Taxonomy", level="ERROR"):
+            self.assertIs(index.current(), first)
+        self.assertIs(index.current(), first)
+
+    def test_relevance(self):
+        taxonomy = Taxonomy(taxonomy_data(["rocket"]))
+        self.assertTrue(taxonomy.is_relevant("Rocket Intern"))
+        self.assertFalse(taxonomy.is_relevant("Senior Rocket Intern"))
+        self.assertFalse(taxonomy.is_relevant("Rocket Engineer"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import asyncio
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database import init_db
+from src.parse_pool import configure_parse_pool
+from src.scrapers.boeing_scraper import BoeingScraper
+from src.watermarks import WatermarkStore
+from test_streaming import FakeFetcher, boeing_page
+
+BASE = "https://jobs.boeing.com/search-jobs"
+
+class TestWatermarks(unittest.TestCase):
+    def setUp(self):
+        configure_parse_pool(0)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.Session = init_db(os.path.join(self.tmpdir.name, 'jobs.db'))
+
+    def tearDown(self):
+        configure_parse_pool(None)
+        self.tmpdir.cleanup()
+
+    def crawl(self, pages):
+        store = WatermarkStore(self.Session)
+        store.load()
+        fetcher = FakeFetcher(pages)
+        scraper = BoeingScraper(None, fetcher=fetcher, watermarks=store, max_pages=10)
+        scraper.start_urls = [BASE]
+
+        async def run():
+            return [jobs async for jobs in scraper.iter_pages()]
+
+        result = asyncio.run(run())
+        store.commit()
+        return result, fetcher.requested
+
+    def test_known_page_stops_pagination(self):
+        pages = {
+            BASE: boeing_page([1, 2], next_href="/search-jobs?p=2"),
+            f"{BASE}?p=2": boeing_page([3, 4], next_href="/search-jobs?p=3"),
+            f"{BASE}?p=3": boeing_page([5]),
+        }
+        # First crawl has no watermark and walks every page
+        _, requested = self.crawl(pages)
+        self.assertEqual(len(requested), 3)
+
+        # Nothing new: the first page is all known, so stop right there
+        _, requested = self.crawl(pages)
+        self.assertEqual(requested, [BASE])
+
+        # One new job on top: fetch page 1, then page 2 which is all known
+        pages[BASE] = boeing_page([0, 1], next_href="/search-jobs?p=2")
+        result, requested = self.crawl(pages)
+        self.assertEqual(len(requested), 2)
+        self.assertIn("https://jobs.boeing.com/job/0", [job.url for job in result[0]])
+
+    def test_uncommitted_crawl_does_not_move_watermark(self):
+        store = WatermarkStore(self.Session)
+        store.load()
+        store.observe("Boeing:x", ["a", "b"])
+        # No commit, e.g. the cycle crashed before storing the jobs
+
+        fresh = WatermarkStore(self.Session)
+        fresh.load()
+        self.assertFalse(fresh.all_known("Boeing:x", ["a"]))
+
+    def test_watermark_is_capped_newest_first(self):
+        store = WatermarkStore(self.Session, keep=3)
+        store.load()
+        store.observe("k", ["a", "b"])
+        store.commit()
+        store.observe("k", ["c", "d"])
+        store.commit()
+
+        fresh = WatermarkStore(self.Session, keep=3)
+        fresh.load()
+        self.assertTrue(fresh.all_known("k", ["c", "d", "a"]))
+        self.assertFalse(fresh.all_known("k", ["b"]))
+
+    def test_empty_page_is_not_all_known(self):
+        store = WatermarkStore(self.Session)
+        store.load()
+        self.assertFalse(store.all_known("k", []))
+
+if __name__ == '__main__':
+    unittest.main()